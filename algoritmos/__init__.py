@@ -1,10 +1,112 @@
 """
 Módulo de algoritmos de ordenamiento
-Contiene implementaciones de Bubble Sort, Quick Sort y Merge Sort
+Contiene implementaciones de Bubble Sort, Shell Sort, Comb Sort, Quick Sort (de uno y
+dos pivotes) y Merge Sort (en memoria, externo, con memoria acotada e híbridos con corte a Insertion Sort),
+además de selección por partición (quickselect, mediana y top-k) y contenedores
+ordenados que reciben los datos por lotes
 """
 
-from .bubble_sort import bubble_sort
-from .quick_sort import quick_sort
-from .merge_sort import merge_sort
+from .bubble_sort import bubble_sort, bubble_sort_in_place
+from .brechas import (shell_sort, shell_sort_ciura, shell_sort_tokuda, shell_sort_sedgewick,
+                      comb_sort, shell_sort_in_place, shell_sort_ciura_in_place,
+                      shell_sort_tokuda_in_place, shell_sort_sedgewick_in_place,
+                      comb_sort_in_place, SECUENCIAS)
+from .quick_sort import quick_sort, quick_sort_in_place, particionar
+from .merge_sort import merge_sort, merge_sort_in_place, mezclar
+from .merge_sort_acotado import merge_sort_acotado, merge_sort_acotado_in_place
+from .merge_sort_externo import (merge_sort_externo, merge_sort_externo_arreglo,
+                                 merge_sort_externo_arreglo_in_place)
+from .quick_sort_dual import quick_sort_dual, quick_sort_dual_in_place
+from .insercion import insertion_sort_rango
+from .hibridos import (quick_sort_hibrido, merge_sort_hibrido,
+                       quick_sort_hibrido_in_place, merge_sort_hibrido_in_place)
+from .seleccion import quickselect, mediana, top_k
+from .incremental import (ReordenamientoCompleto, ListaMezclaPorLotes, ListaBloquesOrdenados,
+                          CONTENEDORES_INCREMENTALES)
+from .contadores import ContadorOperaciones, METRICAS, acepta_contador
 
-__all__ = ['bubble_sort', 'quick_sort', 'merge_sort']
+# Registro de algoritmos por nombre (usado por barridos, procesos aislados, etc.)
+ALGORITMOS = {
+    'Bubble Sort': bubble_sort,
+    'Comb Sort': comb_sort,
+    'Shell Sort (Ciura)': shell_sort_ciura,
+    'Shell Sort (Tokuda)': shell_sort_tokuda,
+    'Shell Sort (Sedgewick)': shell_sort_sedgewick,
+    'Quick Sort': quick_sort,
+    'Merge Sort': merge_sort,
+    'Quick Sort Doble Pivote': quick_sort_dual,
+    'Merge Sort Memoria Acotada': merge_sort_acotado,
+    'Merge Sort Externo': merge_sort_externo_arreglo,
+    'Quick Sort Híbrido': quick_sort_hibrido,
+    'Merge Sort Híbrido': merge_sort_hibrido
+}
+
+# Versión en el lugar de cada algoritmo: ordena el arreglo recibido y
+# retorna solo (comparaciones, operaciones); la usa la medición para no
+# copiar la entrada dentro del intervalo cronometrado
+VERSIONES_IN_PLACE = {
+    bubble_sort: bubble_sort_in_place,
+    comb_sort: comb_sort_in_place,
+    shell_sort: shell_sort_in_place,
+    shell_sort_ciura: shell_sort_ciura_in_place,
+    shell_sort_tokuda: shell_sort_tokuda_in_place,
+    shell_sort_sedgewick: shell_sort_sedgewick_in_place,
+    quick_sort: quick_sort_in_place,
+    merge_sort: merge_sort_in_place,
+    quick_sort_dual: quick_sort_dual_in_place,
+    merge_sort_acotado: merge_sort_acotado_in_place,
+    merge_sort_externo_arreglo: merge_sort_externo_arreglo_in_place,
+    quick_sort_hibrido: quick_sort_hibrido_in_place,
+    merge_sort_hibrido: merge_sort_hibrido_in_place
+}
+
+# Algoritmos que solo ordenan enteros de 64 bits (lanzan TypeError con
+# otros tipos de elemento); los barridos por tipo de elemento los omiten
+SOLO_ENTEROS = {merge_sort_externo_arreglo}
+
+__all__ = [
+    'ALGORITMOS',
+    'CONTENEDORES_INCREMENTALES',
+    'ContadorOperaciones',
+    'METRICAS',
+    'SECUENCIAS',
+    'SOLO_ENTEROS',
+    'VERSIONES_IN_PLACE',
+    'acepta_contador',
+    'bubble_sort',
+    'shell_sort',
+    'shell_sort_ciura',
+    'shell_sort_tokuda',
+    'shell_sort_sedgewick',
+    'comb_sort',
+    'quick_sort',
+    'merge_sort',
+    'quick_sort_dual',
+    'merge_sort_acotado',
+    'merge_sort_externo',
+    'merge_sort_externo_arreglo',
+    'quick_sort_hibrido',
+    'merge_sort_hibrido',
+    'bubble_sort_in_place',
+    'comb_sort_in_place',
+    'shell_sort_in_place',
+    'shell_sort_ciura_in_place',
+    'shell_sort_tokuda_in_place',
+    'shell_sort_sedgewick_in_place',
+    'quick_sort_in_place',
+    'merge_sort_in_place',
+    'quick_sort_dual_in_place',
+    'merge_sort_acotado_in_place',
+    'merge_sort_externo_arreglo_in_place',
+    'quick_sort_hibrido_in_place',
+    'merge_sort_hibrido_in_place',
+    'particionar',
+    'quickselect',
+    'mediana',
+    'top_k',
+    'mezclar',
+    'insertion_sort_rango',
+    'ReordenamientoCompleto',
+    'ListaMezclaPorLotes',
+    'ListaBloquesOrdenados'
+]
@@ -0,0 +1,276 @@
+"""
+Ordenamientos por brechas: Shell Sort y Comb Sort
+Generalizan el núcleo de Bubble Sort (comparar e intercambiar vecinos)
+a elementos separados por una brecha h que se reduce hasta 1: las
+pasadas con brechas grandes eliminan de una vez muchas inversiones
+lejanas, que Bubble Sort deshace de a una.
+
+- Shell Sort: por cada brecha de la secuencia ordena por inserción las
+  h subsecuencias a[i], a[i+h], a[i+2h], ... (secuencias de Ciura,
+  Tokuda y Sedgewick, o cualquier lista de brechas)
+- Comb Sort: pasadas de Bubble Sort con brecha dividida por un factor de
+  reducción (1.3) y pasadas con brecha 1 hasta que no haya intercambios
+
+Complejidad Temporal: depende de la secuencia; O(n^(4/3)) en el peor caso
+con Sedgewick, ~O(n^1.25) empírico con Ciura y Tokuda, O(n²) en el peor
+caso de Comb Sort
+Complejidad Espacial: O(1)
+
+Referencia:
+Ciura, M. (2001). "Best Increments for the Average Case of Shellsort".
+Fundamentals of Computation Theory (FCT), LNCS 2138, 106-117.
+https://doi.org/10.1007/3-540-44669-9_12
+Tokuda, N. (1992). "An Improved Shellsort". IFIP 12th World Computer Congress, 449-457.
+Sedgewick, R. (1986). "A New Upper Bound for Shellsort". Journal of
+Algorithms, 7(2), 159-173. https://doi.org/10.1016/0196-6774(86)90001-5
+Lacey, S., & Box, R. (1991). "A Fast, Easy Sort". Byte, 16(4), 315-320.
+"""
+
+import math
+from typing import Callable, Dict, Iterable, List, Union
+
+from utils.buffers import copiar_arreglo, vista_indexable
+
+# Brechas medidas experimentalmente por Ciura; después se extienden por 2.25
+_BRECHAS_CIURA = (1, 4, 10, 23, 57, 132, 301, 701)
+
+# Factor de reducción de la brecha de Comb Sort
+FACTOR_REDUCCION = 1.3
+
+
+def secuencia_ciura(n: int) -> List[int]:
+    """
+    Brechas de Ciura menores que n, de mayor a menor
+
+    Args:
+        n: Tamaño del arreglo
+
+    Returns:
+        list: Brechas decrecientes terminadas en 1
+    """
+    brechas = [h for h in _BRECHAS_CIURA if h < n]
+    h = _BRECHAS_CIURA[-1]
+    while True:
+        h = int(2.25 * h)
+        if h >= n:
+            break
+        brechas.append(h)
+    return brechas[::-1] or [1]
+
+
+def secuencia_tokuda(n: int) -> List[int]:
+    """
+    Brechas de Tokuda, ⌈(9^k - 4^k) / (5 · 4^(k-1))⌉, menores que n
+
+    Args:
+        n: Tamaño del arreglo
+
+    Returns:
+        list: Brechas decrecientes terminadas en 1
+    """
+    brechas = []
+    k = 1
+    while True:
+        h = -(-(9 ** k - 4 ** k) // (5 * 4 ** (k - 1)))
+        if h >= n and brechas:
+            break
+        brechas.append(h)
+        k += 1
+    return brechas[::-1]
+
+
+def secuencia_sedgewick(n: int) -> List[int]:
+    """
+    Brechas de Sedgewick (1986), 1 y 4^k + 3 · 2^(k-1) + 1, menores que n
+
+    Args:
+        n: Tamaño del arreglo
+
+    Returns:
+        list: Brechas decrecientes terminadas en 1
+    """
+    brechas = [1]
+    k = 1
+    while True:
+        h = 4 ** k + 3 * 2 ** (k - 1) + 1
+        if h >= n:
+            break
+        brechas.append(h)
+        k += 1
+    return brechas[::-1]
+
+
+# Secuencias de brechas disponibles por nombre
+SECUENCIAS: Dict[str, Callable[[int], List[int]]] = {
+    'Ciura': secuencia_ciura,
+    'Tokuda': secuencia_tokuda,
+    'Sedgewick': secuencia_sedgewick
+}
+
+
+def _resolver_brechas(secuencia: Union[str, Iterable[int]], n: int) -> List[int]:
+    """Brechas decrecientes a usar: por nombre de SECUENCIAS o una lista explícita"""
+    if isinstance(secuencia, str):
+        if secuencia not in SECUENCIAS:
+            raise ValueError(f"Secuencia de brechas desconocida: {secuencia}. "
+                             f"Opciones: {', '.join(SECUENCIAS)}")
+        return SECUENCIAS[secuencia](n)
+
+    brechas = sorted({int(h) for h in secuencia if h >= 1}, reverse=True)
+    if not brechas or brechas[-1] != 1:
+        raise ValueError("La secuencia de brechas debe terminar en 1")
+    return brechas
+
+
+def shell_sort_in_place(arr, secuencia: Union[str, Iterable[int]] = 'Ciura', contador=None):
+    """
+    Ordena el arreglo en el lugar, sin copiarlo (ver shell_sort)
+
+    Args:
+        arr (list | array | ndarray): Arreglo que se ordena (se modifica)
+        secuencia (str | iterable): Nombre en SECUENCIAS o brechas explícitas
+        contador (ContadorOperaciones): Contador opcional de métricas
+
+    Returns:
+        tuple: (numero_comparaciones, numero_intercambios)
+    """
+    a = vista_indexable(arr)
+    n = len(a)
+    comparaciones = 0
+    intercambios = 0
+    claves = 0
+
+    for h in _resolver_brechas(secuencia, n):
+        for i in range(h, n):
+            clave = a[i]
+            j = i
+            while j >= h:
+                comparaciones += 1
+                if a[j - h] > clave:
+                    a[j] = a[j - h]
+                    intercambios += 1
+                    j -= h
+                else:
+                    break
+            a[j] = clave
+        claves += max(0, n - h)
+
+    if contador is not None:
+        # Cada clave se lee y escribe una vez; cada comparación lee un
+        # elemento y cada desplazamiento lee y escribe uno
+        contador.acumular(comparaciones, intercambios,
+                          lecturas=claves + comparaciones + intercambios,
+                          escrituras=claves + intercambios)
+
+    return comparaciones, intercambios
+
+
+def shell_sort(arr, secuencia: Union[str, Iterable[int]] = 'Ciura', contador=None):
+    """
+    Implementa Shell Sort con la secuencia de brechas indicada
+
+    Cada desplazamiento de la inserción con brecha equivale a un
+    intercambio de la versión que compara e intercambia pares a distancia
+    h, por lo que se informa como intercambio (comparable con Bubble Sort).
+
+    Args:
+        arr (list | array | ndarray): Arreglo de elementos a ordenar
+        secuencia (str | iterable): Nombre en SECUENCIAS o brechas explícitas
+        contador (ContadorOperaciones): Contador opcional de métricas
+
+    Returns:
+        tuple: (arreglo_ordenado, numero_comparaciones, numero_intercambios)
+    """
+    arr_copy = copiar_arreglo(arr)
+    comparaciones, operaciones = shell_sort_in_place(arr_copy, secuencia, contador)
+    return arr_copy, comparaciones, operaciones
+
+
+def comb_sort_in_place(arr, factor: float = FACTOR_REDUCCION, contador=None):
+    """
+    Ordena el arreglo en el lugar, sin copiarlo (ver comb_sort)
+
+    Args:
+        arr (list | array | ndarray): Arreglo que se ordena (se modifica)
+        factor (float): Factor de reducción de la brecha (mayor que 1)
+        contador (ContadorOperaciones): Contador opcional de métricas
+
+    Returns:
+        tuple: (numero_comparaciones, numero_intercambios)
+    """
+    if factor <= 1:
+        raise ValueError("El factor de reducción debe ser mayor que 1")
+
+    a = vista_indexable(arr)
+    n = len(a)
+    comparaciones = 0
+    intercambios = 0
+
+    brecha = n
+    ordenado = False
+    while not ordenado:
+        brecha = max(1, math.floor(brecha / factor))
+        # Con brecha 1 es Bubble Sort: termina en la primera pasada sin intercambios
+        ordenado = brecha == 1
+
+        for i in range(n - brecha):
+            comparaciones += 1
+            if a[i] > a[i + brecha]:
+                a[i], a[i + brecha] = a[i + brecha], a[i]
+                intercambios += 1
+                ordenado = False
+
+    if contador is not None:
+        # Mismas cuentas que bubble_sort
+        contador.acumular(comparaciones, intercambios,
+                          lecturas=2 * comparaciones + 2 * intercambios,
+                          escrituras=2 * intercambios)
+
+    return comparaciones, intercambios
+
+
+def comb_sort(arr, factor: float = FACTOR_REDUCCION, contador=None):
+    """
+    Implementa Comb Sort: Bubble Sort con brecha decreciente
+
+    Args:
+        arr (list | array | ndarray): Arreglo de elementos a ordenar
+        factor (float): Factor de reducción de la brecha (mayor que 1)
+        contador (ContadorOperaciones): Contador opcional de métricas
+
+    Returns:
+        tuple: (arreglo_ordenado, numero_comparaciones, numero_intercambios)
+    """
+    arr_copy = copiar_arreglo(arr)
+    comparaciones, operaciones = comb_sort_in_place(arr_copy, factor, contador)
+    return arr_copy, comparaciones, operaciones
+
+
+def shell_sort_ciura(arr, contador=None):
+    """Shell Sort con la secuencia de Ciura (ver shell_sort)"""
+    return shell_sort(arr, 'Ciura', contador)
+
+
+def shell_sort_ciura_in_place(arr, contador=None):
+    """Shell Sort en el lugar con la secuencia de Ciura (ver shell_sort_in_place)"""
+    return shell_sort_in_place(arr, 'Ciura', contador)
+
+
+def shell_sort_tokuda(arr, contador=None):
+    """Shell Sort con la secuencia de Tokuda (ver shell_sort)"""
+    return shell_sort(arr, 'Tokuda', contador)
+
+
+def shell_sort_tokuda_in_place(arr, contador=None):
+    """Shell Sort en el lugar con la secuencia de Tokuda (ver shell_sort_in_place)"""
+    return shell_sort_in_place(arr, 'Tokuda', contador)
+
+
+def shell_sort_sedgewick(arr, contador=None):
+    """Shell Sort con la secuencia de Sedgewick (ver shell_sort)"""
+    return shell_sort(arr, 'Sedgewick', contador)
+
+
+def shell_sort_sedgewick_in_place(arr, contador=None):
+    """Shell Sort en el lugar con la secuencia de Sedgewick (ver shell_sort_in_place)"""
+    return shell_sort_in_place(arr, 'Sedgewick', contador)
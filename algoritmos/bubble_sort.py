@@ -8,19 +8,22 @@ Knuth, D. E. (1998). The Art of Computer Programming, Volume 3:
 Sorting and Searching (2nd ed.). Addison-Wesley Professional.
 """
 
-def bubble_sort(arr):
+from utils.buffers import copiar_arreglo, vista_indexable
+
+
+def bubble_sort_in_place(arr, contador=None):
     """
-    Implementa el algoritmo Bubble Sort
+    Ordena el arreglo en el lugar, sin copiarlo (ver bubble_sort)
     
     Args:
-        arr (list): Lista de elementos a ordenar
+        arr (list | array | ndarray): Arreglo que se ordena (se modifica)
+        contador (ContadorOperaciones): Contador opcional de métricas
         
     Returns:
-        tuple: (lista_ordenada, numero_comparaciones, numero_intercambios)
+        tuple: (numero_comparaciones, numero_intercambios)
     """
-    # Crear una copia para no modificar el original
-    arr_copy = arr.copy()
-    n = len(arr_copy)
+    a = vista_indexable(arr)
+    n = len(a)
     comparaciones = 0
     intercambios = 0
     
@@ -34,9 +37,9 @@ def bubble_sort(arr):
             comparaciones += 1
             
             # Comparar elementos adyacentes
-            if arr_copy[j] > arr_copy[j + 1]:
+            if a[j] > a[j + 1]:
                 # Intercambiar si están en orden incorrecto
-                arr_copy[j], arr_copy[j + 1] = arr_copy[j + 1], arr_copy[j]
+                a[j], a[j + 1] = a[j + 1], a[j]
                 intercambios += 1
                 swapped = True
         
@@ -44,7 +47,30 @@ def bubble_sort(arr):
         if not swapped:
             break
     
-    return arr_copy, comparaciones, intercambios
+    if contador is not None:
+        # Cada comparación lee dos elementos; cada intercambio lee y escribe dos
+        contador.acumular(comparaciones, intercambios,
+                          lecturas=2 * comparaciones + 2 * intercambios,
+                          escrituras=2 * intercambios)
+    
+    return comparaciones, intercambios
+
+
+def bubble_sort(arr, contador=None):
+    """
+    Implementa el algoritmo Bubble Sort
+    
+    Args:
+        arr (list | array | ndarray): Arreglo de elementos a ordenar
+        contador (ContadorOperaciones): Contador opcional de métricas
+        
+    Returns:
+        tuple: (arreglo_ordenado, numero_comparaciones, numero_intercambios)
+    """
+    # Crear una copia para no modificar el original
+    arr_copy = copiar_arreglo(arr)
+    comparaciones, operaciones = bubble_sort_in_place(arr_copy, contador=contador)
+    return arr_copy, comparaciones, operaciones
 
 
 def bubble_sort_animacion(arr):
@@ -57,16 +83,16 @@ def bubble_sort_animacion(arr):
     Returns:
         list: Lista de estados del arreglo en cada paso
     """
-    arr_copy = arr.copy()
+    arr_copy = copiar_arreglo(arr)
     n = len(arr_copy)
-    pasos = [arr_copy.copy()]
+    pasos = [copiar_arreglo(arr_copy)]
     
     for i in range(n):
         swapped = False
         for j in range(0, n - i - 1):
             if arr_copy[j] > arr_copy[j + 1]:
                 arr_copy[j], arr_copy[j + 1] = arr_copy[j + 1], arr_copy[j]
-                pasos.append(arr_copy.copy())
+                pasos.append(copiar_arreglo(arr_copy))
                 swapped = True
         
         if not swapped:
@@ -0,0 +1,91 @@
+"""
+Contador de operaciones compartido por los algoritmos
+Define una semántica común para las métricas de costo y las recoge con
+poca sobrecarga: cada algoritmo acumula en variables locales y vuelca
+los totales en el contador una vez por llamada (al salir de cada
+partición, mezcla o del algoritmo completo)
+
+Semántica de las métricas:
+    comparaciones: comparaciones entre dos elementos
+    intercambios: intercambios entre dos posiciones distintas
+    lecturas: lecturas de elementos del arreglo o de buffers auxiliares
+    escrituras: escrituras de elementos en el arreglo o en buffers auxiliares
+    memoria_aux: elementos reservados en buffers auxiliares (acumulado)
+    profundidad_max: profundidad máxima de recursión (0 si es iterativo,
+                     la llamada inicial de un algoritmo recursivo es 1)
+"""
+
+import inspect
+from typing import Callable, Dict
+
+# Métricas del contador, en el orden en que se reportan
+METRICAS = (
+    'comparaciones',
+    'intercambios',
+    'lecturas',
+    'escrituras',
+    'memoria_aux',
+    'profundidad_max'
+)
+
+
+class ContadorOperaciones:
+    """
+    Acumulador de métricas de costo de un ordenamiento
+    """
+
+    __slots__ = METRICAS
+
+    def __init__(self):
+        self.reiniciar()
+
+    def reiniciar(self):
+        """Pone todas las métricas en cero"""
+        for metrica in METRICAS:
+            setattr(self, metrica, 0)
+
+    def acumular(self, comparaciones: int = 0, intercambios: int = 0,
+                 lecturas: int = 0, escrituras: int = 0, memoria_aux: int = 0):
+        """
+        Vuelca los totales locales de una llamada en el contador
+
+        Args:
+            comparaciones: Comparaciones entre elementos
+            intercambios: Intercambios entre posiciones distintas
+            lecturas: Lecturas de elementos
+            escrituras: Escrituras de elementos
+            memoria_aux: Elementos reservados en buffers auxiliares
+        """
+        self.comparaciones += comparaciones
+        self.intercambios += intercambios
+        self.lecturas += lecturas
+        self.escrituras += escrituras
+        self.memoria_aux += memoria_aux
+
+    def registrar_profundidad(self, profundidad: int):
+        """Actualiza la profundidad máxima de recursión"""
+        if profundidad > self.profundidad_max:
+            self.profundidad_max = profundidad
+
+    def metricas(self) -> Dict[str, int]:
+        """
+        Returns:
+            dict: Métricas del contador con las claves de METRICAS
+        """
+        return {metrica: getattr(self, metrica) for metrica in METRICAS}
+
+
+def acepta_contador(algoritmo: Callable) -> bool:
+    """
+    Indica si un algoritmo recibe el parámetro contador
+
+    Args:
+        algoritmo: Función con el contrato alg(arr) -> (ordenado, comp, ops)
+
+    Returns:
+        bool: True si la firma del algoritmo incluye 'contador'
+    """
+    try:
+        return 'contador' in inspect.signature(algoritmo).parameters
+    except (TypeError, ValueError):
+        return False
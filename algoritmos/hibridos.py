@@ -0,0 +1,228 @@
+"""
+Quick Sort y Merge Sort híbridos (corte a Insertion Sort)
+Por debajo de un umbral de tamaño, los subarreglos se ordenan con
+Insertion Sort: en Python el costo de las llamadas recursivas domina en
+los subarreglos pequeños, donde Insertion Sort hace pocas operaciones
+y ninguna llamada
+
+El umbral de cada algoritmo y tipo de elemento se lee de
+resultados/umbrales.json (lo escribe el autoajuste de
+analisis.autoajuste) y, si no se calibró, vale UMBRAL_PREDETERMINADO.
+
+Complejidad Temporal: la de cada algoritmo base, más O(n · umbral) del corte
+Complejidad Espacial: la de cada algoritmo base
+
+Referencia:
+Sedgewick, R. (1978). "Implementing Quicksort Programs".
+Communications of the ACM, 21(10), 847-857.
+"""
+
+import json
+import os
+import sys
+from typing import Dict
+
+from utils.buffers import copiar_arreglo, vista_indexable
+from utils.tipos_elemento import tipo_elemento_de
+from .insercion import acumular_insercion, insertion_sort_rango
+from .merge_sort import mezclar
+from .quick_sort import particionar
+
+# Umbral usado mientras no haya uno calibrado para esta máquina
+UMBRAL_PREDETERMINADO = 16
+
+RUTA_UMBRALES_PREDETERMINADA = os.path.join('resultados', 'umbrales.json')
+
+# Umbrales cargados del archivo (se leen una sola vez por proceso)
+_umbrales_cache = None
+
+
+def cargar_umbrales(ruta: str = RUTA_UMBRALES_PREDETERMINADA) -> Dict[str, Dict[str, int]]:
+    """
+    Lee los umbrales calibrados
+
+    Args:
+        ruta: Archivo JSON de umbrales
+
+    Returns:
+        dict: {algoritmo: {tipo_elemento: umbral}} (vacío si no hay archivo)
+    """
+    if not os.path.exists(ruta):
+        return {}
+    with open(ruta, encoding='utf-8') as archivo:
+        return json.load(archivo)
+
+
+def guardar_umbrales(umbrales: Dict[str, Dict[str, int]],
+                     ruta: str = RUTA_UMBRALES_PREDETERMINADA):
+    """
+    Combina los umbrales dados con los guardados y los persiste
+
+    Args:
+        umbrales: {algoritmo: {tipo_elemento: umbral}}
+        ruta: Archivo JSON de umbrales
+    """
+    global _umbrales_cache
+
+    guardados = cargar_umbrales(ruta)
+    for algoritmo, por_tipo in umbrales.items():
+        guardados.setdefault(algoritmo, {}).update(por_tipo)
+
+    directorio = os.path.dirname(ruta)
+    if directorio:
+        os.makedirs(directorio, exist_ok=True)
+    with open(ruta, 'w', encoding='utf-8') as archivo:
+        json.dump(guardados, archivo, indent=2, ensure_ascii=False)
+
+    _umbrales_cache = None
+
+
+def obtener_umbral(algoritmo: str, arr) -> int:
+    """
+    Umbral calibrado para un algoritmo y el tipo de elemento del arreglo
+
+    Args:
+        algoritmo: Nombre del algoritmo híbrido (clave de ALGORITMOS)
+        arr: Arreglo a ordenar
+
+    Returns:
+        int: Umbral calibrado o UMBRAL_PREDETERMINADO
+    """
+    global _umbrales_cache
+
+    if _umbrales_cache is None:
+        _umbrales_cache = cargar_umbrales()
+    return _umbrales_cache.get(algoritmo, {}).get(tipo_elemento_de(arr), UMBRAL_PREDETERMINADO)
+
+
+def quick_sort_hibrido_in_place(arr, umbral: int = None, contador=None):
+    """
+    Ordena el arreglo en el lugar, sin copiarlo (ver quick_sort_hibrido)
+
+    Args:
+        arr (list | array | ndarray): Arreglo que se ordena (se modifica)
+        umbral (int): Tamaño de corte (por defecto, el calibrado)
+        contador (ContadorOperaciones): Contador opcional de métricas
+
+    Returns:
+        tuple: (numero_comparaciones, numero_operaciones)
+    """
+    if umbral is None:
+        umbral = obtener_umbral('Quick Sort Híbrido', arr)
+
+    comparaciones = [0]
+    operaciones = [0]
+
+    old_limit = sys.getrecursionlimit()
+    sys.setrecursionlimit(max(10000, len(arr) * 2))
+
+    def _quick_sort_recursive(arr, low, high, profundidad):
+        if contador is not None:
+            contador.registrar_profundidad(profundidad)
+
+        if high - low + 1 <= umbral:
+            comps, desplazamientos = insertion_sort_rango(arr, low, high)
+            comparaciones[0] += comps
+            operaciones[0] += desplazamientos
+            if contador is not None:
+                acumular_insercion(contador, high - low + 1, comps, desplazamientos)
+            return
+
+        pi = partition(arr, low, high)
+        _quick_sort_recursive(arr, low, pi - 1, profundidad + 1)
+        _quick_sort_recursive(arr, pi + 1, high, profundidad + 1)
+
+    def partition(arr, low, high):
+        pi, comps, swaps = particionar(arr, low, high, contador=contador)
+        comparaciones[0] += comps
+        operaciones[0] += swaps
+        return pi
+
+    _quick_sort_recursive(vista_indexable(arr), 0, len(arr) - 1, 1)
+
+    sys.setrecursionlimit(old_limit)
+
+    return comparaciones[0], operaciones[0]
+
+
+def quick_sort_hibrido(arr, umbral: int = None, contador=None):
+    """
+    Quick Sort con pivote aleatorio que ordena por inserción los
+    subarreglos de tamaño menor o igual al umbral
+
+    Args:
+        arr (list | array | ndarray): Arreglo de elementos a ordenar
+        umbral (int): Tamaño de corte (por defecto, el calibrado)
+        contador (ContadorOperaciones): Contador opcional de métricas
+
+    Returns:
+        tuple: (arreglo_ordenado, numero_comparaciones, numero_operaciones)
+               donde las operaciones son intercambios más desplazamientos
+    """
+    arr_copy = copiar_arreglo(arr)
+    comparaciones, operaciones = quick_sort_hibrido_in_place(arr_copy, umbral, contador)
+    return arr_copy, comparaciones, operaciones
+
+
+def merge_sort_hibrido_in_place(arr, umbral: int = None, contador=None):
+    """
+    Ordena el arreglo en el lugar, sin copiarlo (ver merge_sort_hibrido)
+
+    Args:
+        arr (list | array | ndarray): Arreglo que se ordena (se modifica)
+        umbral (int): Tamaño de corte (por defecto, el calibrado)
+        contador (ContadorOperaciones): Contador opcional de métricas
+
+    Returns:
+        tuple: (numero_comparaciones, numero_movimientos)
+    """
+    if umbral is None:
+        umbral = obtener_umbral('Merge Sort Híbrido', arr)
+
+    vista = vista_indexable(arr)
+    comparaciones = [0]
+    movimientos = [0]
+
+    def _merge_sort_recursive(arr, left, right, profundidad):
+        if contador is not None:
+            contador.registrar_profundidad(profundidad)
+
+        if right - left + 1 <= umbral:
+            comps, desplazamientos = insertion_sort_rango(arr, left, right)
+            comparaciones[0] += comps
+            movimientos[0] += desplazamientos
+            if contador is not None:
+                acumular_insercion(contador, right - left + 1, comps, desplazamientos)
+            return
+
+        mid = (left + right) // 2
+        _merge_sort_recursive(arr, left, mid, profundidad + 1)
+        _merge_sort_recursive(arr, mid + 1, right, profundidad + 1)
+        merge(arr, left, mid, right)
+
+    def merge(arr, left, mid, right):
+        comps, movs = mezclar(arr, left, mid, right, contador)
+        comparaciones[0] += comps
+        movimientos[0] += movs
+
+    _merge_sort_recursive(vista, 0, len(arr) - 1, 1)
+
+    return comparaciones[0], movimientos[0]
+
+
+def merge_sort_hibrido(arr, umbral: int = None, contador=None):
+    """
+    Merge Sort que ordena por inserción los subarreglos de tamaño menor
+    o igual al umbral (sigue siendo estable)
+
+    Args:
+        arr (list | array | ndarray): Arreglo de elementos a ordenar
+        umbral (int): Tamaño de corte (por defecto, el calibrado)
+        contador (ContadorOperaciones): Contador opcional de métricas
+
+    Returns:
+        tuple: (arreglo_ordenado, numero_comparaciones, numero_movimientos)
+    """
+    arr_copy = copiar_arreglo(arr)
+    comparaciones, operaciones = merge_sort_hibrido_in_place(arr_copy, umbral, contador)
+    return arr_copy, comparaciones, operaciones
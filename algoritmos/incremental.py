@@ -0,0 +1,299 @@
+"""
+Ordenamiento incremental: contenedores ordenados que reciben lotes
+Cuando los datos llegan por lotes, volver a ordenar todo lo acumulado en
+cada lote cuesta O(N log N) por lote. Los contenedores de este módulo
+mantienen el resultado ordenado y solo ordenan cada lote nuevo:
+
+- ReordenamientoCompleto: referencia; concatena el lote y ordena todo
+- ListaMezclaPorLotes: ordena el lote (O(b log b)) y lo mezcla con el
+  resultado usando la mezcla de Merge Sort (O(N + b))
+- ListaBloquesOrdenados: lista de bloques ordenados de ~carga elementos
+  con el máximo de cada bloque indexado (como una hoja de árbol B); un
+  elemento se inserta en O(log N) comparaciones y un lote ordenado se
+  mezcla solo con los bloques donde cae
+
+Todos comparten la interfaz agregar_lote(lote) -> (comparaciones,
+movimientos), len(), iteración y a_lista(). Con claves iguales los
+elementos ya guardados quedan antes que los del lote nuevo (estables).
+
+Referencia:
+Bayer, R., & McCreight, E. (1972). "Organization and Maintenance of Large
+Ordered Indexes". Acta Informatica, 1(3), 173-189.
+https://doi.org/10.1007/BF00288683
+"""
+
+from typing import Callable, Dict, Iterator, List, Tuple
+
+import numpy as np
+
+from utils.buffers import convertir_formato, formato_de, vista_indexable
+from .merge_sort import merge_sort, mezclar
+
+# Elementos por bloque de ListaBloquesOrdenados (se divide al doble)
+TAMANO_BLOQUE = 512
+
+
+def _concatenar(ordenado, lote):
+    """Concatena dos arreglos con la representación del primero"""
+    formato = formato_de(ordenado)
+    if formato_de(lote) != formato:
+        lote = convertir_formato(lote, formato)
+    if formato == 'numpy':
+        return np.concatenate((ordenado, lote))
+    return ordenado + lote
+
+
+def _cota_inferior(seq, lo: int, hi: int, valor, cuentas: List[int]) -> int:
+    """Primer índice de seq[lo:hi] con seq[i] >= valor"""
+    while lo < hi:
+        medio = (lo + hi) // 2
+        cuentas[0] += 1
+        if seq[medio] < valor:
+            lo = medio + 1
+        else:
+            hi = medio
+    return lo
+
+
+def _cota_superior(seq, lo: int, hi: int, valor, cuentas: List[int]) -> int:
+    """Primer índice de seq[lo:hi] con seq[i] > valor"""
+    while lo < hi:
+        medio = (lo + hi) // 2
+        cuentas[0] += 1
+        if valor < seq[medio]:
+            hi = medio
+        else:
+            lo = medio + 1
+    return lo
+
+
+class ReordenamientoCompleto:
+    """
+    Agrega cada lote al final y vuelve a ordenar todo lo acumulado
+    (referencia para comparar los contenedores incrementales)
+    """
+
+    def __init__(self, algoritmo: Callable = merge_sort, contador=None):
+        """
+        Args:
+            algoritmo: Algoritmo de ordenamiento (contrato de ALGORITMOS)
+            contador (ContadorOperaciones): Contador opcional de métricas
+        """
+        self.algoritmo = algoritmo
+        self.contador = contador
+        self.comparaciones = 0
+        self.movimientos = 0
+        self._ordenado = None
+
+    def agregar_lote(self, lote) -> Tuple[int, int]:
+        """
+        Agrega un lote y ordena el total
+
+        Args:
+            lote (list | array | ndarray): Elementos nuevos (no se modifica)
+
+        Returns:
+            tuple: (comparaciones, movimientos) de este lote
+        """
+        datos = lote if self._ordenado is None else _concatenar(self._ordenado, lote)
+        self._ordenado, comparaciones, movimientos = self.algoritmo(datos, contador=self.contador)
+
+        self.comparaciones += comparaciones
+        self.movimientos += movimientos
+        return comparaciones, movimientos
+
+    def __len__(self) -> int:
+        return 0 if self._ordenado is None else len(self._ordenado)
+
+    def __iter__(self) -> Iterator:
+        return iter(()) if self._ordenado is None else iter(self._ordenado)
+
+    def a_lista(self) -> List:
+        """Elementos ordenados como lista de Python"""
+        return [] if self._ordenado is None else convertir_formato(self._ordenado, 'lista')
+
+
+class ListaMezclaPorLotes(ReordenamientoCompleto):
+    """
+    Ordena solo cada lote y lo mezcla con el resultado acumulado (la
+    representación es la del primer lote)
+    """
+
+    def agregar_lote(self, lote) -> Tuple[int, int]:
+        """
+        Ordena el lote y lo mezcla con el resultado
+
+        Args:
+            lote (list | array | ndarray): Elementos nuevos (no se modifica)
+
+        Returns:
+            tuple: (comparaciones, movimientos) de este lote
+        """
+        ordenado, comparaciones, movimientos = self.algoritmo(lote, contador=self.contador)
+
+        if self._ordenado is None or not len(self._ordenado):
+            self._ordenado = ordenado
+        elif len(ordenado):
+            n = len(self._ordenado)
+            combinado = _concatenar(self._ordenado, ordenado)
+
+            # Lote posterior a todo el resultado (datos que llegan en
+            # orden): basta la concatenación
+            comparaciones += 1
+            if ordenado[0] < self._ordenado[-1]:
+                comps, movs = mezclar(vista_indexable(combinado), 0, n - 1,
+                                      len(combinado) - 1, self.contador)
+                comparaciones += comps
+                movimientos += movs
+            self._ordenado = combinado
+
+        self.comparaciones += comparaciones
+        self.movimientos += movimientos
+        return comparaciones, movimientos
+
+
+class ListaBloquesOrdenados:
+    """
+    Lista ordenada formada por bloques ordenados de entre carga / 2 y
+    2 · carga elementos (salvo el último), con el máximo de cada bloque
+    en un índice aparte para ubicar el bloque por búsqueda binaria
+    """
+
+    def __init__(self, algoritmo: Callable = merge_sort, contador=None,
+                 carga: int = TAMANO_BLOQUE):
+        """
+        Args:
+            algoritmo: Algoritmo con que se ordena cada lote (contrato de ALGORITMOS)
+            contador (ContadorOperaciones): Contador opcional de métricas
+            carga (int): Elementos por bloque tras una división
+        """
+        if carga < 1:
+            raise ValueError(f"La carga de los bloques debe ser positiva: {carga}")
+
+        self.algoritmo = algoritmo
+        self.contador = contador
+        self.carga = carga
+        self.comparaciones = 0
+        self.movimientos = 0
+        self._bloques: List[list] = []
+        self._maximos: list = []
+        self._largo = 0
+
+    def _dividir(self, idx: int):
+        """Parte el bloque idx en bloques de carga elementos si supera 2 · carga"""
+        bloque = self._bloques[idx]
+        if len(bloque) <= 2 * self.carga:
+            return
+
+        partes = [bloque[i:i + self.carga] for i in range(0, len(bloque), self.carga)]
+        self._bloques[idx:idx + 1] = partes
+        self._maximos[idx:idx + 1] = [parte[-1] for parte in partes]
+
+    def _ubicar(self, valor, cuentas: List[int]) -> int:
+        """Índice del bloque donde se inserta valor (tras sus iguales)"""
+        idx = _cota_superior(self._maximos, 0, len(self._maximos), valor, cuentas)
+        return min(idx, len(self._bloques) - 1)
+
+    def agregar(self, valor) -> Tuple[int, int]:
+        """
+        Inserta un elemento con O(log N) comparaciones
+
+        Args:
+            valor: Elemento a insertar
+
+        Returns:
+            tuple: (comparaciones, movimientos) de la inserción
+        """
+        cuentas = [0]
+        movimientos = 1
+
+        if not self._bloques:
+            self._bloques.append([valor])
+            self._maximos.append(valor)
+        else:
+            idx = self._ubicar(valor, cuentas)
+            bloque = self._bloques[idx]
+            pos = _cota_superior(bloque, 0, len(bloque), valor, cuentas)
+            bloque.insert(pos, valor)
+            # La inserción desplaza la cola del bloque
+            movimientos += len(bloque) - 1 - pos
+            self._maximos[idx] = bloque[-1]
+            self._dividir(idx)
+
+        self._largo += 1
+        if self.contador is not None:
+            self.contador.acumular(comparaciones=cuentas[0], lecturas=cuentas[0],
+                                   escrituras=movimientos)
+
+        self.comparaciones += cuentas[0]
+        self.movimientos += movimientos
+        return cuentas[0], movimientos
+
+    def agregar_lote(self, lote) -> Tuple[int, int]:
+        """
+        Ordena el lote y mezcla cada tramo con el bloque que le corresponde
+
+        Args:
+            lote (list | array | ndarray): Elementos nuevos (no se modifica)
+
+        Returns:
+            tuple: (comparaciones, movimientos) de este lote
+        """
+        ordenado, comparaciones, movimientos = self.algoritmo(lote, contador=self.contador)
+        ordenado = convertir_formato(ordenado, 'lista')
+        n = len(ordenado)
+        cuentas = [0]
+
+        if not self._bloques:
+            for i in range(0, n, self.carga):
+                self._bloques.append(ordenado[i:i + self.carga])
+                self._maximos.append(ordenado[min(i + self.carga, n) - 1])
+            movimientos += n
+        else:
+            i = 0
+            while i < n:
+                idx = self._ubicar(ordenado[i], cuentas)
+                if idx == len(self._bloques) - 1:
+                    j = n
+                else:
+                    # Tramo del lote menor que el máximo del bloque
+                    j = _cota_inferior(ordenado, i, n, self._maximos[idx], cuentas)
+
+                bloque = self._bloques[idx]
+                m = len(bloque)
+                bloque.extend(ordenado[i:j])
+                comps, movs = mezclar(bloque, 0, m - 1, len(bloque) - 1, self.contador)
+                comparaciones += comps
+                movimientos += movs
+
+                self._maximos[idx] = bloque[-1]
+                self._dividir(idx)
+                i = j
+
+        comparaciones += cuentas[0]
+        if self.contador is not None:
+            self.contador.acumular(comparaciones=cuentas[0], lecturas=cuentas[0])
+
+        self._largo += n
+        self.comparaciones += comparaciones
+        self.movimientos += movimientos
+        return comparaciones, movimientos
+
+    def __len__(self) -> int:
+        return self._largo
+
+    def __iter__(self) -> Iterator:
+        for bloque in self._bloques:
+            yield from bloque
+
+    def a_lista(self) -> List:
+        """Elementos ordenados como lista de Python"""
+        return [x for bloque in self._bloques for x in bloque]
+
+
+# Contenedores disponibles por nombre
+CONTENEDORES_INCREMENTALES: Dict[str, type] = {
+    'Re-ordenamiento completo': ReordenamientoCompleto,
+    'Mezcla por lote': ListaMezclaPorLotes,
+    'Bloques ordenados': ListaBloquesOrdenados
+}
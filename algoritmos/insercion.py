@@ -0,0 +1,62 @@
+"""
+Insertion Sort sobre un rango
+Núcleo compartido por los algoritmos que ordenan por inserción tramos
+pequeños: el corte de los híbridos, las corridas iniciales de Merge Sort
+con memoria acotada y los grupos de cinco de la mediana de medianas
+
+Complejidad Temporal: O(m²) para un rango de m elementos, O(m) si ya está ordenado
+Complejidad Espacial: O(1)
+
+Referencia:
+Knuth, D. E. (1998). The Art of Computer Programming, Volume 3:
+Sorting and Searching (2nd ed.). Addison-Wesley Professional.
+"""
+
+
+def insertion_sort_rango(arr, low: int, high: int):
+    """
+    Ordena arr[low..high] por inserción, en el lugar
+
+    Args:
+        arr: Arreglo (o vista indexable) que se modifica
+        low, high: Límites inclusivos del rango
+
+    Returns:
+        tuple: (comparaciones, desplazamientos)
+    """
+    comparaciones = 0
+    desplazamientos = 0
+
+    for i in range(low + 1, high + 1):
+        clave = arr[i]
+        j = i - 1
+        while j >= low:
+            comparaciones += 1
+            if arr[j] > clave:
+                arr[j + 1] = arr[j]
+                desplazamientos += 1
+                j -= 1
+            else:
+                break
+        arr[j + 1] = clave
+
+    return comparaciones, desplazamientos
+
+
+def acumular_insercion(contador, largo: int, comparaciones: int, desplazamientos: int):
+    """
+    Vuelca en el contador un tramo ordenado por inserción: cada clave se
+    lee y se escribe una vez, cada comparación lee un elemento y cada
+    desplazamiento lee y escribe uno
+
+    Args:
+        contador (ContadorOperaciones): Contador de métricas
+        largo: Elementos del tramo
+        comparaciones, desplazamientos: Cuentas de insertion_sort_rango
+    """
+    claves = max(0, largo - 1)
+    contador.acumular(
+        comparaciones=comparaciones,
+        lecturas=claves + comparaciones + desplazamientos,
+        escrituras=claves + desplazamientos
+    )
@@ -8,81 +8,140 @@ Cormen, T. H., Leiserson, C. E., Rivest, R. L., & Stein, C. (2009).
 Introduction to Algorithms (3rd ed.). MIT Press.
 """
 
-def merge_sort(arr):
+from utils.buffers import copiar_arreglo, vista_indexable
+
+
+def mezclar(arr, left, mid, right, contador=None):
     """
-    Implementa el algoritmo Merge Sort
+    Mezcla los subarreglos ordenados arr[left:mid+1] y arr[mid+1:right+1]
     
     Args:
-        arr (list): Lista de elementos a ordenar
+        arr: Arreglo (o vista indexable) que se modifica en el lugar
+        left, mid, right: Límites inclusivos de las dos corridas
+        contador (ContadorOperaciones): Contador opcional de métricas
         
     Returns:
-        tuple: (lista_ordenada, numero_comparaciones, numero_intercambios)
+        tuple: (comparaciones, movimientos) de esta mezcla
     """
-    arr_copy = arr.copy()
+    # Crear copias de los subarreglos
+    left_arr = arr[left:mid + 1]
+    right_arr = arr[mid + 1:right + 1]
+    if isinstance(arr, memoryview):
+        # Las rebanadas de un memoryview comparten memoria: copiarlas
+        left_arr, right_arr = left_arr.tolist(), right_arr.tolist()
+    
+    # Índices para recorrer los subarreglos
+    i = 0  # Índice inicial del primer subarreglo
+    j = 0  # Índice inicial del segundo subarreglo
+    k = left  # Índice inicial del arreglo mezclado
+    
+    comparaciones = 0
+    movimientos = 0
+    
+    # Mezclar los elementos en orden
+    while i < len(left_arr) and j < len(right_arr):
+        comparaciones += 1
+        
+        if left_arr[i] <= right_arr[j]:
+            arr[k] = left_arr[i]
+            i += 1
+        else:
+            arr[k] = right_arr[j]
+            j += 1
+        
+        movimientos += 1
+        k += 1
+    
+    # Copiar los elementos restantes de left_arr, si hay alguno
+    while i < len(left_arr):
+        arr[k] = left_arr[i]
+        i += 1
+        k += 1
+        movimientos += 1
+    
+    # Copiar los elementos restantes de right_arr, si hay alguno
+    while j < len(right_arr):
+        arr[k] = right_arr[j]
+        j += 1
+        k += 1
+        movimientos += 1
+    
+    if contador is not None:
+        # m elementos copiados a los buffers (m lecturas y m escrituras),
+        # dos lecturas más una relectura por comparación, una lectura por
+        # elemento restante y m escrituras de vuelta al arreglo
+        m = right - left + 1
+        contador.acumular(
+            comparaciones=comparaciones,
+            lecturas=2 * m + 2 * comparaciones,
+            escrituras=2 * m,
+            memoria_aux=m
+        )
+    
+    return comparaciones, movimientos
+
+
+def merge_sort_in_place(arr, contador=None):
+    """
+    Ordena el arreglo en el lugar, sin copiarlo (ver merge_sort)
+    
+    Args:
+        arr (list | array | ndarray): Arreglo que se ordena (se modifica)
+        contador (ContadorOperaciones): Contador opcional de métricas
+        
+    Returns:
+        tuple: (numero_comparaciones, numero_movimientos)
+    """
+    vista = vista_indexable(arr)
     comparaciones = [0]  # Usar lista para mantener referencia en recursión
     movimientos = [0]    # En merge sort contamos movimientos en lugar de intercambios
     
-    def _merge_sort_recursive(arr, left, right):
+    def _merge_sort_recursive(arr, left, right, profundidad):
         """
         Función recursiva auxiliar para Merge Sort
         """
+        if contador is not None:
+            contador.registrar_profundidad(profundidad)
+        
         if left < right:
             # Encontrar el punto medio
             mid = (left + right) // 2
             
             # Ordenar recursivamente las dos mitades
-            _merge_sort_recursive(arr, left, mid)
-            _merge_sort_recursive(arr, mid + 1, right)
+            _merge_sort_recursive(arr, left, mid, profundidad + 1)
+            _merge_sort_recursive(arr, mid + 1, right, profundidad + 1)
             
             # Mezclar las mitades ordenadas
             merge(arr, left, mid, right)
     
     def merge(arr, left, mid, right):
         """
-        Función que mezcla dos subarreglos ordenados
-        arr[left:mid+1] y arr[mid+1:right+1]
+        Mezcla las mitades y acumula las cuentas de la mezcla
         """
-        # Crear copias de los subarreglos
-        left_arr = arr[left:mid + 1]
-        right_arr = arr[mid + 1:right + 1]
-        
-        # Índices para recorrer los subarreglos
-        i = 0  # Índice inicial del primer subarreglo
-        j = 0  # Índice inicial del segundo subarreglo
-        k = left  # Índice inicial del arreglo mezclado
-        
-        # Mezclar los elementos en orden
-        while i < len(left_arr) and j < len(right_arr):
-            comparaciones[0] += 1
-            
-            if left_arr[i] <= right_arr[j]:
-                arr[k] = left_arr[i]
-                i += 1
-            else:
-                arr[k] = right_arr[j]
-                j += 1
-            
-            movimientos[0] += 1
-            k += 1
-        
-        # Copiar los elementos restantes de left_arr, si hay alguno
-        while i < len(left_arr):
-            arr[k] = left_arr[i]
-            i += 1
-            k += 1
-            movimientos[0] += 1
-        
-        # Copiar los elementos restantes de right_arr, si hay alguno
-        while j < len(right_arr):
-            arr[k] = right_arr[j]
-            j += 1
-            k += 1
-            movimientos[0] += 1
+        comps, movs = mezclar(arr, left, mid, right, contador)
+        comparaciones[0] += comps
+        movimientos[0] += movs
     
     # Llamar a la función recursiva
-    _merge_sort_recursive(arr_copy, 0, len(arr_copy) - 1)
+    _merge_sort_recursive(vista, 0, len(arr) - 1, 1)
     
-    return arr_copy, comparaciones[0], movimientos[0]
+    return comparaciones[0], movimientos[0]
+
+
+def merge_sort(arr, contador=None):
+    """
+    Implementa el algoritmo Merge Sort
+    
+    Args:
+        arr (list | array | ndarray): Arreglo de elementos a ordenar
+        contador (ContadorOperaciones): Contador opcional de métricas
+        
+    Returns:
+        tuple: (arreglo_ordenado, numero_comparaciones, numero_intercambios)
+    """
+    arr_copy = copiar_arreglo(arr)
+    comparaciones, operaciones = merge_sort_in_place(arr_copy, contador=contador)
+    return arr_copy, comparaciones, operaciones
 
 
 def merge_sort_animacion(arr):
@@ -95,8 +154,8 @@ def merge_sort_animacion(arr):
     Returns:
         list: Lista de estados del arreglo en cada paso
     """
-    arr_copy = arr.copy()
-    pasos = [arr_copy.copy()]
+    arr_copy = copiar_arreglo(arr)
+    pasos = [copiar_arreglo(arr_copy)]
     
     def _merge_sort_recursive(arr, left, right):
         if left < right:
@@ -104,11 +163,12 @@ def merge_sort_animacion(arr):
             _merge_sort_recursive(arr, left, mid)
             _merge_sort_recursive(arr, mid + 1, right)
             merge(arr, left, mid, right)
-            pasos.append(arr.copy())
+            pasos.append(copiar_arreglo(arr))
     
     def merge(arr, left, mid, right):
-        left_arr = arr[left:mid + 1]
-        right_arr = arr[mid + 1:right + 1]
+        # list() porque las rebanadas de un ndarray son vistas
+        left_arr = list(arr[left:mid + 1])
+        right_arr = list(arr[mid + 1:right + 1])
         
         i = j = 0
         k = left
@@ -0,0 +1,252 @@
+"""
+Merge Sort Estable con Memoria Acotada (buffer de O(√n) elementos)
+Merge Sort ascendente cuya mezcla usa un único buffer de ⌈√n⌉ elementos:
+si la corrida más corta cabe en el buffer se mezcla de forma directa; si
+no, se divide con búsqueda binaria y rotaciones hasta que las partes
+quepan (mezcla adaptativa, como std::stable_sort con poca memoria).
+No copia rebanadas, por lo que la memoria auxiliar no pasa del buffer.
+
+Complejidad Temporal: O(n log n) comparaciones, O(n log² n) movimientos en el peor caso
+Complejidad Espacial: O(√n) de buffer más O(log n) de recursión
+
+Referencia:
+Dudziński, K., & Dydek, A. (1981). "On a Stable Minimum Storage Merging
+Algorithm". Information Processing Letters, 12(1), 5-8.
+https://doi.org/10.1016/0020-0190(81)90065-9
+"""
+
+import math
+
+from utils.buffers import copiar_arreglo, vista_indexable
+from .insercion import insertion_sort_rango
+
+# Tamaño de las corridas iniciales que se ordenan por inserción
+TAMANO_CORRIDA = 16
+
+
+def merge_sort_acotado_in_place(arr, tamano_buffer: int = None, contador=None):
+    """
+    Ordena el arreglo en el lugar, sin copiarlo (ver merge_sort_acotado)
+
+    Args:
+        arr (list | array | ndarray): Arreglo que se ordena (se modifica)
+        tamano_buffer (int): Elementos del buffer (por defecto ⌈√n⌉)
+        contador (ContadorOperaciones): Contador opcional de métricas
+
+    Returns:
+        tuple: (numero_comparaciones, numero_movimientos)
+    """
+    a = vista_indexable(arr)
+    n = len(a)
+
+    capacidad = tamano_buffer or max(1, math.isqrt(max(0, n - 1)) + 1)
+    buffer = [None] * capacidad
+    comparaciones = [0]
+    movimientos = [0]   # Escrituras de elementos (arreglo y buffer)
+    lecturas = [0]
+
+    def mezclar_con_buffer_izquierdo(lo, mid, hi):
+        """Mezcla copiando la corrida izquierda al buffer (de izquierda a derecha)"""
+        largo = mid - lo
+        for i in range(largo):
+            buffer[i] = a[lo + i]
+
+        comps = 0
+        i, j, k = 0, mid, lo
+        while i < largo and j < hi:
+            comps += 1
+            if a[j] < buffer[i]:
+                a[k] = a[j]
+                j += 1
+            else:
+                a[k] = buffer[i]
+                i += 1
+            k += 1
+        while i < largo:
+            a[k] = buffer[i]
+            i += 1
+            k += 1
+
+        # Copia al buffer, dos lecturas por comparación y una por elemento escrito
+        escritos = k - lo
+        comparaciones[0] += comps
+        movimientos[0] += largo + escritos
+        lecturas[0] += largo + 2 * comps + escritos
+
+    def mezclar_con_buffer_derecho(lo, mid, hi):
+        """Mezcla copiando la corrida derecha al buffer (de derecha a izquierda)"""
+        largo = hi - mid
+        for j in range(largo):
+            buffer[j] = a[mid + j]
+
+        comps = 0
+        i, j, k = mid - 1, largo - 1, hi - 1
+        while i >= lo and j >= 0:
+            comps += 1
+            if buffer[j] < a[i]:
+                a[k] = a[i]
+                i -= 1
+            else:
+                a[k] = buffer[j]
+                j -= 1
+            k -= 1
+        while j >= 0:
+            a[k] = buffer[j]
+            j -= 1
+            k -= 1
+
+        escritos = hi - 1 - k
+        comparaciones[0] += comps
+        movimientos[0] += largo + escritos
+        lecturas[0] += largo + 2 * comps + escritos
+
+    def invertir(lo, hi):
+        """Invierte a[lo:hi] en el lugar"""
+        hi -= 1
+        pasos = 0
+        while lo < hi:
+            a[lo], a[hi] = a[hi], a[lo]
+            lo += 1
+            hi -= 1
+            pasos += 1
+        movimientos[0] += 2 * pasos
+        lecturas[0] += 2 * pasos
+
+    def rotar(lo, mid, hi):
+        """Rota a[lo:hi] para que a[mid:hi] quede antes que a[lo:mid]"""
+        largo_izq = mid - lo
+        largo_der = hi - mid
+        if largo_izq == 0 or largo_der == 0:
+            return
+
+        if largo_izq <= largo_der and largo_izq <= capacidad:
+            for i in range(largo_izq):
+                buffer[i] = a[lo + i]
+            for i in range(largo_der):
+                a[lo + i] = a[mid + i]
+            for i in range(largo_izq):
+                a[lo + largo_der + i] = buffer[i]
+            movimientos[0] += 2 * largo_izq + largo_der
+            lecturas[0] += 2 * largo_izq + largo_der
+        elif largo_der <= capacidad:
+            for i in range(largo_der):
+                buffer[i] = a[mid + i]
+            for i in range(largo_izq - 1, -1, -1):
+                a[lo + largo_der + i] = a[lo + i]
+            for i in range(largo_der):
+                a[lo + i] = buffer[i]
+            movimientos[0] += 2 * largo_der + largo_izq
+            lecturas[0] += 2 * largo_der + largo_izq
+        else:
+            # Rotación por tres inversiones, sin memoria extra
+            invertir(lo, mid)
+            invertir(mid, hi)
+            invertir(lo, hi)
+
+    def cota_inferior(lo, hi, valor):
+        """Primer índice de a[lo:hi] con a[i] >= valor"""
+        comps = 0
+        while lo < hi:
+            medio = (lo + hi) // 2
+            comps += 1
+            if a[medio] < valor:
+                lo = medio + 1
+            else:
+                hi = medio
+        comparaciones[0] += comps
+        lecturas[0] += comps
+        return lo
+
+    def cota_superior(lo, hi, valor):
+        """Primer índice de a[lo:hi] con a[i] > valor"""
+        comps = 0
+        while lo < hi:
+            medio = (lo + hi) // 2
+            comps += 1
+            if valor < a[medio]:
+                hi = medio
+            else:
+                lo = medio + 1
+        comparaciones[0] += comps
+        lecturas[0] += comps
+        return lo
+
+    def mezclar(lo, mid, hi, profundidad):
+        """
+        Mezcla estable de a[lo:mid] y a[mid:hi] usando como máximo el buffer
+        """
+        if contador is not None:
+            contador.registrar_profundidad(profundidad)
+
+        if lo >= mid or mid >= hi:
+            return
+
+        # Corridas ya en orden: no hay nada que mezclar
+        comparaciones[0] += 1
+        lecturas[0] += 2
+        if not a[mid] < a[mid - 1]:
+            return
+
+        largo_izq = mid - lo
+        largo_der = hi - mid
+        if largo_izq <= largo_der and largo_izq <= capacidad:
+            mezclar_con_buffer_izquierdo(lo, mid, hi)
+        elif largo_der <= capacidad:
+            mezclar_con_buffer_derecho(lo, mid, hi)
+        else:
+            # Ninguna corrida cabe: partir ambas por un mismo valor y rotar
+            if largo_izq >= largo_der:
+                corte_izq = lo + largo_izq // 2
+                corte_der = cota_inferior(mid, hi, a[corte_izq])
+            else:
+                corte_der = mid + largo_der // 2
+                corte_izq = cota_superior(lo, mid, a[corte_der])
+
+            rotar(corte_izq, mid, corte_der)
+            nuevo_medio = corte_izq + (corte_der - mid)
+
+            mezclar(lo, corte_izq, nuevo_medio, profundidad + 1)
+            mezclar(nuevo_medio, corte_der, hi, profundidad + 1)
+
+    # Corridas iniciales ordenadas por inserción
+    for inicio in range(0, n, TAMANO_CORRIDA):
+        fin = min(inicio + TAMANO_CORRIDA, n) - 1
+        comps, desplazamientos = insertion_sort_rango(a, inicio, fin)
+        claves = max(0, fin - inicio)
+        comparaciones[0] += comps
+        movimientos[0] += claves + desplazamientos
+        lecturas[0] += claves + comps + desplazamientos
+
+    # Mezclas ascendentes de corridas de ancho creciente
+    ancho = TAMANO_CORRIDA
+    while ancho < n:
+        for lo in range(0, n - ancho, 2 * ancho):
+            mezclar(lo, lo + ancho, min(lo + 2 * ancho, n), 1)
+        ancho *= 2
+
+    if contador is not None:
+        contador.acumular(
+            comparaciones=comparaciones[0],
+            lecturas=lecturas[0],
+            escrituras=movimientos[0],
+            memoria_aux=capacidad
+        )
+
+    return comparaciones[0], movimientos[0]
+
+
+def merge_sort_acotado(arr, tamano_buffer: int = None, contador=None):
+    """
+    Implementa Merge Sort estable con un buffer auxiliar de O(√n) elementos
+
+    Args:
+        arr (list | array | ndarray): Arreglo de elementos a ordenar
+        tamano_buffer (int): Elementos del buffer (por defecto ⌈√n⌉)
+        contador (ContadorOperaciones): Contador opcional de métricas
+
+    Returns:
+        tuple: (arreglo_ordenado, numero_comparaciones, numero_movimientos)
+    """
+    arr_copy = copiar_arreglo(arr)
+    comparaciones, operaciones = merge_sort_acotado_in_place(arr_copy, tamano_buffer, contador)
+    return arr_copy, comparaciones, operaciones
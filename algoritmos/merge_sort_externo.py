@@ -0,0 +1,318 @@
+"""
+Merge Sort Externo (Ordenamiento por Mezcla fuera de memoria)
+Ordena archivos binarios de enteros de 64 bits más grandes que la RAM:
+lee bloques acotados, ordena cada bloque en memoria con un algoritmo
+existente, guarda las corridas ordenadas en archivos temporales y las
+mezcla de k en k con un montículo y E/S con buffer
+
+Complejidad Temporal: O(n log n) comparaciones
+Complejidad de E/S: O(n · (1 + log_k(n / M))) elementos leídos y escritos
+Complejidad Espacial: O(M) en memoria, O(n) en disco
+
+Referencia:
+Knuth, D. E. (1998). The Art of Computer Programming, Volume 3:
+Sorting and Searching (2nd ed.), Sección 5.4. Addison-Wesley Professional.
+"""
+
+import os
+import shutil
+import tempfile
+from array import array
+from typing import Callable, Dict, Iterator, List
+
+import numpy as np
+
+from utils.buffers import convertir_formato, formato_de, restaurar_arreglo
+from .merge_sort import merge_sort
+
+# Bytes por elemento (entero con signo de 64 bits, formato 'q')
+TAMANO_ELEMENTO = array('q').itemsize
+
+
+def _a_enteros(arr) -> array:
+    """
+    Convierte la entrada a array('q') sin perder información
+
+    Raises:
+        TypeError: Si los elementos no son enteros representables en 64 bits
+                   (flotantes, cadenas, tuplas...), que la conversión
+                   truncaría o no podría escribir
+    """
+    if isinstance(arr, array) and arr.typecode == 'q':
+        return arr
+
+    try:
+        valores = np.asarray(arr)
+    except (ValueError, OverflowError):
+        valores = None
+
+    if valores is None or valores.ndim != 1 or (
+            valores.size and not (valores.dtype.kind == 'i' or
+                                  (valores.dtype.kind == 'u' and valores.dtype.itemsize < 8))):
+        raise TypeError("Merge Sort Externo solo ordena enteros de 64 bits con signo")
+
+    return convertir_formato(valores, 'array')
+
+
+def _leer_corrida(ruta: str, elementos_buffer: int, estadisticas: Dict) -> Iterator[int]:
+    """
+    Recorre un archivo de enteros leyendo bloques de elementos_buffer
+    """
+    with open(ruta, 'rb') as archivo:
+        while True:
+            bloque = array('q')
+            try:
+                bloque.fromfile(archivo, elementos_buffer)
+            except EOFError:
+                pass  # Último bloque incompleto: fromfile conserva lo leído
+            if not bloque:
+                return
+            estadisticas['bytes_leidos'] += len(bloque) * TAMANO_ELEMENTO
+            yield from bloque
+
+
+def _hundir(monticulo: List, i: int) -> int:
+    """
+    Restaura la propiedad de montículo mínimo desde la posición i
+
+    Returns:
+        int: Número de comparaciones realizadas
+    """
+    n = len(monticulo)
+    item = monticulo[i]
+    comparaciones = 0
+
+    while True:
+        hijo = 2 * i + 1
+        if hijo >= n:
+            break
+        if hijo + 1 < n:
+            comparaciones += 1
+            if monticulo[hijo + 1] < monticulo[hijo]:
+                hijo += 1
+        comparaciones += 1
+        if monticulo[hijo] < item:
+            monticulo[i] = monticulo[hijo]
+            i = hijo
+        else:
+            break
+
+    monticulo[i] = item
+    return comparaciones
+
+
+def _mezclar_corridas(rutas: List[str], ruta_salida: str, elementos_buffer: int,
+                      estadisticas: Dict):
+    """
+    Mezcla k corridas ordenadas en un único archivo ordenado
+
+    Los elementos del montículo son pares (valor, corrida): ante valores
+    iguales gana la corrida anterior, por lo que la mezcla es estable.
+    """
+    lectores = [_leer_corrida(ruta, elementos_buffer, estadisticas) for ruta in rutas]
+
+    monticulo = []
+    for fuente, lector in enumerate(lectores):
+        valor = next(lector, None)
+        if valor is not None:
+            monticulo.append((valor, fuente))
+
+    for i in range(len(monticulo) // 2 - 1, -1, -1):
+        estadisticas['comparaciones'] += _hundir(monticulo, i)
+
+    with open(ruta_salida, 'wb') as salida:
+        buffer = array('q')
+
+        while monticulo:
+            valor, fuente = monticulo[0]
+            buffer.append(valor)
+            estadisticas['movimientos'] += 1
+
+            if len(buffer) >= elementos_buffer:
+                buffer.tofile(salida)
+                estadisticas['bytes_escritos'] += len(buffer) * TAMANO_ELEMENTO
+                buffer = array('q')
+
+            siguiente = next(lectores[fuente], None)
+            if siguiente is None:
+                ultimo = monticulo.pop()
+                if not monticulo:
+                    break
+                monticulo[0] = ultimo
+            else:
+                monticulo[0] = (siguiente, fuente)
+            estadisticas['comparaciones'] += _hundir(monticulo, 0)
+
+        buffer.tofile(salida)
+        estadisticas['bytes_escritos'] += len(buffer) * TAMANO_ELEMENTO
+
+
+def merge_sort_externo(ruta_entrada: str, ruta_salida: str,
+                       memoria_max: int = 64 * 2**20,
+                       fan_in: int = 16,
+                       algoritmo: Callable = merge_sort,
+                       tamano_buffer: int = 2**20,
+                       directorio_temporal: str = None) -> Dict:
+    """
+    Ordena un archivo binario de enteros de 64 bits (formato nativo 'q')
+
+    Args:
+        ruta_entrada: Archivo de entrada
+        ruta_salida: Archivo donde se escribe el resultado ordenado
+        memoria_max: Bytes de cada bloque que se ordena en memoria (el
+                     algoritmo en memoria puede usar memoria auxiliar extra)
+        fan_in: Número máximo de corridas que se mezclan a la vez (k)
+        algoritmo: Algoritmo en memoria para ordenar cada bloque
+        tamano_buffer: Bytes del buffer de lectura de cada corrida y del de escritura
+        directorio_temporal: Directorio para las corridas (por defecto el del sistema)
+
+    Returns:
+        dict: elementos, corridas_iniciales, pasadas_mezcla, comparaciones,
+              movimientos, bytes_leidos y bytes_escritos
+    """
+    if fan_in < 2:
+        raise ValueError("fan_in debe ser al menos 2")
+
+    elementos_bloque = max(1, memoria_max // TAMANO_ELEMENTO)
+    elementos_buffer = max(1, tamano_buffer // TAMANO_ELEMENTO)
+
+    estadisticas = {
+        'elementos': 0,
+        'corridas_iniciales': 0,
+        'pasadas_mezcla': 0,
+        'comparaciones': 0,
+        'movimientos': 0,
+        'bytes_leidos': 0,
+        'bytes_escritos': 0
+    }
+
+    directorio = tempfile.mkdtemp(prefix='merge_externo_', dir=directorio_temporal)
+    try:
+        # Fase 1: generar corridas ordenadas de tamaño acotado
+        corridas = []
+        with open(ruta_entrada, 'rb') as entrada:
+            while True:
+                bloque = array('q')
+                try:
+                    bloque.fromfile(entrada, elementos_bloque)
+                except EOFError:
+                    pass
+                if not bloque:
+                    break
+
+                estadisticas['elementos'] += len(bloque)
+                estadisticas['bytes_leidos'] += len(bloque) * TAMANO_ELEMENTO
+
+                ordenado, comparaciones, movimientos = algoritmo(bloque)
+                estadisticas['comparaciones'] += comparaciones
+                estadisticas['movimientos'] += movimientos
+
+                ruta = os.path.join(directorio, f'corrida_0_{len(corridas)}.bin')
+                with open(ruta, 'wb') as archivo:
+                    ordenado.tofile(archivo)
+                estadisticas['bytes_escritos'] += len(ordenado) * TAMANO_ELEMENTO
+                corridas.append(ruta)
+
+        estadisticas['corridas_iniciales'] = len(corridas)
+
+        if not corridas:
+            open(ruta_salida, 'wb').close()
+            return estadisticas
+
+        # Fase 2: mezclar de fan_in en fan_in hasta que quede una corrida
+        while len(corridas) > 1:
+            estadisticas['pasadas_mezcla'] += 1
+            pasada = estadisticas['pasadas_mezcla']
+            ultima_pasada = len(corridas) <= fan_in
+
+            nuevas = []
+            for inicio in range(0, len(corridas), fan_in):
+                grupo = corridas[inicio:inicio + fan_in]
+                if ultima_pasada:
+                    destino = ruta_salida
+                else:
+                    destino = os.path.join(directorio, f'corrida_{pasada}_{len(nuevas)}.bin')
+
+                if len(grupo) == 1:
+                    # Corrida sin compañeras: pasa a la siguiente pasada sin copiarse
+                    nuevas.append(grupo[0])
+                    continue
+
+                _mezclar_corridas(grupo, destino, elementos_buffer, estadisticas)
+                for ruta in grupo:
+                    os.remove(ruta)
+                nuevas.append(destino)
+
+            corridas = nuevas
+
+        if corridas[0] != ruta_salida:
+            # Una sola corrida inicial: basta con moverla
+            shutil.move(corridas[0], ruta_salida)
+    finally:
+        shutil.rmtree(directorio, ignore_errors=True)
+
+    return estadisticas
+
+
+def merge_sort_externo_arreglo(arr, memoria_max: int = 2**20, fan_in: int = 16,
+                               algoritmo: Callable = merge_sort, contador=None):
+    """
+    Versión con el mismo contrato que los algoritmos en memoria: escribe el
+    arreglo a un archivo temporal, lo ordena externamente y lo lee de vuelta
+
+    Args:
+        arr (list | array | ndarray): Arreglo de enteros de 64 bits a ordenar
+        memoria_max: Bytes de cada bloque que se ordena en memoria
+        fan_in: Número máximo de corridas que se mezclan a la vez
+        algoritmo: Algoritmo en memoria para ordenar cada bloque
+        contador (ContadorOperaciones): Contador opcional de métricas; las
+            lecturas y escrituras son los elementos leídos y escritos en disco
+
+    Returns:
+        tuple: (arreglo_ordenado, numero_comparaciones, numero_movimientos)
+
+    Raises:
+        TypeError: Si los elementos no son enteros de 64 bits
+    """
+    formato = formato_de(arr)
+    enteros = _a_enteros(arr)
+
+    with tempfile.TemporaryDirectory(prefix='merge_externo_') as directorio:
+        ruta_entrada = os.path.join(directorio, 'entrada.bin')
+        ruta_salida = os.path.join(directorio, 'salida.bin')
+
+        with open(ruta_entrada, 'wb') as archivo:
+            enteros.tofile(archivo)
+
+        estadisticas = merge_sort_externo(ruta_entrada, ruta_salida, memoria_max,
+                                          fan_in, algoritmo, directorio_temporal=directorio)
+
+        resultado = array('q')
+        with open(ruta_salida, 'rb') as archivo:
+            resultado.fromfile(archivo, estadisticas['elementos'])
+
+    if contador is not None:
+        contador.acumular(
+            comparaciones=estadisticas['comparaciones'],
+            lecturas=estadisticas['bytes_leidos'] // TAMANO_ELEMENTO,
+            escrituras=estadisticas['bytes_escritos'] // TAMANO_ELEMENTO,
+            memoria_aux=min(estadisticas['elementos'], max(1, memoria_max // TAMANO_ELEMENTO))
+        )
+
+    return convertir_formato(resultado, formato), estadisticas['comparaciones'], estadisticas['movimientos']
+
+
+def merge_sort_externo_arreglo_in_place(arr, memoria_max: int = 2**20, fan_in: int = 16,
+                                        algoritmo: Callable = merge_sort, contador=None):
+    """
+    Ordena el arreglo externamente y copia el resultado sobre el mismo
+    arreglo (ver merge_sort_externo_arreglo)
+
+    Returns:
+        tuple: (numero_comparaciones, numero_movimientos)
+    """
+    resultado, comparaciones, movimientos = merge_sort_externo_arreglo(
+        arr, memoria_max, fan_in, algoritmo, contador
+    )
+    restaurar_arreglo(arr, resultado)
+    return comparaciones, movimientos
@@ -11,70 +11,122 @@ https://doi.org/10.1093/comjnl/5.1.10
 import sys
 import random
 
-def quick_sort(arr):
+from utils.buffers import copiar_arreglo, vista_indexable
+
+
+def particionar(arr, low, high, pivote=None, contador=None):
     """
-    Implementa el algoritmo Quick Sort con pivote aleatorio
-    para evitar el peor caso con datos ordenados
+    Partición de Lomuto de arr[low..high] con pivote aleatorio
     
     Args:
-        arr (list): Lista de elementos a ordenar
+        arr: Arreglo (o vista indexable) que se particiona en el lugar
+        low, high: Límites inclusivos del subarreglo
+        pivote (int): Índice del pivote (por defecto, uno aleatorio para
+                      evitar O(n²) en datos ordenados)
+        contador (ContadorOperaciones): Contador opcional de métricas
         
     Returns:
-        tuple: (lista_ordenada, numero_comparaciones, numero_intercambios)
+        tuple: (posicion_final_del_pivote, comparaciones, intercambios); los
+               menores o iguales al pivote quedan a su izquierda
+    """
+    pivot_idx = random.randint(low, high) if pivote is None else pivote
+    arr[pivot_idx], arr[high] = arr[high], arr[pivot_idx]
+    intercambios = int(pivot_idx != high)
+    
+    pivot = arr[high]
+    i = low - 1
+    
+    for j in range(low, high):
+        if arr[j] <= pivot:
+            i += 1
+            arr[i], arr[j] = arr[j], arr[i]
+            if i != j:
+                intercambios += 1
+    
+    arr[i + 1], arr[high] = arr[high], arr[i + 1]
+    if (i + 1) != high:
+        intercambios += 1
+    
+    if contador is not None:
+        # Totales de esta partición: los intercambios se ejecutan aunque
+        # las dos posiciones coincidan (1 del pivote + los de la pasada + 1 final)
+        ejecutados = i - low + 3
+        contador.acumular(
+            comparaciones=high - low,
+            intercambios=intercambios,
+            lecturas=1 + (high - low) + 2 * ejecutados,
+            escrituras=2 * ejecutados
+        )
+    
+    return i + 1, high - low, intercambios
+
+
+def quick_sort_in_place(arr, contador=None):
+    """
+    Ordena el arreglo en el lugar, sin copiarlo (ver quick_sort)
+    
+    Args:
+        arr (list | array | ndarray): Arreglo que se ordena (se modifica)
+        contador (ContadorOperaciones): Contador opcional de métricas
+        
+    Returns:
+        tuple: (numero_comparaciones, numero_intercambios)
     """
-    arr_copy = arr.copy()
     comparaciones = [0]
     intercambios = [0]
     
     # Aumentar límite de recursión para arreglos grandes
     old_limit = sys.getrecursionlimit()
-    sys.setrecursionlimit(max(10000, len(arr_copy) * 2))
+    sys.setrecursionlimit(max(10000, len(arr) * 2))
     
-    def _quick_sort_recursive(arr, low, high):
+    def _quick_sort_recursive(arr, low, high, profundidad):
         """
         Función recursiva auxiliar para Quick Sort
         """
+        if contador is not None:
+            contador.registrar_profundidad(profundidad)
+        
         if low < high:
             # Particionar el arreglo y obtener el índice del pivote
             pi = partition(arr, low, high)
             
             # Ordenar recursivamente los elementos antes y después del pivote
-            _quick_sort_recursive(arr, low, pi - 1)
-            _quick_sort_recursive(arr, pi + 1, high)
+            _quick_sort_recursive(arr, low, pi - 1, profundidad + 1)
+            _quick_sort_recursive(arr, pi + 1, high, profundidad + 1)
     
     def partition(arr, low, high):
         """
-        Función de partición con pivote aleatorio
+        Particiona y acumula las cuentas de la partición
         """
-        # Elegir un pivote aleatorio para evitar O(n²) en datos ordenados
-        pivot_idx = random.randint(low, high)
-        arr[pivot_idx], arr[high] = arr[high], arr[pivot_idx]
-        
-        pivot = arr[high]
-        i = low - 1
-        
-        for j in range(low, high):
-            comparaciones[0] += 1
-            
-            if arr[j] <= pivot:
-                i += 1
-                arr[i], arr[j] = arr[j], arr[i]
-                if i != j:
-                    intercambios[0] += 1
-        
-        arr[i + 1], arr[high] = arr[high], arr[i + 1]
-        if (i + 1) != high:
-            intercambios[0] += 1
-        
-        return i + 1
+        pi, comps, swaps = particionar(arr, low, high, contador=contador)
+        comparaciones[0] += comps
+        intercambios[0] += swaps
+        return pi
     
-    # Llamar a la función recursiva
-    _quick_sort_recursive(arr_copy, 0, len(arr_copy) - 1)
+    # Llamar a la función recursiva sobre una vista con indexación tipada
+    _quick_sort_recursive(vista_indexable(arr), 0, len(arr) - 1, 1)
     
     # Restaurar límite de recursión
     sys.setrecursionlimit(old_limit)
     
-    return arr_copy, comparaciones[0], intercambios[0]
+    return comparaciones[0], intercambios[0]
+
+
+def quick_sort(arr, contador=None):
+    """
+    Implementa el algoritmo Quick Sort con pivote aleatorio
+    para evitar el peor caso con datos ordenados
+    
+    Args:
+        arr (list | array | ndarray): Arreglo de elementos a ordenar
+        contador (ContadorOperaciones): Contador opcional de métricas
+        
+    Returns:
+        tuple: (arreglo_ordenado, numero_comparaciones, numero_intercambios)
+    """
+    arr_copy = copiar_arreglo(arr)
+    comparaciones, operaciones = quick_sort_in_place(arr_copy, contador=contador)
+    return arr_copy, comparaciones, operaciones
 
 
 def quick_sort_animacion(arr):
@@ -87,13 +139,13 @@ def quick_sort_animacion(arr):
     Returns:
         list: Lista de estados del arreglo en cada paso
     """
-    arr_copy = arr.copy()
-    pasos = [arr_copy.copy()]
+    arr_copy = copiar_arreglo(arr)
+    pasos = [copiar_arreglo(arr_copy)]
     
     def _quick_sort_recursive(arr, low, high):
         if low < high:
             pi = partition(arr, low, high)
-            pasos.append(arr.copy())
+            pasos.append(copiar_arreglo(arr))
             _quick_sort_recursive(arr, low, pi - 1)
             _quick_sort_recursive(arr, pi + 1, high)
     
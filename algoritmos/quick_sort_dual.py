@@ -0,0 +1,174 @@
+"""
+Quick Sort de Doble Pivote (Yaroslavskiy)
+Particiona en tres partes con dos pivotes p <= q: menores que p, entre
+p y q, y mayores que q. Los pivotes son el segundo y el cuarto de cinco
+elementos equiespaciados (mediana de cinco), como en Java 7
+
+Complejidad Temporal: O(n log n) en promedio, O(n²) en el peor caso
+Complejidad Espacial: O(log n) debido a la recursión
+
+Referencia:
+Yaroslavskiy, V. (2009). "Dual-Pivot Quicksort".
+Wild, S., & Nebel, M. E. (2012). "Average Case Analysis of Java 7's Dual
+Pivot Quicksort". European Symposium on Algorithms (ESA), 825-836.
+https://doi.org/10.1007/978-3-642-33090-2_71
+"""
+
+import sys
+
+from utils.buffers import copiar_arreglo, vista_indexable
+
+
+def quick_sort_dual_in_place(arr, contador=None):
+    """
+    Ordena el arreglo en el lugar, sin copiarlo (ver quick_sort_dual)
+
+    Args:
+        arr (list | array | ndarray): Arreglo que se ordena (se modifica)
+        contador (ContadorOperaciones): Contador opcional de métricas
+
+    Returns:
+        tuple: (numero_comparaciones, numero_intercambios)
+    """
+    comparaciones = [0]
+    intercambios = [0]
+
+    old_limit = sys.getrecursionlimit()
+    sys.setrecursionlimit(max(10000, len(arr) * 2))
+
+    def _quick_sort_recursive(arr, low, high, profundidad):
+        """
+        Función recursiva auxiliar: particiona y ordena las tres partes
+        """
+        if contador is not None:
+            contador.registrar_profundidad(profundidad)
+
+        if low < high:
+            lt, gt, pivotes_iguales = partition(arr, low, high)
+
+            _quick_sort_recursive(arr, low, lt - 1, profundidad + 1)
+            # Si p == q la parte central solo tiene elementos iguales a p
+            if not pivotes_iguales:
+                _quick_sort_recursive(arr, lt + 1, gt - 1, profundidad + 1)
+            _quick_sort_recursive(arr, gt + 1, high, profundidad + 1)
+
+    def partition(arr, low, high):
+        """
+        Partición de Yaroslavskiy; retorna las posiciones finales de ambos pivotes
+        """
+        comps = 0
+        swaps = 0       # Intercambios entre posiciones distintas
+        ejecutados = 0  # Todos los intercambios (para lecturas y escrituras)
+        lecturas = 0
+
+        def intercambiar(i, j):
+            """Intercambio fuera del lazo principal (mediana de cinco y pivotes)"""
+            nonlocal swaps, ejecutados
+            arr[i], arr[j] = arr[j], arr[i]
+            ejecutados += 1
+            if i != j:
+                swaps += 1
+
+        largo = high - low + 1
+        if largo >= 5:
+            # Mediana de cinco: ordenar por inserción cinco posiciones equiespaciadas
+            septimo = max(1, largo // 7)
+            e3 = (low + high) // 2
+            posiciones = [e3 - 2 * septimo, e3 - septimo, e3, e3 + septimo, e3 + 2 * septimo]
+            for a in range(1, 5):
+                b = a
+                while b > 0:
+                    comps += 1
+                    lecturas += 2
+                    if arr[posiciones[b - 1]] > arr[posiciones[b]]:
+                        intercambiar(posiciones[b - 1], posiciones[b])
+                        b -= 1
+                    else:
+                        break
+            intercambiar(low, posiciones[1])
+            intercambiar(high, posiciones[3])
+        else:
+            comps += 1
+            lecturas += 2
+            if arr[low] > arr[high]:
+                intercambiar(low, high)
+
+        p = arr[low]
+        q = arr[high]
+        lecturas += 2
+
+        lt = low + 1
+        gt = high - 1
+        k = lt
+        while k <= gt:
+            comps += 1
+            lecturas += 1
+            if arr[k] < p:
+                arr[k], arr[lt] = arr[lt], arr[k]
+                ejecutados += 1
+                swaps += k != lt
+                lt += 1
+            else:
+                comps += 1
+                lecturas += 1
+                if arr[k] > q:
+                    # Saltar desde la derecha los que ya son mayores que q
+                    while k < gt:
+                        comps += 1
+                        lecturas += 1
+                        if arr[gt] > q:
+                            gt -= 1
+                        else:
+                            break
+                    arr[k], arr[gt] = arr[gt], arr[k]
+                    ejecutados += 1
+                    swaps += k != gt
+                    gt -= 1
+
+                    comps += 1
+                    lecturas += 1
+                    if arr[k] < p:
+                        arr[k], arr[lt] = arr[lt], arr[k]
+                        ejecutados += 1
+                        swaps += k != lt
+                        lt += 1
+            k += 1
+
+        lt -= 1
+        gt += 1
+        intercambiar(low, lt)
+        intercambiar(high, gt)
+
+        comparaciones[0] += comps
+        intercambios[0] += swaps
+        if contador is not None:
+            contador.acumular(
+                comparaciones=comps,
+                intercambios=swaps,
+                lecturas=lecturas + 2 * ejecutados,
+                escrituras=2 * ejecutados
+            )
+
+        return lt, gt, p == q
+
+    _quick_sort_recursive(vista_indexable(arr), 0, len(arr) - 1, 1)
+
+    sys.setrecursionlimit(old_limit)
+
+    return comparaciones[0], intercambios[0]
+
+
+def quick_sort_dual(arr, contador=None):
+    """
+    Implementa Quick Sort de doble pivote con pivotes por mediana de cinco
+
+    Args:
+        arr (list | array | ndarray): Arreglo de elementos a ordenar
+        contador (ContadorOperaciones): Contador opcional de métricas
+
+    Returns:
+        tuple: (arreglo_ordenado, numero_comparaciones, numero_intercambios)
+    """
+    arr_copy = copiar_arreglo(arr)
+    comparaciones, operaciones = quick_sort_dual_in_place(arr_copy, contador=contador)
+    return arr_copy, comparaciones, operaciones
@@ -0,0 +1,213 @@
+"""
+Selección por partición: Quickselect (Introselect) y Top-k
+Usan la partición de Quick Sort pero continúan solo por el lado que
+contiene la posición buscada, por lo que no ordenan todo el arreglo:
+
+- quickselect: elemento de rango k (el k-ésimo menor) en O(n) esperado.
+  Si tras 2·log₂(n) particiones aleatorias la búsqueda no terminó, el
+  pivote pasa a ser la mediana de medianas (O(n) en el peor caso, como
+  Introselect)
+- top_k: los k menores ordenados en O(n + k log k): selección del rango
+  k - 1 y Quick Sort solo de las primeras k posiciones
+
+Con muchas claves repetidas la partición de Lomuto queda desbalanceada
+(los iguales al pivote van todos a la izquierda); cuando una partición
+deja más de 3/4 del rango a la izquierda se separan los iguales al
+pivote en una pasada extra.
+
+Complejidad Temporal: O(n) esperado y en el peor caso (quickselect),
+O(n + k log k) esperado (top_k)
+Complejidad Espacial: O(1) adicional más O(log k) de recursión
+
+Referencia:
+Hoare, C. A. R. (1961). "Algorithm 65: Find". Communications of the ACM, 4(7), 321-322.
+Blum, M., Floyd, R. W., Pratt, V., Rivest, R. L., & Tarjan, R. E. (1973).
+"Time Bounds for Selection". Journal of Computer and System Sciences, 7(4), 448-461.
+Musser, D. R. (1997). "Introspective Sorting and Selection Algorithms".
+Software: Practice and Experience, 27(8), 983-993.
+"""
+
+from utils.buffers import copiar_arreglo, formato_de, vista_indexable
+from .insercion import insertion_sort_rango
+from .quick_sort import particionar
+
+
+def _agrupar_iguales(a, low: int, pi: int, cuentas: list) -> int:
+    """
+    Mueve a la derecha de a[low..pi-1] los elementos iguales al pivote a[pi]
+
+    Returns:
+        int: Inicio del bloque de iguales (que termina en pi)
+    """
+    pivote = a[pi]
+    menores = low
+    for j in range(low, pi):
+        cuentas[0] += 1
+        if a[j] < pivote:
+            if j != menores:
+                a[menores], a[j] = a[j], a[menores]
+                cuentas[1] += 1
+            menores += 1
+    return menores
+
+
+def _particionar_balanceado(a, low: int, high: int, pivote, contador, cuentas: list):
+    """
+    Partición de Quick Sort que, si queda desbalanceada a la izquierda,
+    separa los iguales al pivote
+
+    Returns:
+        tuple: (inicio, fin) del bloque de elementos iguales al pivote
+    """
+    pi, comps, swaps = particionar(a, low, high, pivote, contador)
+    cuentas[0] += comps
+    cuentas[1] += swaps
+
+    iguales = pi
+    if 4 * (pi - low) > 3 * (high - low + 1):
+        iguales = _agrupar_iguales(a, low, pi, cuentas)
+    return iguales, pi
+
+
+def _mediana_de_medianas(a, low: int, high: int, contador, cuentas: list) -> int:
+    """
+    Índice de la mediana de las medianas de grupos de cinco de a[low..high]
+    (mueve las medianas al inicio del rango)
+    """
+    if high - low < 5:
+        comps, desplazamientos = insertion_sort_rango(a, low, high)
+        cuentas[0] += comps
+        cuentas[1] += desplazamientos
+        return (low + high) // 2
+
+    destino = low
+    for inicio in range(low, high + 1, 5):
+        fin = min(inicio + 4, high)
+        comps, desplazamientos = insertion_sort_rango(a, inicio, fin)
+        cuentas[0] += comps
+        cuentas[1] += desplazamientos
+
+        medio = (inicio + fin) // 2
+        if medio != destino:
+            a[destino], a[medio] = a[medio], a[destino]
+            cuentas[1] += 1
+        destino += 1
+
+    mediana = low + (destino - 1 - low) // 2
+    _seleccionar(a, low, destino - 1, mediana, 0, contador, cuentas)
+    return mediana
+
+
+def _seleccionar(a, low: int, high: int, k: int, limite: int, contador, cuentas: list):
+    """
+    Reordena a[low..high] para que a[k] sea el elemento de rango k, con
+    los menores o iguales a su izquierda y los mayores o iguales a su derecha
+
+    Args:
+        limite: Particiones con pivote aleatorio antes de pasar a la
+                mediana de medianas
+        cuentas: [comparaciones, intercambios] acumulados
+    """
+    while low < high:
+        if limite > 0:
+            pivote = None
+            limite -= 1
+        else:
+            pivote = _mediana_de_medianas(a, low, high, contador, cuentas)
+
+        iguales, pi = _particionar_balanceado(a, low, high, pivote, contador, cuentas)
+        if iguales <= k <= pi:
+            return
+        if k < iguales:
+            high = iguales - 1
+        else:
+            low = pi + 1
+
+
+def _ordenar_rango(a, low: int, high: int, contador, cuentas: list, profundidad: int = 1):
+    """
+    Quick Sort de a[low..high]; recursión por el lado menor para que la
+    profundidad sea O(log n)
+    """
+    while low < high:
+        if contador is not None:
+            contador.registrar_profundidad(profundidad)
+
+        iguales, pi = _particionar_balanceado(a, low, high, None, contador, cuentas)
+        if iguales - low < high - pi:
+            _ordenar_rango(a, low, iguales - 1, contador, cuentas, profundidad + 1)
+            low = pi + 1
+        else:
+            _ordenar_rango(a, pi + 1, high, contador, cuentas, profundidad + 1)
+            high = iguales - 1
+
+
+def quickselect(arr, k: int, contador=None):
+    """
+    Encuentra el elemento de rango k (0 es el menor) sin ordenar el arreglo
+
+    Args:
+        arr (list | array | ndarray): Arreglo de elementos (no se modifica)
+        k (int): Rango buscado, entre 0 y len(arr) - 1
+        contador (ContadorOperaciones): Contador opcional de métricas
+
+    Returns:
+        tuple: (elemento, numero_comparaciones, numero_intercambios)
+    """
+    n = len(arr)
+    if not 0 <= k < n:
+        raise ValueError(f"El rango k debe estar entre 0 y {n - 1}: {k}")
+
+    arr_copy = copiar_arreglo(arr)
+    a = vista_indexable(arr_copy)
+    cuentas = [0, 0]
+
+    _seleccionar(a, 0, n - 1, k, 2 * n.bit_length(), contador, cuentas)
+
+    return a[k], cuentas[0], cuentas[1]
+
+
+def mediana(arr, contador=None):
+    """
+    Mediana inferior del arreglo (rango (n - 1) // 2) mediante quickselect
+
+    Args:
+        arr (list | array | ndarray): Arreglo de elementos (no se modifica)
+        contador (ContadorOperaciones): Contador opcional de métricas
+
+    Returns:
+        tuple: (mediana, numero_comparaciones, numero_intercambios)
+    """
+    return quickselect(arr, (len(arr) - 1) // 2, contador)
+
+
+def top_k(arr, k: int, contador=None):
+    """
+    Retorna los k menores elementos ordenados (ordenamiento parcial)
+
+    Args:
+        arr (list | array | ndarray): Arreglo de elementos (no se modifica)
+        k (int): Cantidad de elementos (se acota a len(arr))
+        contador (ContadorOperaciones): Contador opcional de métricas
+
+    Returns:
+        tuple: (k_menores_ordenados, numero_comparaciones, numero_intercambios),
+               con los k menores en la misma representación que arr
+    """
+    n = len(arr)
+    k = max(0, min(k, n))
+
+    arr_copy = copiar_arreglo(arr)
+    a = vista_indexable(arr_copy)
+    cuentas = [0, 0]
+
+    if 0 < k < n:
+        _seleccionar(a, 0, n - 1, k - 1, 2 * n.bit_length(), contador, cuentas)
+    _ordenar_rango(a, 0, k - 1, contador, cuentas)
+
+    primeros = arr_copy[:k]
+    if formato_de(primeros) == 'numpy':
+        # La rebanada de un ndarray es una vista: no retener todo el arreglo
+        primeros = primeros.copy()
+
+    return primeros, cuentas[0], cuentas[1]
@@ -3,13 +3,48 @@ Módulo de análisis y medición de algoritmos
 Contiene funciones para medir tiempos y visualizar resultados
 """
 
-from .medicion import medir_tiempo, comparar_algoritmos, analizar_complejidad
+from .medicion import (medir_tiempo, medir_ejecucion, comparar_algoritmos, comparar_seleccion,
+                       comparar_incremental, analizar_complejidad)
 from .visualizacion import graficar_comparacion, graficar_crecimiento_asintotico
+from .desorden import calcular_desorden
+from .perfilado import perfilar_ejecucion, exportar_speedscope
+from .experimentos import ejecutar_barrido, cargar_barrido, listar_barridos
+from .aislamiento import medir_aislado, comparar_aislado
+from .distribuido import ejecutar_distribuido, ejecutar_trabajador
+from .verificacion import esta_ordenado, huella_multiconjunto, verificar_ordenamiento, verificar_estabilidad
+from .memoria import medir_memoria_pico
+from .tablas import construir_tabla, construir_tabla_por_tipo, resumir_tabla, exportar_tabla
+from .modelo_costos import ajustar_modelo_costos, calibrar_maquina, predecir_tiempo
 
 __all__ = [
     'medir_tiempo',
+    'medir_ejecucion',
     'comparar_algoritmos',
+    'comparar_seleccion',
+    'comparar_incremental',
     'analizar_complejidad',
     'graficar_comparacion',
-    'graficar_crecimiento_asintotico'
+    'graficar_crecimiento_asintotico',
+    'calcular_desorden',
+    'perfilar_ejecucion',
+    'exportar_speedscope',
+    'ejecutar_barrido',
+    'cargar_barrido',
+    'listar_barridos',
+    'medir_aislado',
+    'comparar_aislado',
+    'ejecutar_distribuido',
+    'ejecutar_trabajador',
+    'ajustar_modelo_costos',
+    'calibrar_maquina',
+    'predecir_tiempo',
+    'esta_ordenado',
+    'huella_multiconjunto',
+    'verificar_ordenamiento',
+    'verificar_estabilidad',
+    'medir_memoria_pico',
+    'construir_tabla',
+    'construir_tabla_por_tipo',
+    'resumir_tabla',
+    'exportar_tabla'
 ]
@@ -0,0 +1,180 @@
+"""
+Módulo de medición aislada y reproducible
+Ejecuta cada medición en un intérprete nuevo con PYTHONHASHSEED fijo y
+el generador de random sembrado con la semilla del manifiesto (los
+pivotes aleatorios, y con ellos las cuentas, se repiten), opcionalmente
+fijado a una CPU, y adjunta un manifiesto con el entorno (versión de
+Python, modelo y gobernador de la CPU, carga, semilla y revisión de git)
+para comparar resultados entre días y máquinas
+
+El proceso hijo se inicia con el módulo aparte analisis.proceso_aislado
+(lo invoca medir_aislado):
+    python -m analisis.proceso_aislado '{"algoritmo": "Quick Sort", ...}'
+"""
+
+import gc
+import json
+import os
+import random
+import subprocess
+import sys
+from typing import Dict, List
+
+from .entorno import RAIZ_PROYECTO, obtener_frecuencia_cpu, obtener_metadatos_entorno
+
+# Semilla de hash por defecto para los procesos aislados
+HASHSEED_PREDETERMINADO = 0
+
+
+def crear_manifiesto(semilla: int, cpu: int = None) -> Dict:
+    """
+    Describe el entorno en que se ejecuta la medición actual
+
+    Args:
+        semilla: Semilla de los datos
+        cpu: CPU a la que está fijado el proceso (None si no se fijó)
+
+    Returns:
+        dict: Metadatos del entorno más semilla (de los datos y de random),
+              PYTHONHASHSEED y afinidad
+    """
+    manifiesto = obtener_metadatos_entorno()
+
+    if cpu is not None:
+        manifiesto.update(obtener_frecuencia_cpu(cpu))
+
+    afinidad = sorted(os.sched_getaffinity(0)) if hasattr(os, 'sched_getaffinity') else None
+
+    manifiesto.update({
+        'semilla': semilla,
+        'pythonhashseed': os.environ.get('PYTHONHASHSEED'),
+        'cpu_fijada': cpu,
+        'afinidad_cpu': afinidad
+    })
+
+    return manifiesto
+
+
+def ejecutar_en_hijo(configuracion: Dict) -> Dict:
+    """
+    Mide una celda dentro del proceso aislado y retorna resultado y manifiesto
+
+    Args:
+        configuracion: Parámetros de medir_aislado (algoritmo, tipo_datos,
+                       tamano, repeticiones, semilla, formato y cpu)
+
+    Returns:
+        dict: Resultado con el formato de medir_celda más 'manifiesto'
+    """
+    from .experimentos import medir_celda
+
+    cpu = configuracion.get('cpu')
+    if cpu is not None:
+        if not hasattr(os, 'sched_setaffinity'):
+            raise RuntimeError("Esta plataforma no permite fijar la afinidad de CPU")
+        os.sched_setaffinity(0, {cpu})
+
+    # Pivotes aleatorios reproducibles: la misma semilla da las mismas cuentas
+    random.seed(configuracion.get('semilla', 0))
+
+    # Partir de un heap limpio: recolectar y luego medir
+    gc.collect()
+
+    resultado = medir_celda(
+        configuracion['algoritmo'],
+        configuracion['tipo_datos'],
+        configuracion['tamano'],
+        repeticiones=configuracion.get('repeticiones', 3),
+        semilla=configuracion.get('semilla', 0),
+        formato=configuracion.get('formato', 'lista')
+    )
+    resultado['manifiesto'] = crear_manifiesto(configuracion.get('semilla', 0), cpu)
+
+    return resultado
+
+
+def medir_aislado(algoritmo: str,
+                  tipo_datos: str,
+                  tamano: int,
+                  repeticiones: int = 3,
+                  semilla: int = 0,
+                  formato: str = 'lista',
+                  cpu: int = None,
+                  hashseed: int = HASHSEED_PREDETERMINADO,
+                  tiempo_limite: float = None) -> Dict:
+    """
+    Mide una celda en un intérprete nuevo
+
+    Args:
+        algoritmo: Nombre del algoritmo (clave de ALGORITMOS)
+        tipo_datos: Nombre del tipo de datos (clave de TIPOS_DATOS)
+        tamano: Tamaño de entrada
+        repeticiones: Número de repeticiones
+        semilla: Semilla de los datos
+        formato: Representación en memoria de los datos
+        cpu: Índice de la CPU a la que fijar el proceso (None para no fijar)
+        hashseed: Valor de PYTHONHASHSEED del proceso hijo
+        tiempo_limite: Segundos máximos de espera (None para no limitar)
+
+    Returns:
+        dict: Resultado con el formato de medir_celda más 'manifiesto'
+    """
+    configuracion = {
+        'algoritmo': algoritmo,
+        'tipo_datos': tipo_datos,
+        'tamano': tamano,
+        'repeticiones': repeticiones,
+        'semilla': semilla,
+        'formato': formato,
+        'cpu': cpu
+    }
+
+    entorno = {**os.environ, 'PYTHONHASHSEED': str(hashseed)}
+
+    proceso = subprocess.run(
+        [sys.executable, '-m', 'analisis.proceso_aislado', json.dumps(configuracion)],
+        cwd=RAIZ_PROYECTO,
+        env=entorno,
+        capture_output=True,
+        text=True,
+        timeout=tiempo_limite
+    )
+
+    if proceso.returncode != 0:
+        raise RuntimeError(
+            f"La medición aislada de {algoritmo} falló:\n{proceso.stderr.strip()}"
+        )
+
+    # El resultado es la última línea de la salida estándar
+    return json.loads(proceso.stdout.strip().splitlines()[-1])
+
+
+def comparar_aislado(algoritmos: List[str],
+                     tipo_datos: str,
+                     tamano: int,
+                     repeticiones: int = 3,
+                     semilla: int = 0,
+                     formato: str = 'lista',
+                     cpu: int = None) -> Dict:
+    """
+    Compara algoritmos midiendo cada uno en su propio proceso aislado,
+    todos con la misma entrada
+
+    Args:
+        algoritmos: Nombres de algoritmos (claves de ALGORITMOS)
+        tipo_datos: Nombre del tipo de datos
+        tamano: Tamaño de entrada
+        repeticiones: Número de repeticiones
+        semilla: Semilla de los datos
+        formato: Representación en memoria de los datos
+        cpu: CPU a la que fijar cada proceso (None para no fijar)
+
+    Returns:
+        dict: Resultados por algoritmo con el formato de comparar_algoritmos,
+              cada uno con su 'manifiesto'
+    """
+    return {
+        nombre: medir_aislado(nombre, tipo_datos, tamano, repeticiones,
+                              semilla, formato, cpu)
+        for nombre in algoritmos
+    }
@@ -0,0 +1,141 @@
+"""
+Módulo de animación de algoritmos
+Convierte los pasos de las funciones *_animacion en cuadros compactos
+(diferencias de barras) y construye la animación Plotly correspondiente
+
+La reproducción ocurre en el navegador mediante los frames de Plotly,
+por lo que avanzar o retroceder no vuelve a ejecutar la aplicación.
+"""
+
+import numpy as np
+import plotly.graph_objects as go
+from typing import Dict, Iterator, List, Tuple
+
+
+def comprimir_pasos(pasos: List[List], presupuesto_frames: int = 100) -> Dict:
+    """
+    Reduce los pasos a un presupuesto de cuadros y los codifica como
+    diferencias respecto del cuadro anterior
+
+    Args:
+        pasos: Estados del arreglo retornados por una función *_animacion
+        presupuesto_frames: Número máximo de cuadros (incluye el inicial y el final)
+
+    Returns:
+        dict: 'inicial' (estado completo), 'diferencias' (lista de pares
+              (indices, valores) por cuadro) y 'total_pasos'
+    """
+    total = len(pasos)
+    if total == 0:
+        return {'inicial': [], 'diferencias': [], 'total_pasos': 0}
+
+    # Elegir cuadros equiespaciados, conservando siempre el primero y el último
+    presupuesto = max(2, presupuesto_frames)
+    seleccion = np.unique(np.linspace(0, total - 1, min(presupuesto, total)).astype(int))
+
+    anterior = np.asarray(pasos[seleccion[0]])
+    diferencias = []
+    for indice in seleccion[1:]:
+        actual = np.asarray(pasos[indice])
+        cambiados = np.flatnonzero(actual != anterior)
+        diferencias.append((cambiados.tolist(), actual[cambiados].tolist()))
+        anterior = actual
+
+    return {
+        'inicial': list(pasos[seleccion[0]]),
+        'diferencias': diferencias,
+        'total_pasos': total
+    }
+
+
+def reconstruir_cuadros(compacto: Dict) -> Iterator[Tuple[List, List[int]]]:
+    """
+    Reconstruye los estados completos a partir de la codificación compacta
+
+    Args:
+        compacto: Resultado de comprimir_pasos
+
+    Yields:
+        tuple: (estado, indices_cambiados) para cada cuadro
+    """
+    estado = list(compacto['inicial'])
+    yield estado.copy(), []
+
+    for indices, valores in compacto['diferencias']:
+        for i, valor in zip(indices, valores):
+            estado[i] = valor
+        yield estado.copy(), indices
+
+
+def graficar_animacion(compacto: Dict, titulo: str = "Ordenamiento Paso a Paso",
+                       duracion_ms: int = 120) -> go.Figure:
+    """
+    Crea una animación de barras con controles de reproducción y deslizador
+
+    Cada cuadro solo transporta las alturas de las barras y un código por
+    barra (0 sin cambio, 1 modificada respecto del cuadro anterior) que una
+    escala de colores fija traduce en el resaltado.
+
+    Args:
+        compacto: Resultado de comprimir_pasos
+        titulo: Título del gráfico
+        duracion_ms: Duración de cada cuadro en milisegundos
+
+    Returns:
+        Figure: Objeto de gráfico Plotly con frames
+    """
+    # Código 0: barra sin cambio; código 1: barra modificada
+    escala = dict(colorscale=[[0, '#45B7D1'], [1, '#FF6B6B']], cmin=0, cmax=1)
+
+    cuadros = []
+    for numero, (estado, cambiados) in enumerate(reconstruir_cuadros(compacto)):
+        codigos = np.zeros(len(estado), dtype=np.int8)
+        codigos[list(cambiados)] = 1
+        cuadros.append(go.Frame(
+            name=str(numero),
+            data=[go.Bar(y=estado, marker=dict(color=codigos, **escala))],
+            traces=[0]
+        ))
+
+    x = list(range(len(compacto['inicial'])))
+    fig = go.Figure(
+        data=[go.Bar(x=x, y=compacto['inicial'],
+                     marker=dict(color=np.zeros(len(x), dtype=np.int8), **escala))],
+        frames=cuadros
+    )
+
+    animar = dict(frame=dict(duration=duracion_ms, redraw=True),
+                  transition=dict(duration=0), mode='immediate')
+
+    fig.update_layout(
+        title=f"{titulo} ({len(cuadros)} de {compacto['total_pasos']} pasos)",
+        xaxis_title="Posición",
+        yaxis_title="Valor",
+        yaxis_range=[0, max(compacto['inicial'], default=1) * 1.05],
+        template="plotly_white",
+        height=500,
+        showlegend=False,
+        updatemenus=[dict(
+            type='buttons',
+            direction='left',
+            x=0,
+            y=-0.15,
+            xanchor='left',
+            buttons=[
+                dict(label='▶ Reproducir', method='animate', args=[None, {**animar, 'fromcurrent': True}]),
+                dict(label='⏸ Pausa', method='animate', args=[[None], {**animar, 'frame': dict(duration=0, redraw=False)}])
+            ]
+        )],
+        sliders=[dict(
+            x=0.25,
+            len=0.75,
+            y=-0.1,
+            currentvalue=dict(prefix='Cuadro: '),
+            steps=[
+                dict(label=cuadro.name, method='animate', args=[[cuadro.name], animar])
+                for cuadro in cuadros
+            ]
+        )]
+    )
+
+    return fig
@@ -0,0 +1,110 @@
+"""
+Módulo de autoajuste de umbrales
+Elige, en esta máquina, el tamaño de corte a Insertion Sort de cada
+algoritmo híbrido: mide cada umbral candidato sobre los conjuntos de
+datos de GENERADORES y guarda el de menor tiempo total por algoritmo y
+tipo de elemento en resultados/umbrales.json
+
+Cada umbral se mide en modo calibrado (lotes de llamadas de duración
+mínima) y se toma el mínimo entre repeticiones: con una sola llamada
+por repetición las diferencias entre umbrales cercanos quedan por
+debajo del ruido y el umbral elegido cambiaría de una ejecución a otra.
+"""
+
+from typing import Callable, Dict, List
+
+import numpy as np
+
+from algoritmos.hibridos import guardar_umbrales, quick_sort_hibrido, merge_sort_hibrido
+from utils.generadores import generar_dataset_completo
+from utils.tipos_elemento import convertir_elementos
+from .medicion import medir_ejecucion
+
+# Algoritmos con umbral ajustable
+HIBRIDOS = {
+    'Quick Sort Híbrido': quick_sort_hibrido,
+    'Merge Sort Híbrido': merge_sort_hibrido
+}
+
+# Umbrales candidatos (1 equivale a no cortar nunca)
+CANDIDATOS = (1, 4, 8, 12, 16, 24, 32, 48, 64)
+
+# Duración mínima de cada lote cronometrado durante el ajuste (segundos)
+TIEMPO_MINIMO_AJUSTE = 0.05
+
+
+def ajustar_umbral(algoritmo: Callable, tamano: int = 2000,
+                   candidatos: tuple = CANDIDATOS,
+                   tipo_elemento: str = 'Entero',
+                   repeticiones: int = 3,
+                   tiempo_minimo: float = TIEMPO_MINIMO_AJUSTE) -> Dict:
+    """
+    Mide cada umbral candidato sobre todos los tipos de datos
+
+    Args:
+        algoritmo: Algoritmo híbrido que recibe el parámetro umbral
+        tamano: Tamaño de cada conjunto de datos
+        candidatos: Umbrales a probar
+        tipo_elemento: Tipo de los elementos (ver TIPOS_ELEMENTO)
+        repeticiones: Repeticiones por medición (se toma la mínima)
+        tiempo_minimo: Duración mínima de cada lote calibrado
+
+    Returns:
+        dict: mejor (umbral elegido) y tiempos ({umbral: tiempo total en
+              segundos por llamada sumando todos los tipos de datos})
+    """
+    datasets = generar_dataset_completo(tamano)
+    if tipo_elemento != 'Entero':
+        datasets = {tipo: convertir_elementos(datos, tipo_elemento)
+                    for tipo, datos in datasets.items()}
+
+    tiempos = {}
+    for umbral in candidatos:
+        def con_umbral(arr, contador=None, umbral=umbral):
+            return algoritmo(arr, umbral=umbral, contador=contador)
+
+        tiempos[umbral] = float(np.sum([
+            min(medir_ejecucion(con_umbral, datos, repeticiones, calibrado=True,
+                                tiempo_minimo=tiempo_minimo, verificar=False,
+                                contar=False)['tiempos'])
+            for datos in datasets.values()
+        ]))
+
+    return {
+        'mejor': min(tiempos, key=tiempos.get),
+        'tiempos': tiempos
+    }
+
+
+def autoajustar(algoritmos: List[str] = None,
+                tipos_elemento: List[str] = ('Entero',),
+                tamano: int = 2000,
+                candidatos: tuple = CANDIDATOS,
+                guardar: bool = True) -> Dict[str, Dict[str, Dict]]:
+    """
+    Ajusta el umbral de cada algoritmo híbrido para cada tipo de elemento
+
+    Args:
+        algoritmos: Nombres de HIBRIDOS a ajustar (por defecto, todos)
+        tipos_elemento: Tipos de elemento a ajustar
+        tamano: Tamaño de cada conjunto de datos
+        candidatos: Umbrales a probar
+        guardar: Si se persisten los umbrales elegidos
+
+    Returns:
+        dict: {algoritmo: {tipo_elemento: resultado de ajustar_umbral}}
+    """
+    resultados = {}
+    for nombre in algoritmos or list(HIBRIDOS):
+        resultados[nombre] = {
+            tipo: ajustar_umbral(HIBRIDOS[nombre], tamano, candidatos, tipo)
+            for tipo in tipos_elemento
+        }
+
+    if guardar:
+        guardar_umbrales({
+            nombre: {tipo: ajuste['mejor'] for tipo, ajuste in por_tipo.items()}
+            for nombre, por_tipo in resultados.items()
+        })
+
+    return resultados
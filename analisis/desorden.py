@@ -0,0 +1,174 @@
+"""
+Módulo de métricas de desorden (presortedness)
+Cuantifica qué tan ordenada está una entrada para relacionar el tiempo
+de ejecución con el desorden y no solo con el tamaño n
+
+Referencia:
+Estivill-Castro, V., & Wood, D. (1992). "A Survey of Adaptive Sorting
+Algorithms". ACM Computing Surveys, 24(4), 441-476.
+"""
+
+from bisect import bisect_left
+import numpy as np
+from typing import Dict, List
+
+
+def _rangos_densos(arr) -> np.ndarray:
+    """
+    Reemplaza cada valor por su rango denso (0 .. k-1), preservando el orden
+
+    Args:
+        arr: Arreglo de entrada (lista, array o ndarray), de números o de
+             cualquier elemento comparable (cadenas, tuplas, registros)
+
+    Returns:
+        ndarray: Rangos enteros de 64 bits
+    """
+    try:
+        valores = np.asarray(arr)
+    except ValueError:
+        # Secuencias de largo variable (tuplas de distinto tamaño)
+        valores = None
+
+    if valores is not None and valores.ndim == 1 and valores.dtype != object:
+        _, rangos = np.unique(valores, return_inverse=True)
+        return rangos.astype(np.int64).ravel()
+
+    # Tuplas (NumPy las convierte en una matriz) u objetos: ordenar los
+    # índices y asignar rangos comparando solo con <, sin exigir hash
+    orden = sorted(range(len(arr)), key=arr.__getitem__)
+    rangos = np.empty(len(arr), dtype=np.int64)
+    rango = -1
+    anterior = None
+    for i in orden:
+        if rango < 0 or anterior < arr[i]:
+            rango += 1
+            anterior = arr[i]
+        rangos[i] = rango
+    return rangos
+
+
+def contar_inversiones(arr) -> int:
+    """
+    Cuenta los pares (i, j) con i < j y arr[i] > arr[j] en O(n log n)
+
+    Usa un merge sort ascendente vectorizado: en cada nivel, para cada
+    elemento de la mitad derecha de un bloque se cuenta cuántos elementos
+    de la mitad izquierda son mayores mediante searchsorted.
+
+    Args:
+        arr: Arreglo de entrada
+
+    Returns:
+        int: Número de inversiones
+    """
+    n = len(arr)
+    if n < 2:
+        return 0
+
+    rangos = _rangos_densos(arr)
+    relleno = int(rangos.max()) + 1
+    base = relleno + 1
+
+    # Rellenar hasta potencia de 2 con un valor mayor que todos (al final
+    # no genera inversiones)
+    tamano = 1 << (n - 1).bit_length()
+    a = np.full(tamano, relleno, dtype=np.int64)
+    a[:n] = rangos
+
+    inversiones = 0
+    ancho = 1
+
+    while ancho < tamano:
+        filas = a.reshape(-1, 2 * ancho)
+        num_filas = filas.shape[0]
+
+        # Desplazar cada fila para que todas las mitades izquierdas
+        # formen un único arreglo ordenado global
+        desplazamiento = (np.arange(num_filas, dtype=np.int64) * base)[:, None]
+        izquierda = (filas[:, :ancho] + desplazamiento).ravel()
+        derecha = (filas[:, ancho:] + desplazamiento).ravel()
+
+        posiciones = np.searchsorted(izquierda, derecha, side='right')
+        inicio_fila = np.repeat(np.arange(num_filas, dtype=np.int64) * ancho, ancho)
+        inversiones += int((ancho - (posiciones - inicio_fila)).sum())
+
+        # Mezclar las dos mitades ya ordenadas (timsort detecta las corridas)
+        a = np.sort(filas, axis=1, kind='stable').ravel()
+        ancho *= 2
+
+    return inversiones
+
+
+def contar_corridas(arr) -> int:
+    """
+    Cuenta las corridas ascendentes maximales (no decrecientes)
+
+    Args:
+        arr: Arreglo de entrada
+
+    Returns:
+        int: Número de corridas (1 para un arreglo ordenado)
+    """
+    if len(arr) == 0:
+        return 0
+
+    rangos = _rangos_densos(arr)
+    return 1 + int(np.count_nonzero(np.diff(rangos) < 0))
+
+
+def longitud_subsecuencia_creciente(arr) -> int:
+    """
+    Calcula la longitud de la subsecuencia estrictamente creciente más larga
+    usando patience sorting en O(n log n)
+
+    Args:
+        arr: Arreglo de entrada
+
+    Returns:
+        int: Longitud de la LIS
+    """
+    colas: List[int] = []
+
+    for valor in _rangos_densos(arr).tolist():
+        pos = bisect_left(colas, valor)
+        if pos == len(colas):
+            colas.append(valor)
+        else:
+            colas[pos] = valor
+
+    return len(colas)
+
+
+def calcular_desorden(arr) -> Dict:
+    """
+    Calcula todas las métricas de desorden de un arreglo
+
+    Args:
+        arr: Arreglo de entrada
+
+    Returns:
+        dict: inversiones, inversiones normalizadas (0 = ordenado, 1 = inverso),
+              corridas, LIS y proporción de claves distintas
+    """
+    n = len(arr)
+    if n == 0:
+        return {
+            'inversiones': 0,
+            'inversiones_norm': 0.0,
+            'corridas': 0,
+            'lis': 0,
+            'ratio_distintos': 0.0
+        }
+
+    rangos = _rangos_densos(arr)
+    inversiones = contar_inversiones(rangos)
+    pares = n * (n - 1) // 2
+
+    return {
+        'inversiones': inversiones,
+        'inversiones_norm': inversiones / pares if pares > 0 else 0.0,
+        'corridas': contar_corridas(rangos),
+        'lis': longitud_subsecuencia_creciente(rangos),
+        'ratio_distintos': (int(rangos.max()) + 1) / n
+    }
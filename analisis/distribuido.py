@@ -0,0 +1,325 @@
+"""
+Módulo de barridos distribuidos
+Un coordinador reparte las celdas de un barrido (algoritmo × tipo de
+datos × tamaño) entre procesos trabajadores conectados por TCP con
+multiprocessing.managers. Cada trabajador toma celdas de la cola, las
+mide con medir_celda (los datos se generan en el trabajador a partir de
+la semilla, así que no viajan por la red) y devuelve cada resultado
+apenas lo obtiene, etiquetado con su equipo y proceso.
+
+Los trabajadores pueden ser procesos locales (para probar en una sola
+máquina) o procesos en otros equipos con una copia del proyecto:
+    DISTRIBUIDO_CLAVE=secreto python -m analisis.trabajador 192.168.0.10:50000
+
+Cada trabajador anota en el coordinador la celda que está midiendo y
+emite un latido periódico; si un trabajador local termina o uno remoto
+deja de latir, su celda en curso vuelve a la cola para otro trabajador.
+
+La conexión se autentica con la clave compartida, pero los mensajes
+viajan serializados con pickle: el coordinador solo debe escuchar en
+redes de confianza (por defecto escucha en 127.0.0.1).
+"""
+
+import os
+import queue
+import socket
+import subprocess
+import sys
+import threading
+import time
+from multiprocessing.managers import BaseManager, DictProxy
+from typing import Callable, Dict, List, Tuple
+
+from .entorno import RAIZ_PROYECTO
+
+# Dirección por defecto del coordinador (puerto 0: el sistema elige uno libre)
+DIRECCION_PREDETERMINADA = ('127.0.0.1', 0)
+
+# Clave compartida por defecto (cámbiese con DISTRIBUIDO_CLAVE fuera de 127.0.0.1)
+CLAVE_PREDETERMINADA = b'ordenamiento'
+
+# Segundos que un trabajador espera una celda antes de revisar si debe terminar
+ESPERA_TRABAJO = 0.5
+
+# Segundos entre latidos de un trabajador
+INTERVALO_LATIDO = 2.0
+
+# Segundos sin latidos tras los que un trabajador se da por caído
+TIEMPO_SIN_LATIDO = 15.0
+
+# Colas, celdas en curso, latidos y señal de término; solo los usa el
+# proceso servidor del coordinador
+_trabajos = queue.Queue()
+_resultados = queue.Queue()
+_en_curso = {}
+_latidos = {}
+_detener = threading.Event()
+
+
+def _obtener_trabajos():
+    return _trabajos
+
+
+def _obtener_resultados():
+    return _resultados
+
+
+def _obtener_en_curso():
+    return _en_curso
+
+
+def _obtener_latidos():
+    return _latidos
+
+
+def _obtener_detener():
+    return _detener
+
+
+class GestorDistribuido(BaseManager):
+    """Servidor de las colas de trabajos y resultados de un barrido distribuido"""
+
+
+GestorDistribuido.register('trabajos', callable=_obtener_trabajos)
+GestorDistribuido.register('resultados', callable=_obtener_resultados)
+GestorDistribuido.register('en_curso', callable=_obtener_en_curso, proxytype=DictProxy)
+GestorDistribuido.register('latidos', callable=_obtener_latidos, proxytype=DictProxy)
+GestorDistribuido.register('detener', callable=_obtener_detener)
+
+
+def _clave_entorno() -> bytes:
+    """Clave compartida de DISTRIBUIDO_CLAVE o CLAVE_PREDETERMINADA"""
+    clave = os.environ.get('DISTRIBUIDO_CLAVE')
+    return clave.encode() if clave else CLAVE_PREDETERMINADA
+
+
+def _latir(latidos, trabajador: str, fin: threading.Event):
+    """Incrementa el latido del trabajador cada INTERVALO_LATIDO segundos"""
+    latido = 0
+    while not fin.wait(INTERVALO_LATIDO):
+        latido += 1
+        try:
+            latidos[trabajador] = latido
+        except (EOFError, ConnectionError):
+            return
+
+
+def ejecutar_trabajador(direccion: Tuple[str, int], clave: bytes = None) -> int:
+    """
+    Toma celdas del coordinador y las mide hasta que este indique terminar
+
+    Args:
+        direccion: (equipo, puerto) del coordinador
+        clave: Clave compartida (por defecto, la del entorno)
+
+    Returns:
+        int: Número de celdas medidas
+    """
+    from .experimentos import medir_celda
+
+    gestor = GestorDistribuido(address=tuple(direccion), authkey=clave or _clave_entorno())
+    gestor.connect()
+    trabajos = gestor.trabajos()
+    resultados = gestor.resultados()
+    en_curso = gestor.en_curso()
+    detener = gestor.detener()
+
+    equipo = socket.gethostname()
+    trabajador = f"{equipo}:{os.getpid()}"
+    etiqueta = {'equipo': equipo, 'trabajador': trabajador}
+    medidas = 0
+
+    # Los latidos van en otro hilo (con su propia conexión) para que el
+    # coordinador distinga una celda larga de un trabajador caído
+    fin = threading.Event()
+    threading.Thread(target=_latir, args=(gestor.latidos(), trabajador, fin),
+                     daemon=True).start()
+
+    try:
+        while True:
+            try:
+                trabajo = trabajos.get(timeout=ESPERA_TRABAJO)
+            except queue.Empty:
+                if detener.is_set():
+                    return medidas
+                continue
+            except (EOFError, ConnectionError):
+                # El coordinador terminó
+                return medidas
+
+            en_curso[trabajador] = trabajo
+            try:
+                resultado = medir_celda(**trabajo)
+            except Exception as error:
+                resultado = {**trabajo, 'error': f"{type(error).__name__}: {error}"}
+            resultados.put({**resultado, **etiqueta})
+            en_curso.pop(trabajador, None)
+            medidas += 1
+    finally:
+        fin.set()
+
+
+def _recuperar_caidos(trabajos, en_curso, latidos, locales: Dict[str, subprocess.Popen],
+                      vistos: Dict[str, Tuple[int, float]]) -> int:
+    """
+    Devuelve a la cola las celdas en curso de trabajadores caídos: locales
+    cuyo proceso terminó o cualquiera sin latidos en TIEMPO_SIN_LATIDO
+    segundos (medidos con el reloj del coordinador)
+
+    Args:
+        vistos: {trabajador: (último latido, instante en que se vio)}, se actualiza
+
+    Returns:
+        int: Celdas devueltas a la cola
+    """
+    ahora = time.monotonic()
+    actuales = latidos.copy()
+    devueltas = 0
+
+    for trabajador, trabajo in en_curso.copy().items():
+        latido = actuales.get(trabajador, 0)
+        if trabajador not in vistos or vistos[trabajador][0] != latido:
+            vistos[trabajador] = (latido, ahora)
+
+        proceso = locales.get(trabajador)
+        caido = proceso.poll() is not None if proceso else \
+            ahora - vistos[trabajador][1] > TIEMPO_SIN_LATIDO
+        if caido:
+            en_curso.pop(trabajador, None)
+            trabajos.put(trabajo)
+            devueltas += 1
+
+    return devueltas
+
+
+def _lanzar_trabajador_local(direccion: Tuple[str, int], clave: bytes) -> subprocess.Popen:
+    """Inicia un trabajador en un proceso nuevo de esta máquina"""
+    equipo, puerto = direccion
+    if equipo in ('', '0.0.0.0'):
+        equipo = '127.0.0.1'
+    return subprocess.Popen(
+        [sys.executable, '-m', 'analisis.trabajador', f"{equipo}:{puerto}"],
+        cwd=RAIZ_PROYECTO,
+        env={**os.environ, 'DISTRIBUIDO_CLAVE': clave.decode()},
+        stdout=subprocess.DEVNULL
+    )
+
+
+def ejecutar_distribuido(algoritmos: List[str],
+                         tipos_datos: List[str],
+                         tamanos: List[int],
+                         repeticiones: int = 3,
+                         semilla: int = 0,
+                         formato: str = 'lista',
+                         trabajadores_locales: int = 2,
+                         direccion: Tuple[str, int] = DIRECCION_PREDETERMINADA,
+                         clave: bytes = None,
+                         tiempo_limite: float = None,
+                         al_avanzar: Callable = None) -> Dict[str, Dict[str, List[Dict]]]:
+    """
+    Coordina un barrido repartido entre trabajadores locales y remotos
+
+    Las celdas se encolan de mayor a menor tamaño para que las más largas
+    no queden para el final. Los trabajadores locales comparten CPU y
+    caché, así que conviene no lanzar más que núcleos físicos libres.
+    La celda en curso de un trabajador caído se vuelve a encolar; si
+    llega más de un resultado para una celda se conserva el primero.
+
+    Args:
+        algoritmos: Nombres de algoritmos (claves de ALGORITMOS)
+        tipos_datos: Nombres de tipos de datos (claves de TIPOS_DATOS)
+        tamanos: Tamaños de entrada
+        repeticiones: Repeticiones por celda
+        semilla: Semilla para generar los datos de forma reproducible
+        formato: Representación en memoria de los datos
+        trabajadores_locales: Trabajadores a lanzar en esta máquina (0 si
+                              solo se conectan trabajadores remotos)
+        direccion: (equipo, puerto) en que escucha el coordinador; use
+                   ('0.0.0.0', puerto) para aceptar trabajadores remotos
+        clave: Clave compartida (por defecto, la del entorno)
+        tiempo_limite: Segundos máximos para todo el barrido (None para no limitar)
+        al_avanzar: Función opcional llamada como al_avanzar(hechas, total, resultado)
+
+    Returns:
+        dict: {tipo_datos: {algoritmo: [resultado por tamaño]}}, el formato
+              de cargar_barrido, donde cada resultado incluye 'equipo' y
+              'trabajador'
+    """
+    from .experimentos import definir_matriz
+
+    matriz = definir_matriz(algoritmos, tipos_datos, tamanos)
+    clave = clave or _clave_entorno()
+
+    gestor = GestorDistribuido(address=tuple(direccion), authkey=clave)
+    gestor.start()
+    locales = []
+    try:
+        trabajos = gestor.trabajos()
+        cola_resultados = gestor.resultados()
+        en_curso = gestor.en_curso()
+        latidos = gestor.latidos()
+        for algoritmo, tipo_datos, tamano in sorted(matriz, key=lambda celda: -celda[2]):
+            trabajos.put({
+                'algoritmo': algoritmo,
+                'tipo_datos': tipo_datos,
+                'tamano': tamano,
+                'repeticiones': repeticiones,
+                'semilla': semilla,
+                'formato': formato
+            })
+
+        # Los trabajadores locales se conectan a la dirección real (con el puerto elegido)
+        locales = [_lanzar_trabajador_local(gestor.address, clave)
+                   for _ in range(trabajadores_locales)]
+
+        equipo = socket.gethostname()
+        por_trabajador = {f"{equipo}:{proceso.pid}": proceso for proceso in locales}
+        vistos = {}
+        completas = set()
+
+        limite = time.monotonic() + tiempo_limite if tiempo_limite else None
+        resultados = {}
+        hechas = 0
+        while hechas < len(matriz):
+            try:
+                resultado = cola_resultados.get(timeout=ESPERA_TRABAJO)
+            except queue.Empty:
+                _recuperar_caidos(trabajos, en_curso, latidos, por_trabajador, vistos)
+                if limite is not None and time.monotonic() > limite:
+                    raise TimeoutError(f"El barrido distribuido superó {tiempo_limite} s "
+                                       f"({hechas} de {len(matriz)} celdas)")
+                if locales and all(p.poll() is not None for p in locales):
+                    raise RuntimeError("Todos los trabajadores locales terminaron antes de completar el barrido")
+                continue
+
+            if 'error' in resultado:
+                raise RuntimeError(
+                    f"La celda {resultado['algoritmo']} / {resultado['tipo_datos']} / "
+                    f"{resultado['tamano']} falló en {resultado['trabajador']}: {resultado['error']}"
+                )
+
+            celda = (resultado['algoritmo'], resultado['tipo_datos'], resultado['tamano'])
+            if celda in completas:
+                # Celda reencolada cuyo primer trabajador sí terminó
+                continue
+            completas.add(celda)
+
+            resultados.setdefault(resultado['tipo_datos'], {}) \
+                      .setdefault(resultado['algoritmo'], []).append(resultado)
+            hechas += 1
+            if al_avanzar:
+                al_avanzar(hechas, len(matriz), resultado)
+    finally:
+        gestor.detener().set()
+        for proceso in locales:
+            try:
+                proceso.wait(timeout=5 * ESPERA_TRABAJO + 5)
+            except subprocess.TimeoutExpired:
+                proceso.kill()
+        gestor.shutdown()
+
+    for por_algoritmo in resultados.values():
+        for datos in por_algoritmo.values():
+            datos.sort(key=lambda r: r['tamano'])
+
+    return resultados
@@ -0,0 +1,110 @@
+"""
+Módulo de metadatos del entorno de medición
+Registra dónde y cómo se obtuvieron los resultados para poder
+compararlos entre ejecuciones, días y máquinas
+"""
+
+import os
+import platform
+import subprocess
+import sys
+from datetime import datetime
+from typing import Dict, Optional
+
+import numpy as np
+
+# Raíz del proyecto (para consultar la revisión de git)
+RAIZ_PROYECTO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _leer_archivo(ruta: str) -> Optional[str]:
+    """Lee un archivo de texto pequeño (por ejemplo, de /proc o /sys)"""
+    try:
+        with open(ruta) as archivo:
+            return archivo.read().strip()
+    except OSError:
+        return None
+
+
+def obtener_modelo_cpu() -> str:
+    """
+    Modelo de la CPU según /proc/cpuinfo (Linux) o platform.processor()
+
+    Returns:
+        str: Nombre del modelo
+    """
+    contenido = _leer_archivo('/proc/cpuinfo')
+    if contenido:
+        for linea in contenido.splitlines():
+            if linea.startswith('model name'):
+                return linea.split(':', 1)[1].strip()
+    return platform.processor() or platform.machine()
+
+
+def obtener_frecuencia_cpu(cpu: int = 0) -> Dict:
+    """
+    Gobernador de frecuencia y frecuencia actual de una CPU (Linux)
+
+    Args:
+        cpu: Índice de la CPU
+
+    Returns:
+        dict: 'gobernador' y 'frecuencia_mhz' (None si no están disponibles)
+    """
+    base = f'/sys/devices/system/cpu/cpu{cpu}/cpufreq'
+    frecuencia = _leer_archivo(os.path.join(base, 'scaling_cur_freq'))
+
+    return {
+        'gobernador': _leer_archivo(os.path.join(base, 'scaling_governor')),
+        'frecuencia_mhz': int(frecuencia) / 1000 if frecuencia and frecuencia.isdigit() else None
+    }
+
+
+def obtener_revision_git() -> Dict:
+    """
+    Revisión de git del proyecto y si hay cambios sin confirmar
+
+    Returns:
+        dict: 'revision' y 'modificado' (None si git no está disponible)
+    """
+    try:
+        revision = subprocess.run(
+            ['git', 'rev-parse', 'HEAD'], cwd=RAIZ_PROYECTO,
+            capture_output=True, text=True, timeout=10, check=True
+        ).stdout.strip()
+        estado = subprocess.run(
+            ['git', 'status', '--porcelain', '--untracked-files=no'], cwd=RAIZ_PROYECTO,
+            capture_output=True, text=True, timeout=10, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        return {'revision': None, 'modificado': None}
+
+    return {'revision': revision, 'modificado': bool(estado)}
+
+
+def obtener_metadatos_entorno() -> Dict:
+    """
+    Recoge información del intérprete, la plataforma, la CPU, la carga del
+    sistema, la revisión del código y la fecha
+
+    Returns:
+        dict: Metadatos serializables a JSON
+    """
+    carga = os.getloadavg() if hasattr(os, 'getloadavg') else None
+
+    return {
+        'python': platform.python_version(),
+        'implementacion': platform.python_implementation(),
+        'ejecutable': sys.executable,
+        'plataforma': platform.platform(),
+        'maquina': platform.machine(),
+        'procesador': platform.processor(),
+        'modelo_cpu': obtener_modelo_cpu(),
+        **obtener_frecuencia_cpu(),
+        'nodo': platform.node(),
+        'num_cpus': os.cpu_count(),
+        'carga_promedio': list(carga) if carga else None,
+        'numpy': np.__version__,
+        **obtener_revision_git(),
+        'fecha': datetime.now().isoformat(timespec='seconds')
+    }
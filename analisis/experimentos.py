@@ -0,0 +1,396 @@
+"""
+Módulo de barridos de experimentos reanudables
+Define un barrido como una matriz (algoritmo × tipo de datos × tamaño) y
+guarda cada celda en una base de datos SQLite local apenas se mide, junto
+con los metadatos del entorno. Al repetir un barrido solo se miden las
+celdas que faltan, y los barridos anteriores pueden cargarse sin volver
+a medir.
+"""
+
+import json
+import os
+import sqlite3
+import zlib
+from datetime import datetime
+from itertools import product
+from typing import Callable, Dict, List, Tuple, Union
+
+from algoritmos import ALGORITMOS
+from utils.adversarios import ADVERSARIOS
+from utils.buffers import convertir_formato
+from utils.generadores import GENERADORES
+from .desorden import calcular_desorden
+from .entorno import obtener_metadatos_entorno
+from .medicion import medir_ejecucion
+
+RUTA_BD_PREDETERMINADA = os.path.join('resultados', 'experimentos.db')
+
+# Tipos de datos disponibles por nombre (generadores y adversarios)
+TIPOS_DATOS = {**GENERADORES, **ADVERSARIOS}
+
+ESQUEMA = """
+CREATE TABLE IF NOT EXISTS barridos (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    nombre TEXT UNIQUE NOT NULL,
+    creado TEXT NOT NULL,
+    repeticiones INTEGER NOT NULL,
+    semilla INTEGER NOT NULL,
+    formato TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS sesiones (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    barrido_id INTEGER NOT NULL REFERENCES barridos(id),
+    inicio TEXT NOT NULL,
+    entorno TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS celdas (
+    barrido_id INTEGER NOT NULL REFERENCES barridos(id),
+    algoritmo TEXT NOT NULL,
+    tipo_datos TEXT NOT NULL,
+    tamano INTEGER NOT NULL,
+    sesion_id INTEGER NOT NULL REFERENCES sesiones(id),
+    tiempo REAL NOT NULL,
+    desviacion REAL NOT NULL,
+    tiempos TEXT NOT NULL,
+    comparaciones INTEGER NOT NULL,
+    operaciones INTEGER NOT NULL,
+    desorden TEXT NOT NULL,
+    valido INTEGER,
+    completado TEXT NOT NULL,
+    PRIMARY KEY (barrido_id, algoritmo, tipo_datos, tamano)
+);
+"""
+
+
+def conectar(ruta_bd: str = RUTA_BD_PREDETERMINADA) -> sqlite3.Connection:
+    """
+    Abre (y crea si no existe) la base de datos de resultados
+
+    Args:
+        ruta_bd: Ruta del archivo SQLite
+
+    Returns:
+        Connection: Conexión con filas accesibles por nombre de columna
+    """
+    directorio = os.path.dirname(ruta_bd)
+    if directorio:
+        os.makedirs(directorio, exist_ok=True)
+
+    conexion = sqlite3.connect(ruta_bd)
+    conexion.row_factory = sqlite3.Row
+    conexion.executescript(ESQUEMA)
+
+    # Bases creadas antes de guardar la verificación de cada celda
+    columnas = {fila['name'] for fila in conexion.execute("PRAGMA table_info(celdas)")}
+    if 'valido' not in columnas:
+        conexion.execute("ALTER TABLE celdas ADD COLUMN valido INTEGER")
+        conexion.commit()
+    return conexion
+
+
+def definir_matriz(algoritmos: List[str], tipos_datos: List[str],
+                   tamanos: List[int]) -> List[Tuple[str, str, int]]:
+    """
+    Enumera las celdas de un barrido
+
+    Args:
+        algoritmos: Nombres de algoritmos (claves de ALGORITMOS)
+        tipos_datos: Nombres de tipos de datos (claves de TIPOS_DATOS)
+        tamanos: Tamaños de entrada
+
+    Returns:
+        list: Tuplas (algoritmo, tipo_datos, tamano)
+    """
+    for nombre in algoritmos:
+        if nombre not in ALGORITMOS:
+            raise ValueError(f"Algoritmo desconocido: {nombre}")
+    for tipo in tipos_datos:
+        if tipo not in TIPOS_DATOS:
+            raise ValueError(f"Tipo de datos desconocido: {tipo}")
+
+    return list(product(algoritmos, tipos_datos, sorted(tamanos)))
+
+
+def semilla_celda(semilla: int, tipo_datos: str, tamano: int) -> int:
+    """
+    Deriva la semilla de los datos de una celda
+
+    No depende del algoritmo: todos los algoritmos de una misma fila
+    (tipo de datos, tamaño) reciben exactamente la misma entrada.
+    """
+    return (semilla ^ zlib.crc32(f'{tipo_datos}|{tamano}'.encode())) & 0xFFFFFFFF
+
+
+def generar_datos_celda(tipo_datos: str, tamano: int, semilla: int = 0,
+                        formato: str = 'lista'):
+    """
+    Genera de forma reproducible los datos de entrada de una celda
+
+    Args:
+        tipo_datos: Nombre del tipo de datos (clave de TIPOS_DATOS)
+        tamano: Tamaño de entrada
+        semilla: Semilla del barrido
+        formato: Representación en memoria ('lista', 'array' o 'numpy')
+
+    Returns:
+        Arreglo de entrada
+    """
+    if tipo_datos in ADVERSARIOS:
+        # Los adversarios son deterministas
+        return convertir_formato(ADVERSARIOS[tipo_datos](tamano), formato)
+
+    # Generadores locales: no alteran el estado global de random/np.random
+    # del que dependen los pivotes aleatorios de las mediciones posteriores
+    semilla_datos = semilla_celda(semilla, tipo_datos, tamano)
+    return GENERADORES[tipo_datos](tamano, formato=formato, semilla=semilla_datos)
+
+
+def medir_celda(algoritmo: str, tipo_datos: str, tamano: int,
+                repeticiones: int = 3, semilla: int = 0,
+                formato: str = 'lista') -> Dict:
+    """
+    Mide una celda del barrido con datos reproducibles
+
+    Args:
+        algoritmo: Nombre del algoritmo (clave de ALGORITMOS)
+        tipo_datos: Nombre del tipo de datos (clave de TIPOS_DATOS)
+        tamano: Tamaño de entrada
+        repeticiones: Número de repeticiones
+        semilla: Semilla del barrido
+        formato: Representación en memoria de los datos
+
+    Returns:
+        dict: Resultado con el mismo formato que analizar_complejidad
+    """
+    datos = generar_datos_celda(tipo_datos, tamano, semilla, formato)
+    medicion = medir_ejecucion(ALGORITMOS[algoritmo], datos, repeticiones)
+
+    return {
+        'algoritmo': algoritmo,
+        'tipo_datos': tipo_datos,
+        'tamano': tamano,
+        'tiempo': float(medicion['tiempo']),
+        'desviacion': float(medicion['desviacion']),
+        'tiempos': medicion['tiempos'],
+        'comparaciones': medicion['comparaciones'],
+        'operaciones': medicion['operaciones'],
+        'valido': medicion['valido'],
+        **calcular_desorden(datos)
+    }
+
+
+def _obtener_barrido(conexion: sqlite3.Connection, nombre: str, repeticiones: int,
+                     semilla: int, formato: str) -> int:
+    """
+    Retorna el id del barrido, creándolo si no existe
+
+    Un barrido existente solo puede reanudarse con los mismos parámetros.
+    """
+    fila = conexion.execute(
+        "SELECT id, repeticiones, semilla, formato FROM barridos WHERE nombre = ?",
+        (nombre,)
+    ).fetchone()
+
+    if fila is None:
+        cursor = conexion.execute(
+            "INSERT INTO barridos (nombre, creado, repeticiones, semilla, formato) "
+            "VALUES (?, ?, ?, ?, ?)",
+            (nombre, datetime.now().isoformat(timespec='seconds'), repeticiones, semilla, formato)
+        )
+        conexion.commit()
+        return cursor.lastrowid
+
+    if (fila['repeticiones'], fila['semilla'], fila['formato']) != (repeticiones, semilla, formato):
+        raise ValueError(
+            f"El barrido '{nombre}' ya existe con repeticiones={fila['repeticiones']}, "
+            f"semilla={fila['semilla']} y formato={fila['formato']}"
+        )
+    return fila['id']
+
+
+def guardar_celda(conexion: sqlite3.Connection, barrido_id: int, sesion_id: int,
+                  resultado: Dict):
+    """
+    Persiste el resultado de una celda (confirmando la transacción); valido
+    se guarda como 1/0, o NULL si la salida no se verificó
+    """
+    desorden = {
+        clave: resultado[clave]
+        for clave in ('inversiones', 'inversiones_norm', 'corridas', 'lis', 'ratio_distintos')
+        if clave in resultado
+    }
+    valido = resultado.get('valido')
+
+    conexion.execute(
+        "INSERT OR REPLACE INTO celdas (barrido_id, algoritmo, tipo_datos, tamano, sesion_id, "
+        "tiempo, desviacion, tiempos, comparaciones, operaciones, desorden, valido, completado) "
+        "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+        (
+            barrido_id, resultado['algoritmo'], resultado['tipo_datos'], resultado['tamano'],
+            sesion_id, resultado['tiempo'], resultado['desviacion'],
+            json.dumps(resultado['tiempos']), resultado['comparaciones'],
+            resultado['operaciones'], json.dumps(desorden),
+            None if valido is None else int(bool(valido)),
+            datetime.now().isoformat(timespec='seconds')
+        )
+    )
+    conexion.commit()
+
+
+def ejecutar_barrido(nombre: str,
+                     algoritmos: List[str],
+                     tipos_datos: List[str],
+                     tamanos: List[int],
+                     repeticiones: int = 3,
+                     semilla: int = 0,
+                     formato: str = 'lista',
+                     ruta_bd: str = RUTA_BD_PREDETERMINADA,
+                     al_avanzar: Callable = None) -> Dict:
+    """
+    Ejecuta (o reanuda) un barrido, guardando cada celda al completarla
+
+    Args:
+        nombre: Nombre único del barrido
+        algoritmos: Nombres de algoritmos (claves de ALGORITMOS)
+        tipos_datos: Nombres de tipos de datos (claves de TIPOS_DATOS)
+        tamanos: Tamaños de entrada
+        repeticiones: Repeticiones por celda
+        semilla: Semilla para generar los datos de forma reproducible
+        formato: Representación en memoria de los datos
+        ruta_bd: Ruta de la base de datos SQLite
+        al_avanzar: Función opcional llamada como al_avanzar(hechas, total, celda)
+
+    Returns:
+        dict: barrido_id, total de celdas, celdas medidas y celdas omitidas
+    """
+    matriz = definir_matriz(algoritmos, tipos_datos, tamanos)
+
+    conexion = conectar(ruta_bd)
+    try:
+        barrido_id = _obtener_barrido(conexion, nombre, repeticiones, semilla, formato)
+
+        # Una celda cuya salida falló la verificación no cuenta como
+        # completa: se vuelve a medir al reanudar
+        completas = {
+            (fila['algoritmo'], fila['tipo_datos'], fila['tamano'])
+            for fila in conexion.execute(
+                "SELECT algoritmo, tipo_datos, tamano FROM celdas "
+                "WHERE barrido_id = ? AND (valido IS NULL OR valido != 0)",
+                (barrido_id,)
+            )
+        }
+        pendientes = [celda for celda in matriz if celda not in completas]
+
+        sesion_id = None
+        if pendientes:
+            cursor = conexion.execute(
+                "INSERT INTO sesiones (barrido_id, inicio, entorno) VALUES (?, ?, ?)",
+                (barrido_id, datetime.now().isoformat(timespec='seconds'),
+                 json.dumps(obtener_metadatos_entorno()))
+            )
+            conexion.commit()
+            sesion_id = cursor.lastrowid
+
+        hechas = len(matriz) - len(pendientes)
+        for celda in pendientes:
+            resultado = medir_celda(*celda, repeticiones=repeticiones,
+                                    semilla=semilla, formato=formato)
+            guardar_celda(conexion, barrido_id, sesion_id, resultado)
+
+            hechas += 1
+            if al_avanzar:
+                al_avanzar(hechas, len(matriz), celda)
+    finally:
+        conexion.close()
+
+    return {
+        'barrido_id': barrido_id,
+        'total': len(matriz),
+        'medidas': len(pendientes),
+        'omitidas': len(matriz) - len(pendientes)
+    }
+
+
+def listar_barridos(ruta_bd: str = RUTA_BD_PREDETERMINADA) -> List[Dict]:
+    """
+    Lista los barridos guardados con su número de celdas completas
+
+    Args:
+        ruta_bd: Ruta de la base de datos SQLite
+
+    Returns:
+        list: Diccionarios con id, nombre, creado, repeticiones, semilla,
+              formato, celdas y entorno de la última sesión
+    """
+    if not os.path.exists(ruta_bd):
+        return []
+
+    conexion = conectar(ruta_bd)
+    try:
+        filas = conexion.execute("""
+            SELECT b.id, b.nombre, b.creado, b.repeticiones, b.semilla, b.formato,
+                   (SELECT COUNT(*) FROM celdas c WHERE c.barrido_id = b.id
+                    AND (c.valido IS NULL OR c.valido != 0)) AS celdas,
+                   (SELECT s.entorno FROM sesiones s WHERE s.barrido_id = b.id
+                    ORDER BY s.id DESC LIMIT 1) AS entorno
+            FROM barridos b
+            ORDER BY b.id
+        """).fetchall()
+    finally:
+        conexion.close()
+
+    return [
+        {**dict(fila), 'entorno': json.loads(fila['entorno']) if fila['entorno'] else {}}
+        for fila in filas
+    ]
+
+
+def cargar_barrido(barrido: Union[str, int],
+                   ruta_bd: str = RUTA_BD_PREDETERMINADA,
+                   algoritmos: List[str] = None,
+                   tamanos: List[int] = None) -> Dict[str, Dict[str, List[Dict]]]:
+    """
+    Carga los resultados de un barrido sin volver a medir
+
+    Args:
+        barrido: Nombre o id del barrido
+        ruta_bd: Ruta de la base de datos SQLite
+        algoritmos: Algoritmos a cargar (por defecto, todos los del barrido)
+        tamanos: Tamaños a cargar (por defecto, todos los del barrido)
+
+    Returns:
+        dict: {tipo_datos: {algoritmo: [resultado por tamaño]}}, donde cada
+              lista tiene el formato de analizar_complejidad
+    """
+    columna = 'id' if isinstance(barrido, int) else 'nombre'
+
+    conexion = conectar(ruta_bd)
+    try:
+        filas = conexion.execute(f"""
+            SELECT c.* FROM celdas c JOIN barridos b ON b.id = c.barrido_id
+            WHERE b.{columna} = ?
+            ORDER BY c.tipo_datos, c.algoritmo, c.tamano
+        """, (barrido,)).fetchall()
+    finally:
+        conexion.close()
+
+    resultados = {}
+    for fila in filas:
+        if algoritmos is not None and fila['algoritmo'] not in algoritmos:
+            continue
+        if tamanos is not None and fila['tamano'] not in tamanos:
+            continue
+        resultados.setdefault(fila['tipo_datos'], {}).setdefault(fila['algoritmo'], []).append({
+            'tamano': fila['tamano'],
+            'tiempo': fila['tiempo'],
+            'desviacion': fila['desviacion'],
+            'tiempos': json.loads(fila['tiempos']),
+            'comparaciones': fila['comparaciones'],
+            'operaciones': fila['operaciones'],
+            'valido': None if fila['valido'] is None else bool(fila['valido']),
+            **json.loads(fila['desorden'])
+        })
+
+    return resultados
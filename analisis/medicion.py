@@ -3,22 +3,93 @@ Módulo de medición y análisis de algoritmos
 Permite medir tiempos de ejecución y analizar complejidad
 """
 
+import os
 import time
+from concurrent.futures import ProcessPoolExecutor
 import numpy as np
 from typing import Callable, List, Tuple, Dict
 
+from algoritmos import SOLO_ENTEROS, VERSIONES_IN_PLACE, merge_sort, quick_sort, quickselect, top_k
+from algoritmos.incremental import CONTENEDORES_INCREMENTALES
+from algoritmos.contadores import ContadorOperaciones, acepta_contador
+from utils.buffers import convertir_formato, copiar_arreglo, restaurar_arreglo
+from utils.tipos_elemento import convertir_elementos
+from .desorden import calcular_desorden
+from .memoria import medir_memoria_pico
+from .perfilado import perfilar_ejecucion
+from .verificacion import huella_multiconjunto, verificar_ordenamiento, verificar_estabilidad
 
-def medir_tiempo(algoritmo: Callable, arr: List, repeticiones: int = 3) -> Tuple:
+
+# Tiempo mínimo por bloque cronometrado en el modo calibrado (segundos)
+TIEMPO_MINIMO_BLOQUE = 0.2
+
+# Máximo de elementos que se copian por lote en el modo calibrado
+MAX_ELEMENTOS_LOTE = 5_000_000
+
+
+def _sin_operacion(arr):
+    """Algoritmo vacío con el mismo contrato, para medir la sobrecarga del lazo"""
+    return arr, 0, 0
+
+
+def _sin_operacion_in_place(arr):
+    """Versión en el lugar de _sin_operacion"""
+    return 0, 0
+
+
+def _contar_operaciones(algoritmo: Callable, arr: List):
     """
-    Mide el tiempo de ejecución de un algoritmo
+    Ejecuta el algoritmo una vez más, fuera del tiempo medido, con un
+    ContadorOperaciones: las llamadas cronometradas no reciben contador,
+    así el registro por partición o por nivel de recursión no infla el
+    tiempo
     
-    Args:
-        algoritmo: Función del algoritmo a medir
-        arr: Arreglo de entrada
-        repeticiones: Número de veces que se ejecuta para promediar
-        
     Returns:
-        tuple: (tiempo_promedio, desviacion_estandar, resultado, comparaciones, operaciones)
+        tuple: (metricas, comparaciones, operaciones) de esa ejecución, o
+               None si el algoritmo no acepta contador
+    """
+    if not acepta_contador(algoritmo):
+        return None
+    
+    contador = ContadorOperaciones()
+    _, comparaciones, operaciones = algoritmo(copiar_arreglo(arr), contador=contador)
+    return contador.metricas(), comparaciones, operaciones
+
+
+def _medir_in_place(en_sitio: Callable, arr: List, repeticiones: int) -> Dict:
+    """
+    Cronometra una llamada por repetición sobre un único arreglo de
+    trabajo, restaurado desde la entrada antes de cada repetición (fuera
+    del intervalo cronometrado): el tiempo medido es solo el ordenamiento
+    """
+    tiempos = []
+    comparaciones = 0
+    operaciones = 0
+    trabajo = copiar_arreglo(arr)
+    
+    for repeticion in range(repeticiones):
+        if repeticion:
+            restaurar_arreglo(trabajo, arr)
+        
+        inicio = time.perf_counter()
+        comparaciones, operaciones = en_sitio(trabajo)
+        fin = time.perf_counter()
+        
+        tiempos.append(fin - inicio)
+    
+    return {
+        'tiempos': tiempos,
+        'resultado': trabajo,
+        'comparaciones': comparaciones,
+        'operaciones': operaciones,
+        'bucles': 1,
+        'sobrecarga': 0.0
+    }
+
+
+def _medir_simple(algoritmo: Callable, arr: List, repeticiones: int) -> Dict:
+    """
+    Cronometra una llamada por repetición
     """
     tiempos = []
     resultado = None
@@ -26,7 +97,7 @@ def medir_tiempo(algoritmo: Callable, arr: List, repeticiones: int = 3) -> Tuple
     operaciones = 0
     
     for _ in range(repeticiones):
-        arr_copia = arr.copy()
+        arr_copia = copiar_arreglo(arr)
         
         inicio = time.perf_counter()
         resultado, comp, ops = algoritmo(arr_copia)
@@ -36,15 +107,238 @@ def medir_tiempo(algoritmo: Callable, arr: List, repeticiones: int = 3) -> Tuple
         comparaciones = comp
         operaciones = ops
     
-    tiempo_promedio = np.mean(tiempos)
-    desviacion = np.std(tiempos)
+    return {
+        'tiempos': tiempos,
+        'resultado': resultado,
+        'comparaciones': comparaciones,
+        'operaciones': operaciones,
+        'bucles': 1,
+        'sobrecarga': 0.0
+    }
+
+
+def _cronometrar_lote(algoritmo: Callable, arr: List, bucles: int,
+                      en_sitio: bool = False) -> Tuple:
+    """
+    Ejecuta el algoritmo sobre un lote de copias construido fuera del
+    intervalo cronometrado
+    
+    Args:
+        en_sitio: Si el algoritmo es una versión en el lugar, que ordena
+                  cada copia y retorna solo (comparaciones, operaciones)
+    
+    Returns:
+        tuple: (tiempo_total_del_lote, ultima_salida_del_algoritmo),
+               con la salida en el formato (arreglo, comparaciones, operaciones)
+    """
+    copias = [copiar_arreglo(arr) for _ in range(bucles)]
+    salida = None
+    
+    if en_sitio:
+        duracion, cuentas = _cronometrar_lote_in_place(algoritmo, copias)
+        return duracion, (copias[-1], *cuentas)
+    
+    inicio = time.perf_counter()
+    for copia in copias:
+        salida = algoritmo(copia)
+    fin = time.perf_counter()
     
-    return tiempo_promedio, desviacion, resultado, comparaciones, operaciones
+    return fin - inicio, salida
+
+
+def _cronometrar_lote_in_place(en_sitio: Callable, copias: List) -> Tuple:
+    """
+    Ordena en el lugar cada copia del lote
+
+    Returns:
+        tuple: (tiempo_total_del_lote, ultimas_cuentas)
+    """
+    cuentas = None
+    
+    inicio = time.perf_counter()
+    for copia in copias:
+        cuentas = en_sitio(copia)
+    fin = time.perf_counter()
+    
+    return fin - inicio, cuentas
+
+
+def _medir_calibrado(algoritmo: Callable, arr: List, repeticiones: int,
+                     tiempo_minimo: float, en_sitio: bool = False) -> Dict:
+    """
+    Cronometra lotes de llamadas al estilo de timeit: elige el número de
+    bucles para que cada bloque dure al menos tiempo_minimo y descuenta
+    la sobrecarga del lazo vacío
+    """
+    # Calibrar el número de bucles (1, 2, 5, 10, 20, 50, ...)
+    max_bucles = max(1, MAX_ELEMENTOS_LOTE // max(1, len(arr)))
+    bucles = 1
+    escala = 1
+    while True:
+        for factor in (1, 2, 5):
+            bucles = min(factor * escala, max_bucles)
+            duracion, _ = _cronometrar_lote(algoritmo, arr, bucles, en_sitio)
+            if duracion >= tiempo_minimo or bucles == max_bucles:
+                break
+        else:
+            escala *= 10
+            continue
+        break
+    
+    tiempos = []
+    sobrecargas = []
+    salida = None
+    
+    vacia = _sin_operacion_in_place if en_sitio else _sin_operacion
+    for _ in range(repeticiones):
+        duracion, salida = _cronometrar_lote(algoritmo, arr, bucles, en_sitio)
+        vacio, _ = _cronometrar_lote(vacia, arr, bucles, en_sitio)
+        
+        tiempos.append(max(0.0, duracion - vacio) / bucles)
+        sobrecargas.append(vacio / bucles)
+    
+    resultado, comparaciones, operaciones = salida
+    
+    return {
+        'tiempos': tiempos,
+        'resultado': resultado,
+        'comparaciones': comparaciones,
+        'operaciones': operaciones,
+        'bucles': bucles,
+        'sobrecarga': float(np.mean(sobrecargas))
+    }
+
+
+def medir_ejecucion(algoritmo: Callable, arr: List, repeticiones: int = 3,
+                    perfilar: bool = False,
+                    calibrado: bool = False,
+                    tiempo_minimo: float = TIEMPO_MINIMO_BLOQUE,
+                    verificar: bool = True,
+                    verificar_estable: bool = False,
+                    medir_memoria: bool = False,
+                    in_place: bool = True,
+                    contar: bool = True) -> Dict:
+    """
+    Mide la ejecución de un algoritmo y retorna todos los datos recogidos
+    
+    Args:
+        algoritmo: Función del algoritmo a medir
+        arr: Arreglo de entrada
+        repeticiones: Número de veces que se ejecuta para promediar
+        perfilar: Si se ejecutan repeticiones extra, no cronometradas,
+                  bajo el perfilador para desglosar el tiempo por función
+                  (ver perfilar_ejecucion)
+        calibrado: Si cada repetición cronometra un lote de llamadas
+                   (recomendado para entradas pequeñas, donde una sola
+                   llamada dura poco más que la resolución del reloj)
+        tiempo_minimo: Duración mínima de cada lote en el modo calibrado
+        verificar: Si se comprueba, fuera del tiempo medido, que la salida
+                   esté ordenada y sea una permutación de la entrada
+        verificar_estable: Si además se ordenan registros etiquetados para
+                           comprobar la estabilidad (una ejecución extra)
+        medir_memoria: Si se mide el pico de memoria en una ejecución
+                       extra, no cronometrada, bajo tracemalloc
+        in_place: Si se usa la versión en el lugar del algoritmo (ver
+                  VERSIONES_IN_PLACE), cuando la tiene: la entrada se
+                  restaura en un arreglo de trabajo fuera del tiempo medido
+                  y el intervalo cronometrado contiene solo el ordenamiento
+        contar: Si se ejecuta una vez más, no cronometrada, con un
+                ContadorOperaciones para obtener las métricas detalladas
+        
+    Returns:
+        dict: tiempo (por llamada), desviacion, tiempos (por repetición),
+              resultado, comparaciones, operaciones, bucles (llamadas por
+              repetición), sobrecarga descontada por llamada, valido
+              (None si no se verificó), verificacion, in_place (si se
+              usó la versión en el lugar) y, si se pidieron, metricas (las
+              del ContadorOperaciones, vacío si el algoritmo no acepta
+              contador), perfil y memoria_pico (bytes)
+    """
+    huella = huella_multiconjunto(arr) if verificar else None
+    en_sitio = VERSIONES_IN_PLACE.get(algoritmo) if in_place else None
+    
+    if calibrado and en_sitio:
+        medicion = _medir_calibrado(en_sitio, arr, repeticiones, tiempo_minimo, en_sitio=True)
+    elif calibrado:
+        medicion = _medir_calibrado(algoritmo, arr, repeticiones, tiempo_minimo)
+    elif en_sitio:
+        medicion = _medir_in_place(en_sitio, arr, repeticiones)
+    else:
+        medicion = _medir_simple(algoritmo, arr, repeticiones)
+    medicion['in_place'] = en_sitio is not None
+    
+    # Con pivote aleatorio las cuentas varían entre ejecuciones: se informan
+    # las de la ejecución contada, para que coincidan con sus métricas
+    if contar:
+        conteo = _contar_operaciones(algoritmo, arr)
+        if conteo is None:
+            medicion['metricas'] = {}
+        else:
+            medicion['metricas'], medicion['comparaciones'], medicion['operaciones'] = conteo
+    
+    medicion['tiempo'] = np.mean(medicion['tiempos'])
+    medicion['desviacion'] = np.std(medicion['tiempos'])
+    
+    if verificar:
+        medicion['verificacion'] = verificar_ordenamiento(medicion['resultado'], huella)
+        if verificar_estable:
+            medicion['verificacion']['estable'] = verificar_estabilidad(algoritmo, arr)
+        medicion['valido'] = medicion['verificacion']['valido']
+    else:
+        medicion['verificacion'] = {}
+        medicion['valido'] = None
+    
+    if perfilar:
+        medicion['perfil'] = perfilar_ejecucion(algoritmo, arr)
+    
+    if medir_memoria:
+        medicion.update(medir_memoria_pico(algoritmo, arr))
+    
+    return medicion
+
+
+def medir_tiempo(algoritmo: Callable, arr: List, repeticiones: int = 3,
+                 perfilar: bool = False, calibrado: bool = False) -> Tuple:
+    """
+    Mide el tiempo de ejecución de un algoritmo
+    
+    Args:
+        algoritmo: Función del algoritmo a medir
+        arr: Arreglo de entrada
+        repeticiones: Número de veces que se ejecuta para promediar
+        perfilar: Si se agrega el perfil por función (ver medir_ejecucion)
+        calibrado: Si se cronometran lotes de llamadas (ver medir_ejecucion)
+        
+    Returns:
+        tuple: (tiempo_promedio, desviacion_estandar, resultado, comparaciones, operaciones)
+               y, si perfilar es True, el perfil como sexto elemento
+    """
+    medicion = medir_ejecucion(algoritmo, arr, repeticiones, perfilar, calibrado)
+    
+    tupla = (
+        medicion['tiempo'],
+        medicion['desviacion'],
+        medicion['resultado'],
+        medicion['comparaciones'],
+        medicion['operaciones']
+    )
+    
+    if perfilar:
+        tupla += (medicion['perfil'],)
+    
+    return tupla
 
 
 def comparar_algoritmos(algoritmos: Dict[str, Callable], 
                        datos: List, 
-                       repeticiones: int = 3) -> Dict:
+                       repeticiones: int = 3,
+                       medir_desorden: bool = True,
+                       perfilar: bool = False,
+                       calibrado: bool = False,
+                       verificar: bool = True,
+                       verificar_estable: bool = False,
+                       medir_memoria: bool = False,
+                       contar: bool = True) -> Dict:
     """
     Compara múltiples algoritmos con los mismos datos
     
@@ -52,23 +346,165 @@ def comparar_algoritmos(algoritmos: Dict[str, Callable],
         algoritmos: Diccionario con nombre y función de cada algoritmo
         datos: Arreglo de entrada
         repeticiones: Número de repeticiones para cada medición
+        medir_desorden: Si se agregan las métricas de desorden de la entrada
+        perfilar: Si se agrega el desglose de tiempo por función interna
+        calibrado: Si se cronometran lotes de llamadas (entradas pequeñas)
+        verificar: Si se verifica la salida de cada algoritmo
+        verificar_estable: Si se verifica también la estabilidad
+        medir_memoria: Si se mide el pico de memoria de cada algoritmo
+        contar: Si se agregan las métricas del ContadorOperaciones
         
     Returns:
         dict: Diccionario con resultados de cada algoritmo
     """
     resultados = {}
+    desorden = calcular_desorden(datos) if medir_desorden else {}
     
     for nombre, algoritmo in algoritmos.items():
-        tiempo, desviacion, _, comparaciones, operaciones = medir_tiempo(
-            algoritmo, datos, repeticiones
-        )
+        medicion = medir_ejecucion(algoritmo, datos, repeticiones, perfilar, calibrado,
+                                   verificar=verificar, verificar_estable=verificar_estable,
+                                   medir_memoria=medir_memoria, contar=contar)
+        
+        resultados[nombre] = {
+            'tiempo': medicion['tiempo'],
+            'desviacion': medicion['desviacion'],
+            'tiempos': medicion['tiempos'],
+            'comparaciones': medicion['comparaciones'],
+            'operaciones': medicion['operaciones'],
+            'bucles': medicion['bucles'],
+            'tamano': len(datos),
+            'valido': medicion['valido'],
+            **medicion['verificacion'],
+            **medicion.get('metricas', {}),
+            **desorden
+        }
+        
+        if perfilar:
+            resultados[nombre]['perfil'] = medicion['perfil']
+        if medir_memoria:
+            resultados[nombre]['memoria_pico'] = medicion['memoria_pico']
+    
+    return resultados
+
+
+def comparar_seleccion(datos: List, k: int, repeticiones: int = 3) -> Dict:
+    """
+    Compara la selección por partición con ordenar todo y rebanar
+    
+    Quickselect y top_k recorren en promedio O(n) elementos antes de
+    ordenar solo los k primeros; la referencia ordena los n elementos
+    (O(n log n)) y se queda con los k menores.
+    
+    Args:
+        datos: Arreglo de entrada
+        k: Cantidad de menores buscados (se acota a len(datos))
+        repeticiones: Número de repeticiones para cada medición
+        
+    Returns:
+        dict: Por método, tiempo, desviacion, tiempos, comparaciones,
+              operaciones, tamano, k y correcto (si coincide con los k
+              menores de la entrada, comprobado fuera del tiempo medido)
+    """
+    n = len(datos)
+    k = max(0, min(k, n))
+    esperados = sorted(datos)[:k]
+    
+    def _quickselect(arr, contador=None):
+        # El elemento de rango k - 1 es el mayor de los k menores
+        if k == 0:
+            return [], 0, 0
+        elemento, comps, swaps = quickselect(arr, k - 1, contador)
+        return [elemento], comps, swaps
+    
+    def _top_k(arr, contador=None):
+        return top_k(arr, k, contador)
+    
+    def _rebanada(algoritmo):
+        def ordenar_y_rebanar(arr, contador=None):
+            ordenado, comps, ops = algoritmo(arr, contador=contador)
+            return ordenado[:k], comps, ops
+        return ordenar_y_rebanar
+    
+    metodos = {
+        'Quickselect': (_quickselect, esperados[-1:]),
+        'Top-k parcial': (_top_k, esperados),
+        'Quick Sort + rebanada': (_rebanada(quick_sort), esperados),
+        'Merge Sort + rebanada': (_rebanada(merge_sort), esperados)
+    }
+    
+    resultados = {}
+    for nombre, (metodo, esperado) in metodos.items():
+        medicion = medir_ejecucion(metodo, datos, repeticiones, verificar=False, contar=False)
         
         resultados[nombre] = {
+            'tiempo': medicion['tiempo'],
+            'desviacion': medicion['desviacion'],
+            'tiempos': medicion['tiempos'],
+            'comparaciones': medicion['comparaciones'],
+            'operaciones': medicion['operaciones'],
+            'tamano': n,
+            'k': k,
+            'correcto': list(medicion['resultado']) == esperado
+        }
+    
+    return resultados
+
+
+def comparar_incremental(lotes: List, algoritmo: Callable = merge_sort,
+                         contenedores: Dict[str, type] = None,
+                         repeticiones: int = 1) -> Dict:
+    """
+    Mide el costo de mantener ordenados datos que llegan por lotes
+    
+    Cada contenedor recibe los lotes en orden; se cronometra cada
+    agregar_lote por separado, de modo que el tiempo por lote muestra cómo
+    crece el costo con lo acumulado (O(N log N) por lote al reordenar
+    todo, O(N + b log b) al mezclar, O(b log N) con bloques).
+    
+    Args:
+        lotes: Lista de lotes (list, array.array o ndarray) en orden de llegada
+        algoritmo: Algoritmo con que se ordena cada lote (o todo, en la referencia)
+        contenedores: Nombre y clase de cada contenedor (por defecto
+                      CONTENEDORES_INCREMENTALES)
+        repeticiones: Veces que se repite la secuencia completa de lotes
+        
+    Returns:
+        dict: Por contenedor, tiempos (por lote, promedio de las
+              repeticiones), acumulados (elementos tras cada lote),
+              tiempo (total), desviacion (del total entre repeticiones),
+              rendimiento (elementos por segundo), comparaciones,
+              operaciones, lotes, tamano y correcto (comparado con
+              ordenar todos los lotes, fuera del tiempo medido)
+    """
+    contenedores = contenedores or CONTENEDORES_INCREMENTALES
+    esperado = sorted(x for lote in lotes for x in convertir_formato(lote, 'lista'))
+    acumulados = list(np.cumsum([len(lote) for lote in lotes]))
+    
+    resultados = {}
+    for nombre, clase in contenedores.items():
+        tiempos_por_lote = np.zeros((repeticiones, len(lotes)))
+        
+        for repeticion in range(repeticiones):
+            contenedor = clase(algoritmo)
+            for indice, lote in enumerate(lotes):
+                inicio = time.perf_counter()
+                contenedor.agregar_lote(lote)
+                tiempos_por_lote[repeticion, indice] = time.perf_counter() - inicio
+        
+        totales = tiempos_por_lote.sum(axis=1)
+        tiempo = float(np.mean(totales))
+        
+        resultados[nombre] = {
+            'tiempos': tiempos_por_lote.mean(axis=0).tolist(),
+            'acumulados': acumulados,
             'tiempo': tiempo,
-            'desviacion': desviacion,
-            'comparaciones': comparaciones,
-            'operaciones': operaciones,
-            'tamano': len(datos)
+            'desviacion': float(np.std(totales)),
+            'rendimiento': len(esperado) / tiempo if tiempo > 0 else float('inf'),
+            'comparaciones': contenedor.comparaciones,
+            'operaciones': contenedor.movimientos,
+            'lotes': len(lotes),
+            'tamano': len(esperado),
+            'correcto': contenedor.a_lista() == esperado
         }
     
     return resultados
@@ -77,7 +513,12 @@ def comparar_algoritmos(algoritmos: Dict[str, Callable],
 def analizar_complejidad(algoritmo: Callable, 
                         tamanos: List[int],
                         tipo_datos: str = 'aleatorio',
-                        generador: Callable = None) -> List[Dict]:
+                        generador: Callable = None,
+                        medir_desorden: bool = True,
+                        calibrado: bool = False,
+                        formato: str = 'lista',
+                        tipo_elemento: str = 'Entero',
+                        contar: bool = True) -> List[Dict]:
     """
     Analiza la complejidad de un algoritmo con diferentes tamaños de entrada
     
@@ -86,6 +527,13 @@ def analizar_complejidad(algoritmo: Callable,
         tamanos: Lista de tamaños de entrada a probar
         tipo_datos: Tipo de datos a generar ('aleatorio', 'ordenado', 'inverso')
         generador: Función generadora de datos
+        medir_desorden: Si se agregan las métricas de desorden de cada entrada
+        calibrado: Si se cronometran lotes de llamadas (entradas pequeñas)
+        formato: Representación en memoria de los datos ('lista', 'array' o 'numpy')
+        tipo_elemento: Tipo de los elementos (ver TIPOS_ELEMENTO); los que no
+                       son enteros solo admiten el formato 'lista' y los
+                       algoritmos fuera de SOLO_ENTEROS
+        contar: Si se agregan las métricas del ContadorOperaciones
         
     Returns:
         list: Lista de diccionarios con resultados para cada tamaño
@@ -106,25 +554,134 @@ def analizar_complejidad(algoritmo: Callable,
     else:
         gen_func = generar_aleatorio
     
+    if tipo_elemento != 'Entero' and formato != 'lista':
+        raise ValueError(f"El tipo de elemento {tipo_elemento} solo admite el formato 'lista'")
+    if tipo_elemento != 'Entero' and algoritmo in SOLO_ENTEROS:
+        raise ValueError(f"{getattr(algoritmo, '__name__', algoritmo)} solo ordena enteros, "
+                         f"no el tipo de elemento {tipo_elemento}")
+    
     resultados = []
     
     for n in tamanos:
-        datos = gen_func(n)
-        tiempo, desviacion, _, comparaciones, operaciones = medir_tiempo(
-            algoritmo, datos, repeticiones=3
-        )
+        enteros = convertir_formato(gen_func(n), formato)
+        if tipo_elemento == 'Entero':
+            datos = enteros
+        else:
+            datos = convertir_elementos(enteros, tipo_elemento)
+        medicion = medir_ejecucion(algoritmo, datos, repeticiones=3, calibrado=calibrado,
+                                   contar=contar)
         
         resultados.append({
             'tamano': n,
-            'tiempo': tiempo,
-            'desviacion': desviacion,
-            'comparaciones': comparaciones,
-            'operaciones': operaciones
+            'tipo_elemento': tipo_elemento,
+            'tiempo': medicion['tiempo'],
+            'desviacion': medicion['desviacion'],
+            'tiempos': medicion['tiempos'],
+            'comparaciones': medicion['comparaciones'],
+            'operaciones': medicion['operaciones'],
+            'valido': medicion['valido'],
+            **medicion.get('metricas', {}),
+            # El desorden se mide sobre los enteros: la conversión conserva el orden
+            **(calcular_desorden(enteros) if medir_desorden else {})
         })
     
     return resultados
 
 
+def _medir_escenario(algoritmo: Callable, datos: List, repeticiones: int) -> Dict:
+    """
+    Mide una celda de la matriz de escenarios (se ejecuta en un proceso aparte)
+    """
+    medicion = medir_ejecucion(algoritmo, datos, repeticiones)
+    
+    return {
+        'tiempo': medicion['tiempo'],
+        'desviacion': medicion['desviacion'],
+        'tiempos': medicion['tiempos'],
+        'comparaciones': medicion['comparaciones'],
+        'operaciones': medicion['operaciones'],
+        'valido': medicion['valido'],
+        **medicion['metricas'],
+        'tamano': len(datos)
+    }
+
+
+def ejecutar_matriz_escenarios(algoritmos: Dict[str, Callable],
+                               tamano: int,
+                               repeticiones: int = 3,
+                               max_procesos: int = None,
+                               formato: str = 'lista') -> Dict[str, Dict]:
+    """
+    Mide cada algoritmo contra los seis tipos de datos de
+    generar_dataset_completo, ejecutando las celdas en procesos paralelos
+    
+    Las celdas concurrentes comparten CPU y caché, por lo que los tiempos
+    absolutos pueden ser algo mayores que en una medición secuencial; la
+    comparación entre celdas sigue siendo válida.
+    
+    Args:
+        algoritmos: Diccionario con nombre y función de cada algoritmo
+        tamano: Tamaño de cada arreglo
+        repeticiones: Número de repeticiones por celda
+        max_procesos: Procesos en paralelo (por defecto, número de CPUs)
+        formato: Representación en memoria de los datos
+        
+    Returns:
+        dict: {escenario: {algoritmo: resultados}}, el formato que espera
+              graficar_heatmap_rendimiento
+    """
+    from utils.generadores import generar_dataset_completo
+    
+    datasets = generar_dataset_completo(tamano, formato=formato)
+    desorden = {escenario: calcular_desorden(datos) for escenario, datos in datasets.items()}
+    
+    with ProcessPoolExecutor(max_workers=max_procesos or os.cpu_count()) as ejecutor:
+        futuros = {
+            (escenario, nombre): ejecutor.submit(_medir_escenario, algoritmo, datos, repeticiones)
+            for escenario, datos in datasets.items()
+            for nombre, algoritmo in algoritmos.items()
+        }
+        
+        resultados = {escenario: {} for escenario in datasets}
+        for (escenario, nombre), futuro in futuros.items():
+            resultados[escenario][nombre] = {**futuro.result(), **desorden[escenario]}
+    
+    return resultados
+
+
+def calcular_mejor_peor_caso(datos_multiple: Dict[str, Dict]) -> Dict[str, Dict]:
+    """
+    Identifica el escenario más rápido y el más lento de cada algoritmo
+    
+    Args:
+        datos_multiple: Resultado de ejecutar_matriz_escenarios
+        
+    Returns:
+        dict: {algoritmo: {'mejor_caso', 'tiempo_mejor', 'peor_caso',
+               'tiempo_peor', 'razon'}}
+    """
+    algoritmos = list(next(iter(datos_multiple.values())).keys())
+    casos = {}
+    
+    for algoritmo in algoritmos:
+        tiempos = {
+            escenario: resultados[algoritmo]['tiempo']
+            for escenario, resultados in datos_multiple.items()
+        }
+        mejor = min(tiempos, key=tiempos.get)
+        peor = max(tiempos, key=tiempos.get)
+        
+        casos[algoritmo] = {
+            'mejor_caso': mejor,
+            'tiempo_mejor': tiempos[mejor],
+            'peor_caso': peor,
+            'tiempo_peor': tiempos[peor],
+            'razon': tiempos[peor] / tiempos[mejor] if tiempos[mejor] > 0 else float('inf')
+        }
+    
+    return casos
+
+
 def calcular_metricas(resultados: Dict) -> Dict:
     """
     Calcula métricas comparativas entre algoritmos
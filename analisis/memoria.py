@@ -0,0 +1,52 @@
+"""
+Módulo de medición de memoria
+Mide el pico de memoria de una ejecución adicional no cronometrada con
+tracemalloc, que registra cada reserva de memoria del intérprete
+
+El pico incluye la copia de la entrada que hace cada algoritmo (igual
+para todos), así que las diferencias entre algoritmos corresponden a su
+memoria auxiliar: buffers, rebanadas copiadas y marcos de recursión.
+La sobrecarga de tracemalloc hace que esta ejecución sea más lenta, por
+eso nunca se cronometra.
+"""
+
+import gc
+import tracemalloc
+from typing import Callable, Dict, List
+
+from utils.buffers import copiar_arreglo
+
+
+def medir_memoria_pico(algoritmo: Callable, arr: List) -> Dict:
+    """
+    Ejecuta el algoritmo una vez registrando las reservas de memoria
+
+    Args:
+        algoritmo: Función del algoritmo a medir
+        arr: Arreglo de entrada (no se modifica)
+
+    Returns:
+        dict: memoria_pico (bytes reservados como máximo durante la
+              llamada) y memoria_final (bytes que siguen reservados al
+              terminar, en su mayoría el arreglo ordenado)
+    """
+    arr_copia = copiar_arreglo(arr)
+    gc.collect()
+
+    ya_activo = tracemalloc.is_tracing()
+    if not ya_activo:
+        tracemalloc.start()
+    tracemalloc.reset_peak()
+    base, _ = tracemalloc.get_traced_memory()
+    try:
+        salida = algoritmo(arr_copia)
+        actual, pico = tracemalloc.get_traced_memory()
+    finally:
+        if not ya_activo:
+            tracemalloc.stop()
+
+    del salida
+    return {
+        'memoria_pico': max(0, pico - base),
+        'memoria_final': max(0, actual - base)
+    }
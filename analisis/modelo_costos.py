@@ -0,0 +1,194 @@
+"""
+Módulo de calibración del modelo de costos
+Ajusta, por algoritmo y por máquina, el modelo lineal
+
+    tiempo ≈ a · comparaciones + b · movimientos + c
+
+con los datos de analizar_complejidad. Los coeficientes son el costo en
+nanosegundos de cada operación contada en esta máquina: permiten predecir
+el tiempo en otro equipo a partir solo de los conteos y ver qué algoritmo
+paga más sobrecarga del intérprete por operación.
+"""
+
+import itertools
+import json
+import os
+from typing import Callable, Dict, List
+
+import numpy as np
+
+from .entorno import obtener_metadatos_entorno
+from .medicion import analizar_complejidad
+
+RUTA_PERFIL_PREDETERMINADA = os.path.join('resultados', 'perfil_costos.json')
+
+# Tipos de datos de la calibración: mezclar formas de entrada separa el
+# costo de las comparaciones del de los movimientos (en una entrada casi
+# ordenada hay muchas comparaciones y pocos movimientos)
+TIPOS_CALIBRACION = ('Aleatorio', 'Casi Ordenado', 'Inverso')
+
+
+def _variable_movimientos(resultados: List[Dict]) -> str:
+    """
+    Conteo usado como movimientos: las escrituras del ContadorOperaciones
+    (misma semántica en todos los algoritmos) o, si faltan, las operaciones
+    que retorna el algoritmo
+    """
+    return 'escrituras' if all('escrituras' in r for r in resultados) else 'operaciones'
+
+
+def _minimos_cuadrados_no_negativos(diseno: np.ndarray, objetivo: np.ndarray) -> np.ndarray:
+    """
+    Mínimos cuadrados con coeficientes >= 0, probando todos los
+    subconjuntos de columnas (son tres): evita costos negativos cuando
+    comparaciones y movimientos crecen casi igual y el ajuste libre los
+    compensa entre sí
+    """
+    columnas = diseno.shape[1]
+    mejor, mejor_residuo = np.zeros(columnas), float(np.sum(objetivo ** 2))
+
+    for k in range(1, columnas + 1):
+        for subconjunto in itertools.combinations(range(columnas), k):
+            coeficientes, _, _, _ = np.linalg.lstsq(diseno[:, subconjunto], objetivo, rcond=None)
+            if np.any(coeficientes < 0):
+                continue
+            residuo = float(np.sum((objetivo - diseno[:, subconjunto] @ coeficientes) ** 2))
+            if residuo < mejor_residuo:
+                mejor = np.zeros(columnas)
+                mejor[list(subconjunto)] = coeficientes
+                mejor_residuo = residuo
+
+    return mejor
+
+
+def ajustar_modelo_costos(resultados: List[Dict]) -> Dict:
+    """
+    Ajusta por mínimos cuadrados no negativos tiempo ≈ a·comparaciones + b·movimientos + c
+
+    Args:
+        resultados: Mediciones de un algoritmo (formato de analizar_complejidad),
+                    idealmente con varios tamaños y tipos de datos
+
+    Returns:
+        dict: ns_comparacion, ns_movimiento, sobrecarga_us, r2, puntos,
+              variable_movimientos y ns_por_operacion (costo medio por
+              operación contada en los datos del ajuste)
+    """
+    if len(resultados) < 3:
+        raise ValueError("Se necesitan al menos 3 mediciones para ajustar el modelo")
+
+    variable = _variable_movimientos(resultados)
+    comparaciones = np.array([r['comparaciones'] for r in resultados], dtype=float)
+    movimientos = np.array([r[variable] for r in resultados], dtype=float)
+    tiempos = np.array([r['tiempo'] for r in resultados], dtype=float)
+
+    diseno = np.column_stack([comparaciones, movimientos, np.ones_like(tiempos)])
+    a, b, c = _minimos_cuadrados_no_negativos(diseno, tiempos)
+
+    predichos = diseno @ np.array([a, b, c])
+    residuo = float(np.sum((tiempos - predichos) ** 2))
+    total = float(np.sum((tiempos - tiempos.mean()) ** 2))
+    operaciones = comparaciones + movimientos
+
+    return {
+        'ns_comparacion': float(a * 1e9),
+        'ns_movimiento': float(b * 1e9),
+        'sobrecarga_us': float(c * 1e6),
+        'r2': 1.0 - residuo / total if total > 0 else 1.0,
+        'puntos': len(resultados),
+        'variable_movimientos': variable,
+        'ns_por_operacion': float(np.sum(tiempos) / max(1.0, np.sum(operaciones)) * 1e9)
+    }
+
+
+def predecir_tiempo(modelo: Dict, comparaciones: int, movimientos: int) -> float:
+    """
+    Predice el tiempo de ejecución a partir de los conteos de operaciones
+
+    Args:
+        modelo: Modelo ajustado (ver ajustar_modelo_costos)
+        comparaciones: Comparaciones contadas
+        movimientos: Movimientos contados (en la variable del modelo)
+
+    Returns:
+        float: Tiempo estimado en segundos
+    """
+    return (modelo['ns_comparacion'] * comparaciones
+            + modelo['ns_movimiento'] * movimientos) * 1e-9 + modelo['sobrecarga_us'] * 1e-6
+
+
+def calibrar_maquina(algoritmos: Dict[str, Callable],
+                     tamanos: List[int],
+                     tipos_datos: tuple = TIPOS_CALIBRACION,
+                     calibrado: bool = True) -> Dict:
+    """
+    Mide cada algoritmo con varios tamaños y tipos de datos y ajusta su modelo
+
+    Args:
+        algoritmos: Diccionario con nombre y función de cada algoritmo
+        tamanos: Tamaños de entrada
+        tipos_datos: Nombres de generadores (claves de GENERADORES)
+        calibrado: Si se cronometran lotes de llamadas (ver medir_ejecucion)
+
+    Returns:
+        dict: entorno (metadatos de la máquina) y modelos por algoritmo
+    """
+    from utils.generadores import GENERADORES
+
+    modelos = {}
+    for nombre, algoritmo in algoritmos.items():
+        mediciones = []
+        for tipo in tipos_datos:
+            mediciones.extend(analizar_complejidad(
+                algoritmo, tamanos,
+                generador=GENERADORES[tipo],
+                medir_desorden=False,
+                calibrado=calibrado
+            ))
+        modelos[nombre] = ajustar_modelo_costos(mediciones)
+
+    return {
+        'entorno': obtener_metadatos_entorno(),
+        'modelos': modelos
+    }
+
+
+def guardar_perfil(perfil: Dict, ruta: str = RUTA_PERFIL_PREDETERMINADA) -> str:
+    """
+    Guarda el perfil de costos de esta máquina junto a los ya guardados
+    (uno por equipo, identificado por el nombre del nodo)
+
+    Args:
+        perfil: Resultado de calibrar_maquina
+        ruta: Archivo JSON de perfiles
+
+    Returns:
+        str: Nombre del equipo bajo el que se guardó
+    """
+    perfiles = cargar_perfiles(ruta)
+    equipo = perfil['entorno'].get('nodo') or 'desconocido'
+    perfiles[equipo] = perfil
+
+    directorio = os.path.dirname(ruta)
+    if directorio:
+        os.makedirs(directorio, exist_ok=True)
+    with open(ruta, 'w', encoding='utf-8') as archivo:
+        json.dump(perfiles, archivo, indent=2, ensure_ascii=False)
+
+    return equipo
+
+
+def cargar_perfiles(ruta: str = RUTA_PERFIL_PREDETERMINADA) -> Dict[str, Dict]:
+    """
+    Carga los perfiles de costos guardados
+
+    Args:
+        ruta: Archivo JSON de perfiles
+
+    Returns:
+        dict: Perfil de cada equipo (vacío si aún no hay archivo)
+    """
+    if not os.path.exists(ruta):
+        return {}
+    with open(ruta, encoding='utf-8') as archivo:
+        return json.load(archivo)
@@ -0,0 +1,183 @@
+"""
+Módulo de perfilado de algoritmos
+Desglosa el tiempo por función interna (partition, merge, ...) durante una
+ejecución adicional no cronometrada y exporta el perfil a speedscope
+
+El desglose por función lo calcula cProfile (agregado por pstats); la
+línea de tiempo para speedscope sale de una segunda ejecución trazada
+con sys.setprofile, que deja de registrar al alcanzar MAX_EVENTOS para
+acotar la memoria (el perfil lo indica con eventos_truncados). Ambos son
+perfiladores deterministas: los tiempos absolutos incluyen la sobrecarga
+del trazado y son útiles para comparar proporciones entre funciones.
+
+Referencia:
+speedscope file format - https://www.speedscope.app/file-format-schema.json
+"""
+
+import cProfile
+import json
+import pstats
+import sys
+import time
+from typing import Callable, Dict, List
+
+from utils.buffers import copiar_arreglo
+
+# Eventos (entradas y salidas de función) que se guardan como máximo para
+# la línea de tiempo de speedscope
+MAX_EVENTOS = 200_000
+
+
+def _nombre_funcion(codigo) -> str:
+    """Nombre calificado de una función (Python 3.11+) o su nombre simple"""
+    return getattr(codigo, 'co_qualname', codigo.co_name)
+
+
+def perfilar_ejecucion(algoritmo: Callable, arr: List, max_eventos: int = MAX_EVENTOS) -> Dict:
+    """
+    Ejecuta el algoritmo bajo cProfile para el desglose por función y una
+    segunda vez registrando las entradas y salidas de función de Python
+    para la línea de tiempo
+
+    Args:
+        algoritmo: Función del algoritmo a perfilar
+        arr: Arreglo de entrada (no se modifica)
+        max_eventos: Eventos máximos de la línea de tiempo; al alcanzarlos
+                     se deja de trazar y el perfil queda marcado como truncado
+
+    Returns:
+        dict: Perfil con tiempo_total, el desglose por función, los marcos,
+              los eventos, tiempo_eventos (duración trazada) y eventos_truncados
+    """
+    reloj = time.perf_counter
+
+    # Desglose por función con cProfile
+    perfilador = cProfile.Profile()
+    arr_copia = copiar_arreglo(arr)
+    inicio = reloj()
+    perfilador.enable()
+    try:
+        algoritmo(arr_copia)
+    finally:
+        perfilador.disable()
+    tiempo_total = reloj() - inicio
+
+    # Línea de tiempo con un presupuesto de eventos
+    eventos = []
+    truncado = False
+
+    def _trazar(frame, evento, arg):
+        nonlocal truncado
+        if evento not in ('call', 'return'):
+            return
+        if len(eventos) >= max_eventos:
+            truncado = True
+            sys.setprofile(None)
+            return
+        eventos.append(('O' if evento == 'call' else 'C', frame.f_code, reloj()))
+
+    arr_copia = copiar_arreglo(arr)
+    inicio = reloj()
+    sys.setprofile(_trazar)
+    try:
+        algoritmo(arr_copia)
+    finally:
+        sys.setprofile(None)
+    fin = reloj()
+
+    # Convertir objetos de código en índices de marcos
+    indices = {}
+    marcos = []
+    eventos_compactos = []
+    for tipo, codigo, instante in eventos:
+        if codigo not in indices:
+            indices[codigo] = len(marcos)
+            marcos.append({
+                'name': _nombre_funcion(codigo),
+                'file': codigo.co_filename,
+                'line': codigo.co_firstlineno
+            })
+        eventos_compactos.append((tipo, indices[codigo], instante - inicio))
+
+    return {
+        'tiempo_total': tiempo_total,
+        'marcos': marcos,
+        'eventos': eventos_compactos,
+        # Si se truncó, la línea de tiempo termina en el último evento guardado
+        'tiempo_eventos': eventos_compactos[-1][2] if truncado and eventos_compactos else fin - inicio,
+        'eventos_truncados': truncado,
+        'funciones': _desglosar_por_funcion(perfilador)
+    }
+
+
+def _desglosar_por_funcion(perfilador: cProfile.Profile) -> List[Dict]:
+    """
+    Llamadas, tiempo propio y tiempo acumulado por función de Python según
+    pstats (las funciones nativas se omiten; su tiempo no se suma al de
+    quien las llama)
+    """
+    funciones = [
+        {
+            'funcion': nombre,
+            'archivo': archivo,
+            'linea': linea,
+            'llamadas': llamadas,
+            'tiempo_propio': propio,
+            'tiempo_acumulado': acumulado
+        }
+        for (archivo, linea, nombre), (_, llamadas, propio, acumulado, _)
+        in pstats.Stats(perfilador).stats.items()
+        if archivo != '~'
+    ]
+
+    return sorted(funciones, key=lambda f: f['tiempo_propio'], reverse=True)
+
+
+def exportar_speedscope(perfil: Dict, nombre: str = "Perfil") -> str:
+    """
+    Exporta un perfil en el formato JSON de speedscope (perfil por eventos)
+    para visualizarlo como flamegraph en https://www.speedscope.app
+
+    Args:
+        perfil: Perfil retornado por perfilar_ejecucion
+        nombre: Nombre del perfil (por ejemplo, el del algoritmo)
+
+    Returns:
+        str: Documento JSON
+    """
+    eventos = []
+    abiertos = []
+    for tipo, indice, instante in perfil['eventos']:
+        if tipo == 'O':
+            abiertos.append(indice)
+        elif abiertos:
+            indice = abiertos.pop()
+        else:
+            continue
+        eventos.append({'type': tipo, 'frame': indice, 'at': instante})
+
+    # speedscope exige que todos los marcos abiertos se cierren (también
+    # los que quedaron abiertos al truncar la línea de tiempo)
+    while abiertos:
+        eventos.append({'type': 'C', 'frame': abiertos.pop(), 'at': perfil['tiempo_eventos']})
+
+    if perfil['eventos_truncados']:
+        nombre = f"{nombre} (truncado a {len(perfil['eventos'])} eventos)"
+
+    documento = {
+        '$schema': 'https://www.speedscope.app/file-format-schema.json',
+        'name': nombre,
+        'exporter': 'Taller2-INFO1148',
+        'activeProfileIndex': 0,
+        'shared': {'frames': perfil['marcos']},
+        'profiles': [{
+            'type': 'evented',
+            'name': nombre,
+            'unit': 'seconds',
+            'startValue': 0,
+            'endValue': perfil['tiempo_eventos'],
+            'events': eventos
+        }]
+    }
+
+    return json.dumps(documento)
@@ -0,0 +1,15 @@
+"""
+Punto de entrada del proceso hijo de una medición aislada
+Se ejecuta como módulo aparte (no lo importa el paquete analisis) para
+que python -m no cargue dos veces analisis.aislamiento:
+    python -m analisis.proceso_aislado '{"algoritmo": "Quick Sort", ...}'
+"""
+
+import json
+import sys
+
+from .aislamiento import ejecutar_en_hijo
+
+
+if __name__ == '__main__':
+    print(json.dumps(ejecutar_en_hijo(json.loads(sys.argv[1]))))
@@ -0,0 +1,227 @@
+"""
+Módulo de tablas de resultados en columnas
+Convierte los resultados anidados (diccionarios de listas) en una tabla
+larga con tipos numéricos: una fila por (algoritmo, tipo de datos,
+tipo de elemento, n, repetición). Cada columna se construye de una vez
+con su tipo, así que la tabla se puede ordenar, agregar y exportar sin
+pasar por cadenas; el formato (ms, separadores de miles, ✅/❌) se
+aplica solo al mostrarla.
+
+La exportación a Parquet y Arrow (Feather v2, el formato de archivo IPC
+de Arrow) usa pyarrow, que toma las columnas numéricas sin copiarlas.
+"""
+
+import io
+import os
+from typing import Dict, List
+
+import numpy as np
+import pandas as pd
+
+# Columnas de la tabla larga y su tipo; las que un resultado no trae
+# quedan vacías (tipos con valores nulos: Int64, Float64 y boolean)
+COLUMNAS = {
+    'algoritmo': 'string',
+    'tipo_datos': 'string',
+    'tipo_elemento': 'string',
+    'equipo': 'string',
+    'tamano': 'int64',
+    'repeticion': 'int64',
+    'tiempo': 'float64',
+    'comparaciones': 'Int64',
+    'operaciones': 'Int64',
+    'intercambios': 'Int64',
+    'lecturas': 'Int64',
+    'escrituras': 'Int64',
+    'memoria_aux': 'Int64',
+    'profundidad_max': 'Int64',
+    'memoria_pico': 'Int64',
+    'bucles': 'Int64',
+    'valido': 'boolean',
+    'estable': 'boolean',
+    'inversiones': 'Int64',
+    'inversiones_norm': 'Float64',
+    'corridas': 'Int64',
+    'lis': 'Int64',
+    'ratio_distintos': 'Float64'
+}
+
+# Columnas que identifican una medición (todas sus repeticiones)
+CLAVES_MEDICION = ['algoritmo', 'tipo_datos', 'tipo_elemento', 'tamano']
+
+# Formatos de exportación por extensión de archivo
+FORMATOS_EXPORTACION = {
+    '.parquet': 'parquet',
+    '.arrow': 'arrow',
+    '.feather': 'arrow',
+    '.csv': 'csv'
+}
+
+
+def _agregar_medicion(columnas: Dict[str, List], algoritmo: str, res: Dict,
+                      tipo_datos: str, tipo_elemento: str):
+    """Agrega a las columnas una fila por cada repetición de una medición"""
+    tiempos = res.get('tiempos') or [res['tiempo']]
+    fijos = {
+        'algoritmo': algoritmo,
+        'tipo_datos': tipo_datos,
+        'tipo_elemento': res.get('tipo_elemento', tipo_elemento),
+        'tamano': res['tamano']
+    }
+
+    for repeticion, tiempo in enumerate(tiempos):
+        for columna, valores in columnas.items():
+            if columna == 'repeticion':
+                valores.append(repeticion)
+            elif columna == 'tiempo':
+                valores.append(tiempo)
+            elif columna in fijos:
+                valores.append(fijos[columna])
+            else:
+                valores.append(res.get(columna))
+
+
+def _tabla_desde_columnas(columnas: Dict[str, List]) -> pd.DataFrame:
+    """Construye el DataFrame columna a columna con los tipos de COLUMNAS"""
+    return pd.DataFrame({
+        columna: pd.array(valores, dtype=COLUMNAS[columna])
+        for columna, valores in columnas.items()
+    })
+
+
+def construir_tabla(resultados: Dict, tipo_datos: str = '',
+                    tipo_elemento: str = 'Entero') -> pd.DataFrame:
+    """
+    Convierte resultados de un tipo de datos en la tabla larga
+
+    Args:
+        resultados: {algoritmo: resultado} de comparar_algoritmos o
+                    {algoritmo: [resultado por tamaño]} de analizar_complejidad
+        tipo_datos: Tipo de datos de la entrada
+        tipo_elemento: Tipo de elemento, si los resultados no lo indican
+
+    Returns:
+        DataFrame: Una fila por repetición con las columnas de COLUMNAS
+    """
+    columnas = {columna: [] for columna in COLUMNAS}
+
+    for algoritmo, mediciones in resultados.items():
+        if isinstance(mediciones, dict):
+            mediciones = [mediciones]
+        for res in mediciones:
+            _agregar_medicion(columnas, algoritmo, res, tipo_datos, tipo_elemento)
+
+    return _tabla_desde_columnas(columnas)
+
+
+def construir_tabla_por_tipo(resultados: Dict[str, Dict],
+                             tipo_elemento: str = 'Entero') -> pd.DataFrame:
+    """
+    Convierte resultados agrupados por tipo de datos en la tabla larga
+
+    Args:
+        resultados: {tipo_datos: {algoritmo: ...}}, como los de
+                    ejecutar_matriz_escenarios o cargar_barrido
+        tipo_elemento: Tipo de elemento, si los resultados no lo indican
+
+    Returns:
+        DataFrame: Una fila por repetición con las columnas de COLUMNAS
+    """
+    columnas = {columna: [] for columna in COLUMNAS}
+
+    for tipo_datos, por_algoritmo in resultados.items():
+        for algoritmo, mediciones in por_algoritmo.items():
+            if isinstance(mediciones, dict):
+                mediciones = [mediciones]
+            for res in mediciones:
+                _agregar_medicion(columnas, algoritmo, res, tipo_datos, tipo_elemento)
+
+    return _tabla_desde_columnas(columnas)
+
+
+def resumir_tabla(tabla: pd.DataFrame) -> pd.DataFrame:
+    """
+    Agrega las repeticiones de cada medición
+
+    Args:
+        tabla: Tabla larga de construir_tabla
+
+    Returns:
+        DataFrame: Una fila por medición con tiempo (promedio), desviacion
+                   (poblacional, como np.std) y el resto de las columnas
+                   (iguales en todas las repeticiones)
+    """
+    otras = [c for c in tabla.columns if c not in CLAVES_MEDICION + ['repeticion', 'tiempo']]
+    grupos = tabla.groupby(CLAVES_MEDICION, sort=False, dropna=False)
+
+    resumen = grupos['tiempo'].agg(tiempo='mean', desviacion=lambda t: float(np.std(t)))
+    resumen = resumen.join(grupos[otras].first())
+    return resumen.reset_index()
+
+
+def _formato_de(destino, formato: str = None) -> str:
+    """Formato de exportación explícito o deducido de la extensión del archivo"""
+    if formato is None:
+        if not isinstance(destino, (str, os.PathLike)):
+            raise ValueError("Indica el formato al exportar a un objeto de archivo")
+        extension = os.path.splitext(os.fspath(destino))[1].lower()
+        formato = FORMATOS_EXPORTACION.get(extension)
+    if formato not in ('parquet', 'arrow', 'csv'):
+        raise ValueError(f"Formato de exportación desconocido: {formato}. "
+                         f"Opciones: parquet, arrow, csv")
+    return formato
+
+
+def exportar_tabla(tabla: pd.DataFrame, destino, formato: str = None):
+    """
+    Exporta la tabla a Parquet, Arrow (Feather v2) o CSV
+
+    Args:
+        tabla: Tabla de construir_tabla o resumir_tabla
+        destino: Ruta del archivo u objeto de archivo binario
+        formato: 'parquet', 'arrow' o 'csv' (por defecto, según la extensión)
+    """
+    formato = _formato_de(destino, formato)
+
+    if isinstance(destino, (str, os.PathLike)):
+        directorio = os.path.dirname(os.fspath(destino))
+        if directorio:
+            os.makedirs(directorio, exist_ok=True)
+
+    if formato == 'parquet':
+        tabla.to_parquet(destino, index=False)
+    elif formato == 'arrow':
+        tabla.reset_index(drop=True).to_feather(destino)
+    else:
+        tabla.to_csv(destino, index=False)
+
+
+def exportar_bytes(tabla: pd.DataFrame, formato: str) -> bytes:
+    """
+    Exporta la tabla en memoria (para descargas)
+
+    Args:
+        tabla: Tabla a exportar
+        formato: 'parquet', 'arrow' o 'csv'
+
+    Returns:
+        bytes: Contenido del archivo
+    """
+    buffer = io.BytesIO()
+    exportar_tabla(tabla, buffer, formato)
+    return buffer.getvalue()
+
+
+def a_arrow(tabla: pd.DataFrame):
+    """
+    Convierte la tabla en una tabla de pyarrow (sin copiar las columnas numéricas)
+
+    Args:
+        tabla: Tabla a convertir
+
+    Returns:
+        pyarrow.Table: Tabla en formato Arrow
+    """
+    import pyarrow as pa
+
+    return pa.Table.from_pandas(tabla, preserve_index=False)
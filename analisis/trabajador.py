@@ -0,0 +1,15 @@
+"""
+Punto de entrada de un trabajador de barridos distribuidos
+Se ejecuta como módulo aparte (no lo importa el paquete analisis) para
+que python -m no cargue dos veces analisis.distribuido:
+    DISTRIBUIDO_CLAVE=secreto python -m analisis.trabajador equipo:puerto
+"""
+
+import sys
+
+from .distribuido import ejecutar_trabajador
+
+
+if __name__ == '__main__':
+    equipo, puerto = sys.argv[1].rsplit(':', 1)
+    print(ejecutar_trabajador((equipo, int(puerto))))
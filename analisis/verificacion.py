@@ -0,0 +1,177 @@
+"""
+Módulo de verificación de resultados
+Comprueba en O(n), fuera del intervalo cronometrado, que la salida de un
+algoritmo esté ordenada y sea una permutación de la entrada, y opcionalmente
+que el ordenamiento sea estable
+
+La permutación se verifica con una huella de multiconjunto: la suma
+(módulo 2^64) de un hash de cada elemento no depende del orden, de modo
+que entrada y salida deben tener la misma huella y la misma longitud.
+"""
+
+from typing import Callable, Dict, Optional
+
+import numpy as np
+
+from utils.buffers import convertir_formato
+
+# Constantes del mezclador splitmix64
+_SM_INCREMENTO = np.uint64(0x9E3779B97F4A7C15)
+_SM_MULT_1 = np.uint64(0xBF58476D1CE4E5B9)
+_SM_MULT_2 = np.uint64(0x94D049BB133111EB)
+_MASCARA_64 = (1 << 64) - 1
+
+
+def _como_numerico(arr) -> Optional[np.ndarray]:
+    """
+    Vista NumPy de un arreglo de números, o None si los elementos no son
+    numéricos (cadenas, tuplas, registros...)
+    """
+    try:
+        a = np.asarray(arr)
+    except (TypeError, ValueError):
+        return None
+    if a.ndim != 1 or a.dtype.kind not in 'iuf':
+        return None
+    return a
+
+
+def _mezclar_splitmix64(valores: np.ndarray) -> np.ndarray:
+    """Hash splitmix64 vectorizado (aritmética de enteros sin signo con desborde)"""
+    z = valores + _SM_INCREMENTO
+    z = (z ^ (z >> np.uint64(30))) * _SM_MULT_1
+    z = (z ^ (z >> np.uint64(27))) * _SM_MULT_2
+    return z ^ (z >> np.uint64(31))
+
+
+def esta_ordenado(arr) -> bool:
+    """
+    Indica si un arreglo está en orden no decreciente
+
+    Args:
+        arr (list | array | ndarray): Arreglo a comprobar
+
+    Returns:
+        bool: True si cada elemento es <= que el siguiente
+    """
+    a = _como_numerico(arr)
+    if a is not None:
+        # Equivale a np.diff(a) >= 0 sin desbordar con enteros grandes
+        return bool(np.all(a[:-1] <= a[1:]))
+    return all(x <= y for x, y in zip(arr, arr[1:]))
+
+
+def huella_multiconjunto(arr) -> tuple:
+    """
+    Huella independiente del orden de los elementos
+
+    Args:
+        arr (list | array | ndarray): Arreglo
+
+    Returns:
+        tuple: (longitud, suma de hashes módulo 2^64)
+    """
+    a = _como_numerico(arr)
+    if a is not None:
+        if a.dtype.kind == 'f':
+            bits = a.astype(np.float64).view(np.uint64)
+        else:
+            bits = a.astype(np.int64).view(np.uint64)
+        return len(a), int(np.sum(_mezclar_splitmix64(bits), dtype=np.uint64))
+
+    return len(arr), sum(_hash_elemento(x) for x in arr) & _MASCARA_64
+
+
+def _hash_elemento(x) -> int:
+    """Hash de un elemento no numérico; los registros tipo diccionario no son hashables"""
+    try:
+        return hash(x)
+    except TypeError:
+        if isinstance(x, dict):
+            return hash(tuple(sorted(x.items())))
+        return hash(repr(x))
+
+
+def verificar_ordenamiento(salida, huella_entrada: tuple) -> Dict:
+    """
+    Verifica la salida de un algoritmo contra la huella de su entrada
+
+    Args:
+        salida: Arreglo retornado por el algoritmo
+        huella_entrada: huella_multiconjunto de la entrada
+
+    Returns:
+        dict: ordenado, permutacion y valido (ambas condiciones)
+    """
+    ordenado = esta_ordenado(salida)
+    permutacion = huella_multiconjunto(salida) == huella_entrada
+
+    return {
+        'ordenado': ordenado,
+        'permutacion': permutacion,
+        'valido': ordenado and permutacion
+    }
+
+
+class _Etiquetado:
+    """
+    Registro que se compara solo por su clave y recuerda su posición
+    original, para detectar si el algoritmo reordena claves iguales
+    """
+
+    __slots__ = ('clave', 'indice')
+
+    def __init__(self, clave, indice: int):
+        self.clave = clave
+        self.indice = indice
+
+    def __lt__(self, otro):
+        return self.clave < otro.clave
+
+    def __le__(self, otro):
+        return self.clave <= otro.clave
+
+    def __gt__(self, otro):
+        return self.clave > otro.clave
+
+    def __ge__(self, otro):
+        return self.clave >= otro.clave
+
+    def __eq__(self, otro):
+        return self.clave == otro.clave
+
+    __hash__ = None
+
+
+def verificar_estabilidad(algoritmo: Callable, arr) -> Optional[bool]:
+    """
+    Ordena registros etiquetados con su posición y comprueba que los de
+    igual clave conserven su orden relativo
+
+    Args:
+        algoritmo: Función con el contrato alg(arr) -> (ordenado, comp, ops)
+        arr: Arreglo de entrada
+
+    Returns:
+        bool: True si es estable en esta entrada, None si el algoritmo no
+              admite registros (por ejemplo, el ordenamiento externo)
+    """
+    registros = [_Etiquetado(clave, i) for i, clave in enumerate(convertir_formato(arr, 'lista'))]
+
+    try:
+        salida = algoritmo(registros)[0]
+    except (TypeError, ValueError, OverflowError):
+        return None
+
+    claves = [r.clave for r in salida]
+    indices = np.fromiter((r.indice for r in salida), dtype=np.int64, count=len(salida))
+
+    a = _como_numerico(claves)
+    if a is not None:
+        iguales = a[:-1] == a[1:]
+    else:
+        iguales = np.fromiter((x == y for x, y in zip(claves, claves[1:])),
+                              dtype=bool, count=max(0, len(claves) - 1))
+
+    return bool(np.all(indices[:-1][iguales] < indices[1:][iguales]))
+
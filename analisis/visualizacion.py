@@ -7,16 +7,85 @@ import plotly.graph_objects as go
 import plotly.express as px
 import numpy as np
 import pandas as pd
-from typing import Dict, List
+from typing import Dict, List, Tuple
 
 
-def graficar_comparacion(resultados: Dict, titulo: str = "Comparación de Algoritmos") -> go.Figure:
+# A partir de cuántos puntos por serie se usan trazas WebGL
+UMBRAL_WEBGL = 1000
+
+# Máximo de puntos por serie que se envían al navegador
+MAX_PUNTOS = 2000
+
+# Colores para series sin color asignado
+PALETA = px.colors.qualitative.Plotly
+
+
+def decimar_min_max(x: List, y: List, max_puntos: int = MAX_PUNTOS) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Reduce una serie a como máximo max_puntos conservando, en cada
+    intervalo, el mínimo y el máximo de y (así no se pierden picos)
+    
+    Args:
+        x: Valores del eje x (ordenados)
+        y: Valores del eje y
+        max_puntos: Número máximo de puntos a conservar
+        
+    Returns:
+        tuple: (x_decimado, y_decimado)
+    """
+    x = np.asarray(x)
+    y = np.asarray(y)
+    
+    if len(x) <= max_puntos or max_puntos < 4:
+        return x, y
+    
+    # Primer y último punto se conservan siempre
+    num_intervalos = (max_puntos - 2) // 2
+    bordes = np.linspace(1, len(x) - 1, num_intervalos + 1).astype(int)
+    
+    indices = [0]
+    for inicio, fin in zip(bordes[:-1], bordes[1:]):
+        if fin <= inicio:
+            continue
+        tramo = y[inicio:fin]
+        i_min = inicio + int(np.argmin(tramo))
+        i_max = inicio + int(np.argmax(tramo))
+        indices.extend(sorted({i_min, i_max}))
+    indices.append(len(x) - 1)
+    
+    return x[indices], y[indices]
+
+
+def _traza_dispersion(x: List, y: List, **kwargs):
+    """
+    Crea una traza de dispersión decimada, en WebGL si la serie es densa
+    """
+    usar_webgl = len(x) > UMBRAL_WEBGL
+    x, y = decimar_min_max(x, y)
+    
+    if usar_webgl:
+        return go.Scattergl(x=x, y=y, **kwargs)
+    return go.Scatter(x=x, y=y, **kwargs)
+
+
+# Color de las barras y marcadores de resultados que no pasaron la verificación
+COLOR_INVALIDO = '#9E9E9E'
+
+
+def _es_invalido(resultado: Dict) -> bool:
+    """Un resultado es inválido solo si se verificó y falló (None = sin verificar)"""
+    return resultado.get('valido') is False
+
+
+def graficar_comparacion(resultados: Dict, titulo: str = "Comparación de Algoritmos",
+                         escala_log: bool = False) -> go.Figure:
     """
     Crea un gráfico de barras comparando tiempos de ejecución
     
     Args:
         resultados: Diccionario con resultados de comparación
         titulo: Título del gráfico
+        escala_log: Si el eje de tiempo usa escala logarítmica
         
     Returns:
         Figure: Objeto de gráfico Plotly
@@ -24,6 +93,13 @@ def graficar_comparacion(resultados: Dict, titulo: str = "Comparación de Algori
     nombres = list(resultados.keys())
     tiempos = [resultados[nombre]['tiempo'] * 1000 for nombre in nombres]  # Convertir a ms
     desviaciones = [resultados[nombre]['desviacion'] * 1000 for nombre in nombres]
+    invalidos = [_es_invalido(resultados[nombre]) for nombre in nombres]
+    
+    colores_base = ['#FF6B6B', '#4ECDC4', '#45B7D1']
+    colores = [
+        COLOR_INVALIDO if invalido else (colores_base + PALETA)[i % (len(colores_base) + len(PALETA))]
+        for i, invalido in enumerate(invalidos)
+    ]
     
     fig = go.Figure()
     
@@ -31,8 +107,10 @@ def graficar_comparacion(resultados: Dict, titulo: str = "Comparación de Algori
         x=nombres,
         y=tiempos,
         error_y=dict(type='data', array=desviaciones),
-        marker_color=['#FF6B6B', '#4ECDC4', '#45B7D1'],
-        text=[f'{t:.4f} ms' for t in tiempos],
+        marker_color=colores,
+        marker_pattern_shape=['x' if invalido else '' for invalido in invalidos],
+        text=[f'❌ inválido · {t:.4f} ms' if invalido else f'{t:.4f} ms'
+              for t, invalido in zip(tiempos, invalidos)],
         textposition='outside'
     ))
     
@@ -40,6 +118,7 @@ def graficar_comparacion(resultados: Dict, titulo: str = "Comparación de Algori
         title=titulo,
         xaxis_title="Algoritmo",
         yaxis_title="Tiempo de Ejecución (ms)",
+        yaxis_type="log" if escala_log else "linear",
         template="plotly_white",
         height=500,
         showlegend=False
@@ -90,12 +169,17 @@ def graficar_comparacion_operaciones(resultados: Dict) -> go.Figure:
     return fig
 
 
-def graficar_crecimiento_asintotico(datos_analisis: Dict[str, List[Dict]]) -> go.Figure:
+def graficar_crecimiento_asintotico(datos_analisis: Dict[str, List[Dict]],
+                                    escala_log: bool = False) -> go.Figure:
     """
     Crea un gráfico mostrando el crecimiento asintótico de múltiples algoritmos
     
+    Las series con muchos tamaños se reducen conservando mínimos y máximos
+    y se dibujan con WebGL.
+    
     Args:
         datos_analisis: Diccionario con nombre de algoritmo y sus datos de análisis
+        escala_log: Si se usan ejes log-log (la pendiente estima el exponente)
         
     Returns:
         Figure: Objeto de gráfico Plotly
@@ -108,23 +192,36 @@ def graficar_crecimiento_asintotico(datos_analisis: Dict[str, List[Dict]]) -> go
         'Merge Sort': '#45B7D1'
     }
     
-    for nombre, datos in datos_analisis.items():
+    for i, (nombre, datos) in enumerate(datos_analisis.items()):
         tamanos = [d['tamano'] for d in datos]
         tiempos = [d['tiempo'] * 1000 for d in datos]  # Convertir a ms
         
-        fig.add_trace(go.Scatter(
-            x=tamanos,
-            y=tiempos,
+        fig.add_trace(_traza_dispersion(
+            tamanos,
+            tiempos,
             mode='lines+markers',
             name=nombre,
-            line=dict(width=3, color=colores.get(nombre, '#95a5a6')),
-            marker=dict(size=8)
+            line=dict(width=3, color=colores.get(nombre, PALETA[i % len(PALETA)])),
+            marker=dict(size=8 if len(tamanos) <= UMBRAL_WEBGL else 4)
         ))
+        
+        # Mediciones cuya salida no pasó la verificación
+        invalidos = [d for d in datos if _es_invalido(d)]
+        if invalidos:
+            fig.add_trace(go.Scatter(
+                x=[d['tamano'] for d in invalidos],
+                y=[d['tiempo'] * 1000 for d in invalidos],
+                mode='markers',
+                name=f'{nombre} (salida inválida)',
+                marker=dict(symbol='x', size=14, color=COLOR_INVALIDO, line=dict(width=2))
+            ))
     
     fig.update_layout(
         title="Crecimiento Asintótico de Algoritmos",
         xaxis_title="Tamaño de Entrada (n)",
         yaxis_title="Tiempo de Ejecución (ms)",
+        xaxis_type="log" if escala_log else "linear",
+        yaxis_type="log" if escala_log else "linear",
         template="plotly_white",
         height=600,
         hovermode='x unified',
@@ -139,6 +236,172 @@ def graficar_crecimiento_asintotico(datos_analisis: Dict[str, List[Dict]]) -> go
     return fig
 
 
+ETIQUETAS_DESORDEN = {
+    'inversiones': 'Inversiones',
+    'inversiones_norm': 'Inversiones Normalizadas (0 = ordenado, 1 = inverso)',
+    'corridas': 'Corridas Ascendentes',
+    'lis': 'Longitud de la Subsecuencia Creciente Más Larga',
+    'ratio_distintos': 'Proporción de Claves Distintas'
+}
+
+
+def graficar_tiempo_vs_desorden(datos_analisis: Dict[str, List[Dict]],
+                                metrica: str = 'inversiones_norm') -> go.Figure:
+    """
+    Crea un gráfico de dispersión del tiempo de ejecución contra una
+    métrica de desorden de la entrada
+    
+    Args:
+        datos_analisis: Diccionario con nombre de algoritmo y sus mediciones
+                        (cada una con 'tiempo' y la métrica de desorden)
+        metrica: Clave de la métrica de desorden a usar en el eje x
+        
+    Returns:
+        Figure: Objeto de gráfico Plotly
+    """
+    fig = go.Figure()
+    
+    colores = {
+        'Bubble Sort': '#FF6B6B',
+        'Quick Sort': '#4ECDC4',
+        'Merge Sort': '#45B7D1'
+    }
+    
+    for nombre, datos in datos_analisis.items():
+        datos = sorted((d for d in datos if metrica in d), key=lambda d: d[metrica])
+        
+        fig.add_trace(go.Scatter(
+            x=[d[metrica] for d in datos],
+            y=[d['tiempo'] * 1000 for d in datos],  # Convertir a ms
+            mode='lines+markers',
+            name=nombre,
+            hovertext=[f"n = {d['tamano']:,}" for d in datos],
+            line=dict(width=2, color=colores.get(nombre, '#95a5a6')),
+            marker=dict(size=9)
+        ))
+    
+    fig.update_layout(
+        title="Tiempo de Ejecución vs Desorden de la Entrada",
+        xaxis_title=ETIQUETAS_DESORDEN.get(metrica, metrica),
+        yaxis_title="Tiempo de Ejecución (ms)",
+        template="plotly_white",
+        height=500
+    )
+    
+    return fig
+
+
+def graficar_perfil(perfil: Dict, titulo: str = "Desglose por Función",
+                    max_funciones: int = 10) -> go.Figure:
+    """
+    Crea un gráfico de barras horizontales con el tiempo propio y acumulado
+    de cada función interna de un perfil
+    
+    Args:
+        perfil: Perfil retornado por perfilar_ejecucion
+        titulo: Título del gráfico
+        max_funciones: Número máximo de funciones a mostrar
+        
+    Returns:
+        Figure: Objeto de gráfico Plotly
+    """
+    funciones = perfil['funciones'][:max_funciones][::-1]
+    nombres = [f['funcion'] for f in funciones]
+    
+    fig = go.Figure()
+    
+    fig.add_trace(go.Bar(
+        name='Tiempo propio',
+        y=nombres,
+        x=[f['tiempo_propio'] * 1000 for f in funciones],
+        orientation='h',
+        marker_color='#FF6B6B',
+        text=[f"{f['llamadas']:,} llamadas" for f in funciones],
+        textposition='auto'
+    ))
+    
+    fig.add_trace(go.Bar(
+        name='Tiempo acumulado',
+        y=nombres,
+        x=[f['tiempo_acumulado'] * 1000 for f in funciones],
+        orientation='h',
+        marker_color='#45B7D1'
+    ))
+    
+    fig.update_layout(
+        title=titulo,
+        xaxis_title="Tiempo bajo perfilador (ms)",
+        barmode='group',
+        template="plotly_white",
+        height=max(300, 60 * len(funciones) + 150)
+    )
+    
+    return fig
+
+
+def graficar_distribucion_tiempos(resultados: Dict, tipo: str = 'box',
+                                  escala_log: bool = False) -> go.Figure:
+    """
+    Resume la distribución de los tiempos por repetición de cada algoritmo
+    
+    Las cajas se envían como estadísticos precalculados (cuartiles y
+    bigotes) y los violines como cuantiles de la muestra, de modo que el
+    tamaño del gráfico no crece con el número de repeticiones.
+    
+    Args:
+        resultados: Diccionario con resultados de comparación (con 'tiempos')
+        tipo: 'box' (caja) o 'violin'
+        escala_log: Si el eje de tiempo usa escala logarítmica
+        
+    Returns:
+        Figure: Objeto de gráfico Plotly
+    """
+    colores = ['#FF6B6B', '#4ECDC4', '#45B7D1']
+    fig = go.Figure()
+    
+    for i, (nombre, res) in enumerate(resultados.items()):
+        muestras = np.asarray(res['tiempos']) * 1000  # Convertir a ms
+        color = colores[i % len(colores)]
+        
+        if tipo == 'violin':
+            if len(muestras) > MAX_PUNTOS:
+                muestras = np.quantile(muestras, np.linspace(0, 1, MAX_PUNTOS))
+            fig.add_trace(go.Violin(
+                y=muestras,
+                name=nombre,
+                box_visible=True,
+                meanline_visible=True,
+                points=False,
+                line_color=color
+            ))
+        else:
+            q1, mediana, q3 = np.percentile(muestras, [25, 50, 75])
+            rango = 1.5 * (q3 - q1)
+            fig.add_trace(go.Box(
+                x=[nombre],
+                q1=[q1],
+                median=[mediana],
+                q3=[q3],
+                lowerfence=[max(muestras.min(), q1 - rango)],
+                upperfence=[min(muestras.max(), q3 + rango)],
+                mean=[muestras.mean()],
+                name=nombre,
+                marker_color=color
+            ))
+    
+    fig.update_layout(
+        title="Distribución de Tiempos por Repetición",
+        xaxis_title="Algoritmo",
+        yaxis_title="Tiempo de Ejecución (ms)",
+        yaxis_type="log" if escala_log else "linear",
+        template="plotly_white",
+        height=500,
+        showlegend=False
+    )
+    
+    return fig
+
+
 def graficar_complejidad_teorica(tamano_max: int = 1000) -> go.Figure:
     """
     Grafica las complejidades teóricas para comparación
@@ -193,29 +456,79 @@ def graficar_complejidad_teorica(tamano_max: int = 1000) -> go.Figure:
     return fig
 
 
+# Columnas de las métricas del ContadorOperaciones (las comparaciones ya tienen columna)
+ETIQUETAS_CONTADOR = {
+    'intercambios': 'Intercambios',
+    'lecturas': 'Lecturas',
+    'escrituras': 'Escrituras',
+    'memoria_aux': 'Memoria Auxiliar (elementos)',
+    'profundidad_max': 'Profundidad Máx.'
+}
+
+
 def crear_tabla_comparativa(resultados: Dict) -> pd.DataFrame:
     """
     Crea una tabla DataFrame con los resultados comparativos
     
+    Los valores quedan numéricos (tiempos en ms, memoria en KiB, validez
+    como booleano) para poder ordenarlos y exportarlos; FORMATOS_TABLA
+    indica cómo mostrarlos.
+    
     Args:
-        resultados: Diccionario con resultados de comparación
+        resultados: Diccionario con resultados de comparación (las métricas
+                    del ContadorOperaciones se agregan como columnas si están)
         
     Returns:
-        DataFrame: Tabla con resultados formateados
+        DataFrame: Tabla con una fila por algoritmo
     """
     datos = []
     
     for nombre, res in resultados.items():
-        datos.append({
+        fila = {
             'Algoritmo': nombre,
-            'Tiempo (ms)': f"{res['tiempo'] * 1000:.4f}",
-            'Desviación (ms)': f"{res['desviacion'] * 1000:.4f}",
-            'Comparaciones': f"{res['comparaciones']:,}",
-            'Operaciones': f"{res['operaciones']:,}",
-            'Tamaño': f"{res['tamano']:,}"
-        })
+            'Tiempo (ms)': res['tiempo'] * 1000,
+            'Desviación (ms)': res['desviacion'] * 1000,
+            'Comparaciones': res['comparaciones'],
+            'Operaciones': res['operaciones'],
+            'Tamaño': res['tamano']
+        }
+        
+        for metrica, etiqueta in ETIQUETAS_CONTADOR.items():
+            if metrica in res:
+                fila[etiqueta] = res[metrica]
+        
+        if 'memoria_pico' in res:
+            fila['Memoria Pico (KiB)'] = res['memoria_pico'] / 1024
+        
+        if res.get('valido') is not None:
+            fila['Válido'] = res['valido']
+        if res.get('estable') is not None:
+            fila['Estable'] = res['estable']
+        
+        datos.append(fila)
     
-    return pd.DataFrame(datos)
+    tabla = pd.DataFrame(datos)
+    # Columnas que solo traen algunos algoritmos: enteros y booleanos con nulos
+    for columna in tabla.columns:
+        if columna in ('Válido', 'Estable'):
+            tabla[columna] = tabla[columna].astype('boolean')
+        elif columna in ETIQUETAS_CONTADOR.values():
+            tabla[columna] = tabla[columna].astype('Int64')
+    
+    return tabla
+
+
+# Formato de presentación de cada columna numérica de crear_tabla_comparativa
+# (estilo printf, el que usa la configuración de columnas de Streamlit)
+FORMATOS_TABLA = {
+    'Tiempo (ms)': '%.4f',
+    'Desviación (ms)': '%.4f',
+    'Memoria Pico (KiB)': '%.1f',
+    'Comparaciones': '%d',
+    'Operaciones': '%d',
+    'Tamaño': '%d',
+    **{etiqueta: '%d' for etiqueta in ETIQUETAS_CONTADOR.values()}
+}
 
 
 def graficar_heatmap_rendimiento(datos_multiple: Dict[str, Dict]) -> go.Figure:
@@ -233,10 +546,13 @@ def graficar_heatmap_rendimiento(datos_multiple: Dict[str, Dict]) -> go.Figure:
     escenarios = list(datos_multiple.keys())
     
     tiempos = []
+    textos = []
     for escenario in escenarios:
-        tiempos.append([
-            datos_multiple[escenario][algo]['tiempo'] * 1000 
-            for algo in algoritmos
+        fila = [datos_multiple[escenario][algo] for algo in algoritmos]
+        tiempos.append([res['tiempo'] * 1000 for res in fila])
+        textos.append([
+            f"❌ {res['tiempo'] * 1000:.3f} ms" if _es_invalido(res) else f"{res['tiempo'] * 1000:.3f} ms"
+            for res in fila
         ])
     
     fig = go.Figure(data=go.Heatmap(
@@ -244,7 +560,7 @@ def graficar_heatmap_rendimiento(datos_multiple: Dict[str, Dict]) -> go.Figure:
         x=algoritmos,
         y=escenarios,
         colorscale='RdYlGn_r',
-        text=[[f'{val:.3f} ms' for val in row] for row in tiempos],
+        text=textos,
         texttemplate='%{text}',
         textfont={"size": 10},
         colorbar=dict(title="Tiempo (ms)")
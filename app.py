@@ -8,22 +8,45 @@ Los datos obtenidos deben usarse en el informe para análisis y comparación
 Fecha: Noviembre 2025
 """
 
+import os
 import streamlit as st
 import pandas as pd
 import numpy as np
-from algoritmos import bubble_sort, quick_sort, merge_sort
+from algoritmos import ALGORITMOS, SOLO_ENTEROS
+from algoritmos.bubble_sort import bubble_sort_animacion
+from algoritmos.quick_sort import quick_sort_animacion
+from algoritmos.merge_sort import merge_sort_animacion
 from analisis.medicion import (
     comparar_algoritmos, 
     analizar_complejidad, 
     calcular_metricas,
-    estimar_complejidad_empirica
+    estimar_complejidad_empirica,
+    ejecutar_matriz_escenarios,
+    calcular_mejor_peor_caso
 )
+from analisis.desorden import calcular_desorden
+from analisis.perfilado import exportar_speedscope
+from analisis.animacion import comprimir_pasos, graficar_animacion
+from analisis.experimentos import (
+    ejecutar_barrido, cargar_barrido, listar_barridos, generar_datos_celda
+)
+from analisis.aislamiento import comparar_aislado
+from analisis.modelo_costos import calibrar_maquina, guardar_perfil, cargar_perfiles
+from analisis.autoajuste import autoajustar
+from algoritmos.hibridos import cargar_umbrales
 from analisis.visualizacion import (
     graficar_comparacion, 
     graficar_comparacion_operaciones,
     graficar_crecimiento_asintotico,
-    crear_tabla_comparativa
+    graficar_perfil,
+    graficar_distribucion_tiempos,
+    graficar_heatmap_rendimiento,
+    graficar_tiempo_vs_desorden,
+    crear_tabla_comparativa,
+    ETIQUETAS_DESORDEN,
+    FORMATOS_TABLA
 )
+from analisis.tablas import construir_tabla, construir_tabla_por_tipo, exportar_bytes
 from utils.generadores import (
     generar_aleatorio,
     generar_ordenado,
@@ -31,6 +54,15 @@ from utils.generadores import (
     generar_casi_ordenado,
     generar_duplicados
 )
+from utils.adversarios import ADVERSARIOS, TAMANO_MAX_ANTIQUICKSORT
+from utils.tipos_elemento import TIPOS_ELEMENTO, convertir_elementos
+
+# Algoritmos con versión de animación
+FUNCIONES_ANIMACION = {
+    "Bubble Sort": bubble_sort_animacion,
+    "Quick Sort": quick_sort_animacion,
+    "Merge Sort": merge_sort_animacion
+}
 
 
 # Configuración de la página
@@ -89,7 +121,8 @@ def main():
         # Selección de modo
         modo = st.radio(
             "Modo de Ejecución:",
-            ["Ejecución Simple", "Análisis de Escalabilidad"]
+            ["Ejecución Simple", "Análisis de Escalabilidad", "Matriz de Escenarios",
+             "Visualización Paso a Paso", "Resultados Guardados"]
         )
         
         st.divider()
@@ -109,16 +142,45 @@ def main():
         tipo_datos = st.selectbox(
             "Tipo de datos:",
             ["Aleatorio", "Ordenado", "Inverso", "Casi Ordenado", "Con Duplicados"]
+            + list(ADVERSARIOS.keys()),
+            help="Los tipos adversarios fuerzan el peor caso: el adversario de Quick Sort ataca la regla de pivote último"
+        )
+        if tipo_datos == "Adversario Quick Sort" and tamano > TAMANO_MAX_ANTIQUICKSORT:
+            st.warning(f"⚠️ El adversario de Quick Sort es O(n²) de generar: "
+                       f"se usa n = {TAMANO_MAX_ANTIQUICKSORT:,}")
+            tamano = TAMANO_MAX_ANTIQUICKSORT
+        
+        representaciones = {
+            "Lista de Python": 'lista',
+            "array('q')": 'array',
+            "NumPy int64": 'numpy'
+        }
+        formato = representaciones[st.selectbox(
+            "Representación en memoria:",
+            list(representaciones.keys()),
+            help="array('q') y NumPy guardan 8 bytes por elemento en lugar de ~36 de una lista"
+        )]
+        
+        tipo_elemento = st.selectbox(
+            "Tipo de elemento:",
+            list(TIPOS_ELEMENTO),
+            help="Conserva la forma de los datos y cambia el costo de comparar: cadenas, tuplas y registros son más caros que enteros"
         )
+        if tipo_elemento != 'Entero' and formato != 'lista':
+            st.caption("Los elementos que no son enteros se guardan en una lista de Python.")
+            formato = 'lista'
         
         st.divider()
         
         # Selección de algoritmos
         st.subheader("Algoritmos a Comparar")
         
-        usar_bubble = st.checkbox("Bubble Sort", value=True)
-        usar_quick = st.checkbox("Quick Sort", value=True)
-        usar_merge = st.checkbox("Merge Sort", value=True)
+        seleccionados = st.multiselect(
+            "Algoritmos:",
+            list(ALGORITMOS),
+            default=["Bubble Sort", "Quick Sort", "Merge Sort"],
+            help="Las variantes híbridas usan el umbral de corte calibrado para esta máquina (ver Análisis de Escalabilidad)"
+        )
         
         st.divider()
         
@@ -127,8 +189,13 @@ def main():
             st.markdown("""
             **Algoritmos Implementados:**
             - **Bubble Sort:** O(n²) - Simple, educativo
+            - **Shell Sort / Comb Sort:** Bubble/Insertion con brechas decrecientes (Ciura, Tokuda, Sedgewick)
             - **Quick Sort:** O(n log n) promedio - Eficiente en práctica
+            - **Quick Sort Doble Pivote:** Tres particiones con dos pivotes (mediana de cinco)
             - **Merge Sort:** O(n log n) garantizado - Estable
+            - **Merge Sort Memoria Acotada:** Estable con un buffer de O(√n) elementos
+            - **Merge Sort Externo:** Ordena por bloques en disco con memoria acotada
+            - **Híbridos:** Quick/Merge Sort con corte a Insertion Sort en subarreglos pequeños
             
             **Nota:** Los datos obtenidos son para uso en tu informe.
             El análisis teórico y comparación se hace en el documento.
@@ -136,65 +203,219 @@ def main():
     
     # Contenido principal según el modo seleccionado
     if modo == "Ejecución Simple":
-        mostrar_ejecucion_simple(tamano, tipo_datos, usar_bubble, usar_quick, usar_merge)
+        mostrar_ejecucion_simple(tamano, tipo_datos, formato, tipo_elemento, seleccionados)
     
     elif modo == "Análisis de Escalabilidad":
-        mostrar_analisis_escalabilidad(usar_bubble, usar_quick, usar_merge)
+        mostrar_analisis_escalabilidad(formato, tipo_elemento, seleccionados)
+    
+    elif modo == "Matriz de Escenarios":
+        mostrar_matriz_escenarios(tamano, formato, seleccionados)
+    
+    elif modo == "Visualización Paso a Paso":
+        mostrar_visualizacion_paso_a_paso(tipo_datos, seleccionados)
+    
+    elif modo == "Resultados Guardados":
+        mostrar_resultados_guardados()
 
 
-def mostrar_ejecucion_simple(tamano, tipo_datos, usar_bubble, usar_quick, usar_merge):
-    """Ejecuta los algoritmos y muestra resultados experimentales"""
-    st.markdown('<h2 class="sub-header">⚡ Ejecución y Medición de Algoritmos</h2>', 
-                unsafe_allow_html=True)
-    
-    # Generar datos según el tipo seleccionado
+def generar_datos(tipo_datos, tamano, formato='lista'):
+    """Genera los datos de entrada según el tipo y la representación seleccionados"""
     if tipo_datos == "Aleatorio":
-        datos = generar_aleatorio(tamano)
+        return generar_aleatorio(tamano, formato=formato)
     elif tipo_datos == "Ordenado":
-        datos = generar_ordenado(tamano)
+        return generar_ordenado(tamano, formato=formato)
     elif tipo_datos == "Inverso":
-        datos = generar_inverso(tamano)
+        return generar_inverso(tamano, formato=formato)
     elif tipo_datos == "Casi Ordenado":
-        datos = generar_casi_ordenado(tamano)
+        return generar_casi_ordenado(tamano, formato=formato)
+    elif tipo_datos in ADVERSARIOS:
+        return ADVERSARIOS[tipo_datos](tamano, formato=formato)
+    else:
+        return generar_duplicados(tamano, formato=formato)
+
+
+def seleccionar_algoritmos(seleccionados, tamano_max=None, tipo_elemento='Entero'):
+    """
+    Construye el diccionario de algoritmos a medir, descartando con un
+    aviso los que no convienen para la configuración
+    """
+    algoritmos = {}
+    for nombre in seleccionados:
+        if nombre == "Bubble Sort" and tamano_max is not None and tamano_max > 3000:
+            st.warning("⚠️ Bubble Sort deshabilitado para tamaños > 3000 (muy lento)")
+        elif ALGORITMOS[nombre] in SOLO_ENTEROS and tipo_elemento != 'Entero':
+            st.warning(f"⚠️ {nombre} solo ordena enteros de 64 bits")
+        else:
+            algoritmos[nombre] = ALGORITMOS[nombre]
+    return algoritmos
+
+
+# Formatos de descarga de la tabla larga: (extensión, tipo MIME)
+FORMATOS_DESCARGA = {
+    'CSV': ('csv', 'text/csv'),
+    'Parquet': ('parquet', 'application/vnd.apache.parquet'),
+    'Arrow (Feather)': ('arrow', 'application/vnd.apache.arrow.file')
+}
+
+
+def mostrar_tabla(tabla):
+    """Muestra una tabla numérica aplicando FORMATOS_TABLA solo en la presentación"""
+    st.dataframe(
+        tabla,
+        use_container_width=True,
+        column_config={
+            columna: st.column_config.NumberColumn(format=formato)
+            for columna, formato in FORMATOS_TABLA.items()
+            if columna in tabla.columns
+        }
+    )
+
+
+def ofrecer_descarga(tabla, nombre_base, clave):
+    """Botón para descargar la tabla larga (una fila por repetición)"""
+    col1, col2 = st.columns([1, 2])
+    with col1:
+        formato = st.selectbox("Formato:", list(FORMATOS_DESCARGA), key=f"formato_{clave}")
+    extension, mime = FORMATOS_DESCARGA[formato]
+    with col2:
+        try:
+            datos = exportar_bytes(tabla, extension)
+        except ImportError:
+            st.warning("⚠️ Parquet y Arrow requieren pyarrow (pip install pyarrow)")
+            return
+        st.download_button(
+            f"💾 Descargar {len(tabla):,} filas ({formato})",
+            data=datos,
+            file_name=f"{nombre_base}.{extension}",
+            mime=mime,
+            key=f"descarga_{clave}"
+        )
+
+
+def mostrar_ejecucion_simple(tamano, tipo_datos, formato, tipo_elemento, seleccionados):
+    """Ejecuta los algoritmos y muestra resultados experimentales"""
+    st.markdown('<h2 class="sub-header">⚡ Ejecución y Medición de Algoritmos</h2>', 
+                unsafe_allow_html=True)
+    
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        aislado = st.checkbox(
+            "🧪 Medición aislada",
+            value=False,
+            disabled=tipo_elemento != 'Entero',
+            help="Mide cada algoritmo en un intérprete nuevo con PYTHONHASHSEED fijo y guarda un manifiesto del entorno (solo enteros)"
+        ) and tipo_elemento == 'Entero'
+    with col2:
+        semilla = st.number_input("Semilla de datos", min_value=0, value=0, step=1,
+                                  disabled=not aislado)
+    with col3:
+        cpus = sorted(os.sched_getaffinity(0)) if hasattr(os, 'sched_getaffinity') else []
+        cpu_elegida = st.selectbox("Fijar a la CPU", ["Sin fijar"] + cpus,
+                                   disabled=not aislado or not cpus)
+        cpu = None if cpu_elegida == "Sin fijar" else cpu_elegida
+    
+    # Generar datos según el tipo seleccionado (con semilla si la medición es aislada,
+    # para mostrar exactamente la entrada que recibirán los procesos hijos)
+    if aislado:
+        datos = generar_datos_celda(tipo_datos, tamano, int(semilla), formato)
     else:
-        datos = generar_duplicados(tamano)
+        datos = generar_datos(tipo_datos, tamano, formato)
+    
+    # Métricas de desorden de la entrada (la conversión de tipo conserva el orden)
+    desorden = calcular_desorden(datos)
+    if tipo_elemento != 'Entero':
+        datos = convertir_elementos(datos, tipo_elemento)
     
     # Mostrar información de los datos
     col1, col2, col3 = st.columns(3)
     with col1:
         st.metric("Tamaño del Arreglo", f"{len(datos):,}")
     with col2:
-        st.metric("Tipo de Datos", tipo_datos)
+        st.metric("Tipo de Datos", f"{tipo_datos} · {tipo_elemento}")
     with col3:
-        st.metric("Rango de Valores", f"{min(datos)} - {max(datos)}")
+        if tipo_elemento == 'Entero':
+            st.metric("Rango de Valores", f"{min(datos)} - {max(datos)}")
+        else:
+            st.metric("Claves Distintas", f"{len({repr(x) for x in datos}):,}")
+    
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.metric("Inversiones", f"{desorden['inversiones']:,}",
+                  help=f"Normalizadas: {desorden['inversiones_norm']:.4f} (0 = ordenado, 1 = inverso)")
+    with col2:
+        st.metric("Corridas Ascendentes", f"{desorden['corridas']:,}")
+    with col3:
+        st.metric("Subsecuencia Creciente Más Larga", f"{desorden['lis']:,}")
+    with col4:
+        st.metric("Claves Distintas", f"{desorden['ratio_distintos']:.1%}")
     
     # Vista previa de datos (primeros 20 elementos)
     with st.expander("👁️ Ver datos de entrada (primeros 20)"):
-        st.write(datos[:20])
+        st.write(list(datos[:20]))
     
     st.divider()
     
     # Seleccionar algoritmos
-    algoritmos = {}
-    if usar_bubble:
-        algoritmos["Bubble Sort"] = bubble_sort
-    if usar_quick:
-        algoritmos["Quick Sort"] = quick_sort
-    if usar_merge:
-        algoritmos["Merge Sort"] = merge_sort
+    algoritmos = seleccionar_algoritmos(seleccionados, tipo_elemento=tipo_elemento)
     
     if not algoritmos:
         st.warning("⚠️ Selecciona al menos un algoritmo para comparar")
         return
     
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        perfilar = st.checkbox(
+            "🔬 Perfilar funciones internas",
+            value=False,
+            disabled=aislado,
+            help="Ejecuta repeticiones extra (no cronometradas) bajo el perfilador para desglosar el tiempo por función"
+        ) and not aislado
+    with col2:
+        calibrado = st.checkbox(
+            "⏱️ Medición calibrada (lotes)",
+            value=tamano <= 500,
+            disabled=aislado,
+            help="Cronometra lotes de llamadas y descuenta la sobrecarga del lazo; recomendado para n pequeño"
+        ) and not aislado
+    with col3:
+        verificar_estable = st.checkbox(
+            "⚖️ Verificar estabilidad",
+            value=False,
+            disabled=aislado,
+            help="Ordena además registros etiquetados con su posición para comprobar que las claves iguales conserven su orden"
+        ) and not aislado
+    with col4:
+        medir_memoria = st.checkbox(
+            "📦 Medir memoria pico",
+            value=False,
+            disabled=aislado,
+            help="Ejecuta una repetición extra (no cronometrada) bajo tracemalloc y agrega la columna Memoria Pico a la tabla"
+        ) and not aislado
+    
     # Ejecutar comparación
     with st.spinner("🔄 Ejecutando algoritmos..."):
-        resultados = comparar_algoritmos(algoritmos, datos, repeticiones=3)
+        if aislado:
+            resultados = comparar_aislado(list(algoritmos), tipo_datos, tamano, repeticiones=3,
+                                          semilla=int(semilla), formato=formato, cpu=cpu)
+        else:
+            # El desorden ya se midió sobre los enteros (vale para cualquier tipo)
+            resultados = comparar_algoritmos(algoritmos, datos, repeticiones=3,
+                                             medir_desorden=False,
+                                             perfilar=perfilar, calibrado=calibrado,
+                                             verificar_estable=verificar_estable,
+                                             medir_memoria=medir_memoria)
+            for resultado in resultados.values():
+                resultado.update(desorden)
         metricas = calcular_metricas(resultados)
     
     # Mostrar resultados destacados
     st.success("✅ Análisis completado!")
     
+    invalidos = [nombre for nombre, res in resultados.items() if res.get('valido') is False]
+    if invalidos:
+        st.error(f"❌ Salida incorrecta (no ordenada o no es permutación de la entrada): {', '.join(invalidos)}. "
+                 "Sus tiempos no son comparables.")
+    
     col1, col2, col3 = st.columns(3)
     with col1:
         st.info(f"🏆 **Más Rápido:**  \n{metricas['mas_rapido']}")
@@ -211,7 +432,8 @@ def mostrar_ejecucion_simple(tamano, tipo_datos, usar_bubble, usar_quick, usar_m
     
     with col1:
         st.subheader("📊 Tiempos de Ejecución")
-        fig_tiempo = graficar_comparacion(resultados)
+        escala_log = st.checkbox("Escala logarítmica", value=False, key="log_comparacion")
+        fig_tiempo = graficar_comparacion(resultados, escala_log=escala_log)
         st.plotly_chart(fig_tiempo, use_container_width=True)
     
     with col2:
@@ -219,13 +441,34 @@ def mostrar_ejecucion_simple(tamano, tipo_datos, usar_bubble, usar_quick, usar_m
         fig_ops = graficar_comparacion_operaciones(resultados)
         st.plotly_chart(fig_ops, use_container_width=True)
     
+    # Distribución de las repeticiones
+    st.subheader("📦 Distribución de Tiempos por Repetición")
+    tipo_distribucion = st.radio("Resumen:", ["Caja", "Violín"], horizontal=True)
+    fig_distribucion = graficar_distribucion_tiempos(
+        resultados,
+        tipo='violin' if tipo_distribucion == "Violín" else 'box',
+        escala_log=escala_log
+    )
+    st.plotly_chart(fig_distribucion, use_container_width=True)
+    
     # Tabla detallada
     st.subheader("📋 Datos para el Informe")
     tabla = crear_tabla_comparativa(resultados)
-    st.dataframe(tabla, use_container_width=True)
+    mostrar_tabla(tabla)
+    ofrecer_descarga(construir_tabla(resultados, tipo_datos, tipo_elemento),
+                     f"resultados_{tipo_datos}_{tamano}", "simple")
     
     st.info("💾 **Tip:** Puedes copiar estos datos directamente a tu informe. Haz clic en la tabla y usa Ctrl+C.")
     
+    if perfilar:
+        mostrar_perfiles(resultados)
+    
+    if aislado:
+        with st.expander("🧾 Manifiestos de ejecución"):
+            for nombre, res in resultados.items():
+                st.markdown(f"**{nombre}**")
+                st.json(res['manifiesto'])
+    
     # Datos adicionales
     st.subheader("📈 Datos Experimentales Detallados")
     
@@ -236,9 +479,11 @@ def mostrar_ejecucion_simple(tamano, tipo_datos, usar_bubble, usar_quick, usar_m
             - Tamaño de entrada (n): {res['tamano']:,} elementos
             - Tiempo promedio: {res['tiempo']*1000:.6f} ms
             - Desviación estándar: {res['desviacion']*1000:.6f} ms
+            - Llamadas por repetición: {res.get('bucles', 1):,}
             - Comparaciones: {res['comparaciones']:,}
             - Intercambios/Movimientos: {res['operaciones']:,}
             - Tipo de datos: {tipo_datos}
+            - Inversiones de la entrada: {res['inversiones']:,} ({res['inversiones_norm']:.4f} normalizadas)
             
             **Usa estos datos en tu informe para:**
             - Tabla de resultados experimentales
@@ -247,7 +492,177 @@ def mostrar_ejecucion_simple(tamano, tipo_datos, usar_bubble, usar_quick, usar_m
             """)
 
 
-def mostrar_analisis_escalabilidad(usar_bubble, usar_quick, usar_merge):
+def mostrar_perfiles(resultados):
+    """Muestra el desglose por función de cada algoritmo perfilado"""
+    st.subheader("🔬 Desglose por Función Interna")
+    st.caption("Tiempos medidos bajo el perfilador: incluyen su sobrecarga, compáralos como proporciones.")
+    
+    for nombre, res in resultados.items():
+        perfil = res['perfil']
+        with st.expander(f"🔬 Perfil de {nombre}"):
+            st.plotly_chart(graficar_perfil(perfil, f"Desglose de {nombre}"), use_container_width=True)
+            
+            df = pd.DataFrame(perfil['funciones'])
+            df['tiempo_propio_ms'] = df['tiempo_propio'] * 1000
+            df['tiempo_acumulado_ms'] = df['tiempo_acumulado'] * 1000
+            df['porcentaje'] = df['tiempo_propio'] / perfil['tiempo_total'] * 100
+            df_mostrar = df[['funcion', 'llamadas', 'tiempo_propio_ms', 'tiempo_acumulado_ms', 'porcentaje']].copy()
+            df_mostrar.columns = ['Función', 'Llamadas', 'Tiempo Propio (ms)', 'Tiempo Acumulado (ms)', '% del Total']
+            st.dataframe(df_mostrar, use_container_width=True)
+            
+            if perfil['eventos_truncados']:
+                st.caption(f"⚠️ El flamegraph cubre solo los primeros {len(perfil['eventos']):,} eventos "
+                           f"({perfil['tiempo_eventos'] * 1000:.1f} ms trazados); la tabla cubre toda la ejecución.")
+            st.download_button(
+                "💾 Descargar flamegraph (speedscope JSON)",
+                data=exportar_speedscope(perfil, nombre),
+                file_name=f"perfil_{nombre.lower().replace(' ', '_')}.speedscope.json",
+                mime="application/json",
+                key=f"speedscope_{nombre}"
+            )
+
+
+def mostrar_matriz_escenarios(tamano, formato, seleccionados):
+    """Mide cada algoritmo contra los seis tipos de datos y muestra el mapa de calor"""
+    st.markdown('<h2 class="sub-header">🧮 Matriz de Escenarios</h2>', 
+                unsafe_allow_html=True)
+    
+    st.info(f"""
+    🧮 **Objetivo:** Medir cada algoritmo con los seis tipos de datos a n = {tamano:,}.
+    Las celdas se ejecutan en paralelo y el mapa de calor muestra en qué escenarios rinde mejor o peor.
+    """)
+    
+    algoritmos = seleccionar_algoritmos(seleccionados, tamano_max=tamano)
+    
+    if not algoritmos:
+        st.warning("⚠️ Selecciona al menos un algoritmo")
+        return
+    
+    configuracion = (tamano, formato, tuple(algoritmos))
+    
+    if st.button("🚀 Ejecutar Matriz de Escenarios", type="primary"):
+        with st.spinner(f"🔄 Ejecutando {len(algoritmos) * 6} celdas en paralelo..."):
+            st.session_state['matriz_escenarios'] = (
+                configuracion,
+                ejecutar_matriz_escenarios(algoritmos, tamano, formato=formato)
+            )
+    
+    # Los resultados se conservan entre interacciones mientras no cambie la configuración
+    guardado = st.session_state.get('matriz_escenarios')
+    if guardado is None or guardado[0] != configuracion:
+        return
+    datos_multiple = guardado[1]
+    
+    st.success("✅ Matriz completada!")
+    
+    st.subheader("🌡️ Mapa de Calor")
+    st.plotly_chart(graficar_heatmap_rendimiento(datos_multiple), use_container_width=True)
+    
+    st.subheader("📋 Resultados por Celda")
+    df = pd.DataFrame([
+        {
+            'Escenario': escenario,
+            'Algoritmo': nombre,
+            'Tiempo (ms)': res['tiempo'] * 1000,
+            'Desviación (ms)': res['desviacion'] * 1000,
+            'Comparaciones': res['comparaciones'],
+            'Operaciones': res['operaciones'],
+            'Inversiones Norm.': res['inversiones_norm'],
+            'Corridas': res['corridas']
+        }
+        for escenario, resultados in datos_multiple.items()
+        for nombre, res in resultados.items()
+    ])
+    st.dataframe(df, use_container_width=True)
+    ofrecer_descarga(construir_tabla_por_tipo(datos_multiple), f"matriz_{tamano}", "matriz")
+    
+    st.subheader("🔀 Tiempo vs Desorden")
+    metrica = st.selectbox(
+        "Métrica de desorden:",
+        list(ETIQUETAS_DESORDEN.keys()),
+        format_func=ETIQUETAS_DESORDEN.get
+    )
+    por_algoritmo = {
+        nombre: [resultados[nombre] for resultados in datos_multiple.values()]
+        for nombre in algoritmos
+    }
+    st.plotly_chart(graficar_tiempo_vs_desorden(por_algoritmo, metrica), use_container_width=True)
+    
+    if st.button("🎯 Mostrar mejor y peor caso"):
+        casos = calcular_mejor_peor_caso(datos_multiple)
+        st.dataframe(pd.DataFrame([
+            {
+                'Algoritmo': nombre,
+                'Mejor Caso': caso['mejor_caso'],
+                'Tiempo Mejor (ms)': caso['tiempo_mejor'] * 1000,
+                'Peor Caso': caso['peor_caso'],
+                'Tiempo Peor (ms)': caso['tiempo_peor'] * 1000,
+                'Peor / Mejor': caso['razon']
+            }
+            for nombre, caso in casos.items()
+        ]), use_container_width=True)
+
+
+@st.cache_data(show_spinner=False)
+def calcular_cuadros_animacion(nombre_algoritmo, datos, presupuesto_frames):
+    """Ejecuta la versión de animación del algoritmo y comprime sus pasos"""
+    pasos = FUNCIONES_ANIMACION[nombre_algoritmo](datos)
+    return comprimir_pasos(pasos, presupuesto_frames)
+
+
+def mostrar_visualizacion_paso_a_paso(tipo_datos, seleccionados):
+    """Reproduce el ordenamiento de un arreglo pequeño cuadro a cuadro"""
+    st.markdown('<h2 class="sub-header">🎞️ Visualización Paso a Paso</h2>', 
+                unsafe_allow_html=True)
+    
+    st.info("""
+    🎞️ **Objetivo:** Observar cómo cada algoritmo mueve los elementos.
+    Los cuadros se calculan una vez en el servidor y la reproducción ocurre en el navegador.
+    """)
+    
+    nombres = [nombre for nombre in seleccionados if nombre in FUNCIONES_ANIMACION]
+    if not nombres:
+        st.warning(f"⚠️ Selecciona al menos un algoritmo con animación: {', '.join(FUNCIONES_ANIMACION)}")
+        return
+    
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        nombre_algoritmo = st.selectbox("Algoritmo:", nombres)
+    with col2:
+        tamano = st.slider("Tamaño del arreglo:", min_value=5, max_value=100, value=30, step=5)
+    with col3:
+        presupuesto = st.slider(
+            "Máximo de cuadros:",
+            min_value=20,
+            max_value=300,
+            value=120,
+            step=10,
+            help="Los pasos se reducen a este número de cuadros equiespaciados"
+        )
+    
+    # Mantener los mismos datos mientras no cambie la configuración
+    # (el botón se evalúa antes para que se dibuje en todas las ejecuciones)
+    clave = (tipo_datos, tamano)
+    nuevos_datos = st.button("🔀 Nuevos datos")
+    if st.session_state.get('clave_animacion') != clave or nuevos_datos:
+        st.session_state['clave_animacion'] = clave
+        st.session_state['datos_animacion'] = generar_datos(tipo_datos, tamano)
+    datos = st.session_state['datos_animacion']
+    
+    compacto = calcular_cuadros_animacion(nombre_algoritmo, datos, presupuesto)
+    
+    fig = graficar_animacion(compacto, f"{nombre_algoritmo} - {tipo_datos}")
+    st.plotly_chart(fig, use_container_width=True)
+    
+    cambios = sum(len(indices) for indices, _ in compacto['diferencias'])
+    st.caption(
+        f"{compacto['total_pasos']:,} pasos registrados · "
+        f"{len(compacto['diferencias']) + 1} cuadros · "
+        f"{cambios:,} barras modificadas en total"
+    )
+
+
+def mostrar_analisis_escalabilidad(formato, tipo_elemento, seleccionados):
     """Analiza cómo escalan los algoritmos con diferentes tamaños"""
     st.markdown('<h2 class="sub-header">📈 Análisis de Escalabilidad</h2>', 
                 unsafe_allow_html=True)
@@ -278,22 +693,60 @@ def mostrar_analisis_escalabilidad(usar_bubble, usar_quick, usar_merge):
     
     tamanos = sorted(tamanos)
     
-    # Seleccionar algoritmos
-    algoritmos_analisis = {}
-    if usar_bubble and max(tamanos) <= 3000:  # Limitar Bubble Sort
-        algoritmos_analisis["Bubble Sort"] = bubble_sort
-    elif usar_bubble:
-        st.warning("⚠️ Bubble Sort deshabilitado para tamaños > 3000 (muy lento)")
+    tipos_elemento = st.multiselect(
+        "Tipos de elemento a comparar:",
+        list(TIPOS_ELEMENTO),
+        default=[tipo_elemento],
+        help="Cada algoritmo se mide con cada tipo: muestra cuánto cae su rendimiento cuando comparar es caro"
+    ) or [tipo_elemento]
+    if tipos_elemento != ['Entero']:
+        formato = 'lista'
     
-    if usar_quick:
-        algoritmos_analisis["Quick Sort"] = quick_sort
-    if usar_merge:
-        algoritmos_analisis["Merge Sort"] = merge_sort
+    col1, col2 = st.columns(2)
+    with col1:
+        escala_log = st.checkbox(
+            "Ejes log-log",
+            value=False,
+            help="En escala log-log la pendiente de cada curva aproxima el exponente de n"
+        )
+    with col2:
+        calibrado = st.checkbox(
+            "⏱️ Medición calibrada (lotes)",
+            value=False,
+            help="Cronometra lotes de llamadas y descuenta la sobrecarga del lazo; más preciso para n pequeño"
+        )
+    
+    # Seleccionar algoritmos
+    algoritmos_analisis = seleccionar_algoritmos(
+        seleccionados,
+        tamano_max=max(tamanos),
+        tipo_elemento='Entero' if tipos_elemento == ['Entero'] else 'Otro'
+    )
     
     if not algoritmos_analisis:
         st.warning("⚠️ Selecciona al menos un algoritmo")
         return
     
+    col1, col2 = st.columns(2)
+    with col1:
+        guardar = st.checkbox(
+            "💾 Guardar como barrido reanudable",
+            value=False,
+            disabled=tipos_elemento != ['Entero'],
+            help="Cada medición se guarda en la base de resultados; si se interrumpe, al repetir solo se miden las que faltan (solo enteros)"
+        ) and tipos_elemento == ['Entero']
+    with col2:
+        nombre_barrido = st.text_input(
+            "Nombre del barrido:",
+            value=f"escalabilidad-{formato}",
+            disabled=not guardar
+        )
+    if guardar:
+        st.caption("Los barridos guardados usan datos con semilla fija y medición estándar (sin lotes).")
+    
+    mostrar_modelo_costos(algoritmos_analisis, tamanos)
+    mostrar_autoajuste(tipos_elemento)
+    
     # Ejecutar análisis
     if st.button("🚀 Ejecutar Medición de Escalabilidad", type="primary"):
         resultados_complejidad = {}
@@ -301,52 +754,211 @@ def mostrar_analisis_escalabilidad(usar_bubble, usar_quick, usar_merge):
         progress_bar = st.progress(0)
         status_text = st.empty()
         
-        total_pasos = len(algoritmos_analisis) * len(tamanos)
-        paso_actual = 0
-        
-        for nombre, algoritmo in algoritmos_analisis.items():
-            status_text.text(f"Midiendo {nombre}...")
+        if guardar:
+            def al_avanzar(hechas, total, celda):
+                status_text.text(f"Midiendo {celda[0]} con n = {celda[2]:,}...")
+                progress_bar.progress(hechas / total)
             
-            resultados = analizar_complejidad(
-                algoritmo, 
-                tamanos, 
-                tipo_datos=tipo_analisis
-            )
-            resultados_complejidad[nombre] = resultados
+            try:
+                resumen = ejecutar_barrido(
+                    nombre_barrido,
+                    list(algoritmos_analisis.keys()),
+                    ["Aleatorio"],
+                    tamanos,
+                    formato=formato,
+                    al_avanzar=al_avanzar
+                )
+            except ValueError as error:
+                progress_bar.empty()
+                status_text.empty()
+                st.error(f"❌ {error}")
+                return
+            
+            # Solo la selección actual: el barrido puede tener más algoritmos y tamaños
+            resultados_complejidad = cargar_barrido(nombre_barrido,
+                                                    algoritmos=list(algoritmos_analisis),
+                                                    tamanos=tamanos).get("Aleatorio", {})
+            st.caption(f"Celdas medidas: {resumen['medidas']} · reutilizadas de la base: {resumen['omitidas']}")
+        else:
+            total_pasos = len(algoritmos_analisis) * len(tipos_elemento) * len(tamanos)
+            paso_actual = 0
             
-            for _ in tamanos:
-                paso_actual += 1
-                progress_bar.progress(paso_actual / total_pasos)
+            for nombre, algoritmo in algoritmos_analisis.items():
+                for tipo in tipos_elemento:
+                    # Con varios tipos, cada combinación es una serie propia
+                    serie = nombre if len(tipos_elemento) == 1 else f"{nombre} · {tipo}"
+                    status_text.text(f"Midiendo {serie}...")
+                    
+                    resultados = analizar_complejidad(
+                        algoritmo, 
+                        tamanos, 
+                        tipo_datos=tipo_analisis,
+                        calibrado=calibrado,
+                        formato=formato,
+                        tipo_elemento=tipo
+                    )
+                    resultados_complejidad[serie] = resultados
+                    
+                    for _ in tamanos:
+                        paso_actual += 1
+                        progress_bar.progress(paso_actual / total_pasos)
         
         progress_bar.empty()
         status_text.empty()
         
         st.success("✅ Medición completada!")
         
-        # Gráfico de crecimiento
-        st.subheader("📊 Curva de Crecimiento")
-        fig_crecimiento = graficar_crecimiento_asintotico(resultados_complejidad)
-        st.plotly_chart(fig_crecimiento, use_container_width=True)
+        mostrar_resultados_escalabilidad(resultados_complejidad, escala_log)
+
+
+def mostrar_autoajuste(tipos_elemento):
+    """Calibra el umbral de corte a Insertion Sort de los algoritmos híbridos"""
+    with st.expander("🎚️ Autoajuste de umbrales de los algoritmos híbridos"):
+        st.caption(
+            "Mide cada umbral candidato con los seis tipos de datos y guarda el más rápido por "
+            "algoritmo y tipo de elemento en resultados/umbrales.json."
+        )
+        tamano_ajuste = st.select_slider("Tamaño de cada conjunto:", [500, 1000, 2000, 5000], value=2000)
         
-        st.info("💡 Usa este gráfico en tu informe para mostrar el comportamiento experimental")
+        if st.button("Ajustar umbrales"):
+            with st.spinner("🔄 Probando umbrales..."):
+                ajustes = autoajustar(tipos_elemento=tipos_elemento, tamano=tamano_ajuste)
+            
+            filas = [
+                {'Algoritmo': nombre, 'Tipo de elemento': tipo, 'Umbral': umbral,
+                 'Tiempo total (ms)': round(tiempo * 1000, 3), 'Elegido': umbral == ajuste['mejor']}
+                for nombre, por_tipo in ajustes.items()
+                for tipo, ajuste in por_tipo.items()
+                for umbral, tiempo in ajuste['tiempos'].items()
+            ]
+            st.dataframe(pd.DataFrame(filas), use_container_width=True)
         
-        # Tabla de resultados
-        st.subheader("📋 Tabla de Datos Experimentales")
+        umbrales = cargar_umbrales()
+        if umbrales:
+            st.markdown("**Umbrales guardados:**")
+            st.json(umbrales)
+
+
+def mostrar_modelo_costos(algoritmos, tamanos):
+    """Calibra el costo por operación de cada algoritmo en esta máquina"""
+    with st.expander("⚙️ Modelo de costos: nanosegundos por operación"):
+        st.caption(
+            "Ajusta tiempo ≈ a·comparaciones + b·movimientos + c con datos aleatorios, "
+            "casi ordenados e inversos de los tamaños seleccionados, y guarda el perfil "
+            "de esta máquina en resultados/perfil_costos.json."
+        )
         
-        for nombre, datos in resultados_complejidad.items():
-            with st.expander(f"📊 Datos de {nombre}"):
-                df = pd.DataFrame(datos)
-                df['tiempo_ms'] = df['tiempo'] * 1000
-                df_mostrar = df[['tamano', 'tiempo_ms', 'comparaciones', 'operaciones']].copy()
-                df_mostrar.columns = ['Tamaño (n)', 'Tiempo (ms)', 'Comparaciones', 'Operaciones']
-                st.dataframe(df_mostrar, use_container_width=True)
-                
-                st.markdown("""
-                **Copia esta tabla a tu informe para:**
-                - Mostrar resultados experimentales
-                - Comparar con complejidad teórica
-                - Calcular ratios de crecimiento
-                """)
+        if st.button("Calibrar esta máquina"):
+            with st.spinner("🔄 Midiendo para calibrar..."):
+                perfil = calibrar_maquina(algoritmos, tamanos)
+                equipo = guardar_perfil(perfil)
+            st.success(f"✅ Perfil guardado para el equipo {equipo}")
+        
+        perfiles = cargar_perfiles()
+        if not perfiles:
+            return
+        
+        filas = []
+        for equipo, perfil in perfiles.items():
+            for nombre, modelo in perfil['modelos'].items():
+                filas.append({
+                    'Equipo': equipo,
+                    'CPU': perfil['entorno'].get('modelo_cpu', ''),
+                    'Algoritmo': nombre,
+                    'ns/comparación': round(modelo['ns_comparacion'], 2),
+                    'ns/movimiento': round(modelo['ns_movimiento'], 2),
+                    'Sobrecarga (µs)': round(modelo['sobrecarga_us'], 2),
+                    'ns/operación': round(modelo['ns_por_operacion'], 2),
+                    'R²': round(modelo['r2'], 4)
+                })
+        st.dataframe(pd.DataFrame(filas), use_container_width=True)
+        st.caption("Un ns/operación mayor indica más sobrecarga del intérprete por operación contada.")
+
+
+def mostrar_resultados_escalabilidad(resultados_complejidad, escala_log, clave_descarga='analisis'):
+    """Muestra la curva de crecimiento y las tablas de un análisis de escalabilidad"""
+    # Gráfico de crecimiento
+    st.subheader("📊 Curva de Crecimiento")
+    fig_crecimiento = graficar_crecimiento_asintotico(resultados_complejidad, escala_log=escala_log)
+    st.plotly_chart(fig_crecimiento, use_container_width=True)
+    
+    st.info("💡 Usa este gráfico en tu informe para mostrar el comportamiento experimental")
+    
+    # Tabla de resultados
+    st.subheader("📋 Tabla de Datos Experimentales")
+    
+    for nombre, datos in resultados_complejidad.items():
+        with st.expander(f"📊 Datos de {nombre}"):
+            df = pd.DataFrame(datos)
+            df['tiempo_ms'] = df['tiempo'] * 1000
+            df['elementos_por_segundo'] = (df['tamano'] / df['tiempo']).round()
+            df_mostrar = df[['tamano', 'tiempo_ms', 'comparaciones', 'operaciones', 'elementos_por_segundo']].copy()
+            df_mostrar.columns = ['Tamaño (n)', 'Tiempo (ms)', 'Comparaciones', 'Operaciones', 'Elementos/s']
+            st.dataframe(df_mostrar, use_container_width=True)
+            
+            st.markdown("""
+            **Copia esta tabla a tu informe para:**
+            - Mostrar resultados experimentales
+            - Comparar con complejidad teórica
+            - Calcular ratios de crecimiento
+            """)
+    
+    ofrecer_descarga(construir_tabla(resultados_complejidad), "escalabilidad", f"escalabilidad_{clave_descarga}")
+
+
+def mostrar_resultados_guardados():
+    """Carga y compara barridos guardados sin volver a medir"""
+    st.markdown('<h2 class="sub-header">🗄️ Resultados Guardados</h2>', 
+                unsafe_allow_html=True)
+    
+    barridos = listar_barridos()
+    if not barridos:
+        st.info("Aún no hay barridos guardados. Activa \"Guardar como barrido reanudable\" en el Análisis de Escalabilidad.")
+        return
+    
+    df = pd.DataFrame([
+        {
+            'Barrido': b['nombre'],
+            'Creado': b['creado'],
+            'Celdas': b['celdas'],
+            'Repeticiones': b['repeticiones'],
+            'Semilla': b['semilla'],
+            'Formato': b['formato'],
+            'Python': b['entorno'].get('python', ''),
+            'Equipo': b['entorno'].get('nodo', '')
+        }
+        for b in barridos
+    ])
+    st.dataframe(df, use_container_width=True)
+    
+    seleccion = st.multiselect(
+        "Barridos a comparar:",
+        [b['nombre'] for b in barridos],
+        default=[barridos[-1]['nombre']]
+    )
+    if not seleccion:
+        return
+    
+    cargados = {nombre: cargar_barrido(nombre) for nombre in seleccion}
+    tipos = sorted({tipo for resultados in cargados.values() for tipo in resultados})
+    if not tipos:
+        st.warning("⚠️ Los barridos seleccionados no tienen celdas completas")
+        return
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        tipo = st.selectbox("Tipo de datos:", tipos)
+    with col2:
+        escala_log = st.checkbox("Ejes log-log", value=False, key="log_guardados")
+    
+    # Un barrido conserva los nombres de los algoritmos; varios se prefijan
+    resultados_complejidad = {}
+    for nombre_barrido, resultados in cargados.items():
+        for algoritmo, datos in resultados.get(tipo, {}).items():
+            clave = algoritmo if len(cargados) == 1 else f"{nombre_barrido} · {algoritmo}"
+            resultados_complejidad[clave] = datos
+    
+    mostrar_resultados_escalabilidad(resultados_complejidad, escala_log, clave_descarga='guardados')
 
 
 
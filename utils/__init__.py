@@ -4,15 +4,44 @@ Contiene generadores de datos y funciones auxiliares
 """
 
 from .generadores import (
+    GENERADORES,
     generar_aleatorio,
     generar_ordenado,
     generar_inverso,
     generar_parcialmente_ordenado
 )
+from .buffers import FORMATOS, convertir_formato, copiar_arreglo
+from .tipos_elemento import TIPOS_ELEMENTO, Registro, convertir_elementos, tipo_elemento_de
+from .flujos import TIPOS_FLUJO, generar_bloque, generar_flujo, escribir_flujo, leer_flujo
+from .adversarios import (
+    ADVERSARIOS,
+    generar_antiquicksort,
+    generar_organo,
+    generar_dientes_sierra,
+    generar_peor_caso_merge
+)
 
 __all__ = [
+    'GENERADORES',
     'generar_aleatorio',
     'generar_ordenado',
     'generar_inverso',
-    'generar_parcialmente_ordenado'
+    'generar_parcialmente_ordenado',
+    'FORMATOS',
+    'convertir_formato',
+    'copiar_arreglo',
+    'TIPOS_ELEMENTO',
+    'Registro',
+    'convertir_elementos',
+    'tipo_elemento_de',
+    'TIPOS_FLUJO',
+    'generar_bloque',
+    'generar_flujo',
+    'escribir_flujo',
+    'leer_flujo',
+    'ADVERSARIOS',
+    'generar_antiquicksort',
+    'generar_organo',
+    'generar_dientes_sierra',
+    'generar_peor_caso_merge'
 ]
@@ -0,0 +1,235 @@
+"""
+Módulo de generadores adversarios
+Construye entradas que fuerzan el peor caso de los algoritmos: el
+adversario "antiquicksort" de McIlroy para una regla de pivote dada,
+formas de órgano y dientes de sierra a gran escala, y permutaciones que
+maximizan las comparaciones de Merge Sort
+
+Referencia:
+McIlroy, M. D. (1999). "A Killer Adversary for Quicksort".
+Software: Practice and Experience, 29(4), 341-344.
+"""
+
+import random
+from functools import lru_cache
+import numpy as np
+from typing import Callable, List, Tuple
+
+from .buffers import convertir_formato
+
+# Tamaño máximo recomendado para el adversario de McIlroy: la simulación
+# es Python puro y O(n²) (unos 15 s con n = 10000)
+TAMANO_MAX_ANTIQUICKSORT = 3000
+
+
+class _Adversario:
+    """
+    Estado del adversario de McIlroy: los valores empiezan como "gas"
+    (indefinidos) y se congelan en el orden en que el algoritmo los usa
+    como pivote, de modo que el pivote siempre resulta ser el menor
+    """
+
+    def __init__(self, n: int):
+        self.gas = n
+        self.valores = [self.gas] * n
+        self.congelados = 0
+        self.candidato = None
+        self.comparaciones = 0
+
+    def _congelar(self, indice: int):
+        self.valores[indice] = self.congelados
+        self.congelados += 1
+
+    def comparar(self, x: int, y: int) -> int:
+        """Compara dos elementos decidiendo sus valores sobre la marcha"""
+        self.comparaciones += 1
+        valores = self.valores
+
+        if valores[x] == self.gas and valores[y] == self.gas:
+            if x == self.candidato:
+                self._congelar(x)
+            else:
+                self._congelar(y)
+
+        if valores[x] == self.gas:
+            self.candidato = x
+        elif valores[y] == self.gas:
+            self.candidato = y
+
+        return valores[x] - valores[y]
+
+
+class _ElementoAdversario:
+    """Elemento cuyo orden decide el adversario en cada comparación"""
+
+    __slots__ = ('indice', 'adversario')
+
+    def __init__(self, indice: int, adversario: _Adversario):
+        self.indice = indice
+        self.adversario = adversario
+
+    def __lt__(self, otro):
+        return self.adversario.comparar(self.indice, otro.indice) < 0
+
+    def __le__(self, otro):
+        return self.adversario.comparar(self.indice, otro.indice) <= 0
+
+    def __gt__(self, otro):
+        return self.adversario.comparar(self.indice, otro.indice) > 0
+
+    def __ge__(self, otro):
+        return self.adversario.comparar(self.indice, otro.indice) >= 0
+
+
+def _quick_sort_pivote_ultimo(arr: List):
+    """
+    Quick Sort de Lomuto con el último elemento como pivote (la regla de
+    quick_sort_animacion), iterativo para soportar profundidad O(n)
+    """
+    pila = [(0, len(arr) - 1)]
+
+    while pila:
+        low, high = pila.pop()
+        if low >= high:
+            continue
+
+        pivot = arr[high]
+        i = low - 1
+        for j in range(low, high):
+            if arr[j] <= pivot:
+                i += 1
+                arr[i], arr[j] = arr[j], arr[i]
+        arr[i + 1], arr[high] = arr[high], arr[i + 1]
+
+        # Apilar primero la derecha para procesar la izquierda antes (mismo
+        # orden de comparaciones que la versión recursiva)
+        pila.append((i + 2, high))
+        pila.append((low, i))
+
+
+def generar_antiquicksort(n: int, algoritmo: Callable = None, semilla: int = None,
+                          formato: str = 'lista') -> List[int]:
+    """
+    Genera una entrada que lleva a un Quick Sort a O(n²) comparaciones
+
+    El adversario observa las comparaciones del algoritmo sobre elementos
+    sin valor definido y les asigna valores de modo que cada pivote quede
+    en un extremo. El resultado es una permutación de 0..n-1. La
+    simulación cuesta O(n²) comparaciones en Python, por lo que se guarda
+    en memoria para cada (n, algoritmo, semilla) ya generado.
+
+    Para un algoritmo con pivote aleatorio (quick_sort) la entrada solo es
+    adversaria si el generador aleatorio se reinicia con la misma semilla
+    antes de ordenar: random.seed(semilla); quick_sort(datos).
+
+    Args:
+        n: Tamaño del arreglo
+        algoritmo: Algoritmo a atacar; recibe una lista y solo debe usar
+                   comparaciones entre elementos (por defecto, Quick Sort
+                   con el último elemento como pivote)
+        semilla: Semilla de random fijada antes de ejecutar el algoritmo
+        formato: Representación en memoria ('lista', 'array' o 'numpy')
+
+    Returns:
+        list: Entrada adversaria
+    """
+    return convertir_formato(list(_valores_antiquicksort(n, algoritmo, semilla)), formato)
+
+
+@lru_cache(maxsize=16)
+def _valores_antiquicksort(n: int, algoritmo: Callable, semilla: int) -> Tuple[int, ...]:
+    """
+    Ejecuta la simulación del adversario; se guarda por (n, algoritmo,
+    semilla) porque cuesta O(n²) y la entrada resultante es siempre la misma
+    """
+    adversario = _Adversario(n)
+    elementos = [_ElementoAdversario(i, adversario) for i in range(n)]
+
+    # La semilla fija los pivotes aleatorios de la simulación sin alterar
+    # el estado global de random que ve el resto del programa
+    estado = random.getstate()
+    if semilla is not None:
+        random.seed(semilla)
+    try:
+        (algoritmo or _quick_sort_pivote_ultimo)(elementos)
+    finally:
+        random.setstate(estado)
+
+    # Los elementos nunca usados como pivote toman los valores restantes
+    for i in range(n):
+        if adversario.valores[i] == adversario.gas:
+            adversario._congelar(i)
+
+    return tuple(adversario.valores)
+
+
+def generar_organo(n: int, formato: str = 'lista') -> List[int]:
+    """
+    Genera la forma de tubos de órgano: ascendente hasta la mitad y luego
+    descendente (por ejemplo, 0 1 2 3 3 2 1 0)
+
+    Args:
+        n: Tamaño del arreglo
+        formato: Representación en memoria ('lista', 'array' o 'numpy')
+
+    Returns:
+        list: Arreglo con forma de órgano
+    """
+    indices = np.arange(n, dtype=np.int64)
+    return convertir_formato(np.minimum(indices, n - 1 - indices), formato)
+
+
+def generar_dientes_sierra(n: int, num_dientes: int = None, formato: str = 'lista') -> List[int]:
+    """
+    Genera una secuencia de dientes de sierra: num_dientes corridas
+    ascendentes consecutivas
+
+    Args:
+        n: Tamaño del arreglo
+        num_dientes: Número de corridas (por defecto sqrt(n))
+        formato: Representación en memoria ('lista', 'array' o 'numpy')
+
+    Returns:
+        list: Arreglo en dientes de sierra
+    """
+    if num_dientes is None:
+        num_dientes = max(1, int(np.sqrt(n)))
+
+    periodo = max(1, -(-n // num_dientes))  # techo de n / num_dientes
+    return convertir_formato(np.arange(n, dtype=np.int64) % periodo, formato)
+
+
+def _desmezclar(valores: np.ndarray) -> np.ndarray:
+    """
+    Invierte recursivamente la mezcla: reparte posiciones pares a la mitad
+    izquierda e impares a la derecha, de modo que cada mezcla alterne
+    entre ambas mitades hasta el final
+    """
+    if len(valores) <= 1:
+        return valores
+    # La mitad izquierda tiene techo(n/2) elementos, como en merge_sort
+    return np.concatenate([_desmezclar(valores[0::2]), _desmezclar(valores[1::2])])
+
+
+def generar_peor_caso_merge(n: int, formato: str = 'lista') -> List[int]:
+    """
+    Genera una permutación que maximiza las comparaciones de merge_sort
+    (n⌈lg n⌉ - 2^⌈lg n⌉ + 1)
+
+    Args:
+        n: Tamaño del arreglo
+        formato: Representación en memoria ('lista', 'array' o 'numpy')
+
+    Returns:
+        list: Permutación de peor caso para Merge Sort
+    """
+    return convertir_formato(_desmezclar(np.arange(n, dtype=np.int64)), formato)
+
+
+# Registro de generadores adversarios por nombre de escenario
+ADVERSARIOS = {
+    'Adversario Quick Sort': generar_antiquicksort,
+    'Órgano': generar_organo,
+    'Dientes de Sierra': generar_dientes_sierra,
+    'Peor Caso Merge Sort': generar_peor_caso_merge
+}
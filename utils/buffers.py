@@ -0,0 +1,114 @@
+"""
+Módulo de representaciones de arreglos en memoria
+Permite trabajar con listas de Python, array.array('q') o arreglos NumPy
+de enteros de 64 bits en todo el flujo (generación, medición y ordenamiento)
+
+Una lista de Python guarda un puntero y un objeto int por elemento
+(~36 bytes); array('q') y NumPy int64 guardan 8 bytes contiguos.
+"""
+
+from array import array
+import numpy as np
+
+FORMATOS = ('lista', 'array', 'numpy')
+
+
+def convertir_formato(datos, formato: str = 'lista'):
+    """
+    Convierte un arreglo de enteros a la representación indicada
+
+    Args:
+        datos: Arreglo de entrada (lista, array.array o ndarray)
+        formato: 'lista', 'array' (array.array('q')) o 'numpy' (ndarray int64)
+
+    Returns:
+        Arreglo en la representación pedida
+    """
+    if formato == 'lista':
+        if isinstance(datos, np.ndarray):
+            return datos.tolist()
+        return datos if isinstance(datos, list) else list(datos)
+
+    if formato == 'array':
+        if isinstance(datos, array) and datos.typecode == 'q':
+            return datos
+        buffer = array('q')
+        buffer.frombytes(memoryview(np.ascontiguousarray(datos, dtype=np.int64)).cast('B'))
+        return buffer
+
+    if formato == 'numpy':
+        return np.ascontiguousarray(datos, dtype=np.int64)
+
+    raise ValueError(f"Formato desconocido: {formato}. Opciones: {', '.join(FORMATOS)}")
+
+
+def formato_de(arr) -> str:
+    """
+    Identifica la representación de un arreglo
+
+    Args:
+        arr: Arreglo (lista, array.array o ndarray)
+
+    Returns:
+        str: 'lista', 'array' o 'numpy'
+    """
+    if isinstance(arr, np.ndarray):
+        return 'numpy'
+    if isinstance(arr, array):
+        return 'array'
+    return 'lista'
+
+
+def copiar_arreglo(arr):
+    """
+    Copia un arreglo conservando su representación
+
+    Para array.array y ndarray la copia es un memcpy del buffer.
+
+    Args:
+        arr: Arreglo a copiar
+
+    Returns:
+        Copia independiente del arreglo
+    """
+    if isinstance(arr, array):
+        return arr[:]
+    return arr.copy()
+
+
+def restaurar_arreglo(destino, origen):
+    """
+    Sobrescribe un arreglo con el contenido de otro del mismo largo y
+    representación, sin reservar memoria nueva
+
+    Para array.array y ndarray es un memcpy; para listas, una copia de
+    punteros por asignación de rebanada.
+
+    Args:
+        destino: Arreglo de trabajo que se sobrescribe
+        origen: Arreglo con el contenido a restaurar
+    """
+    if isinstance(destino, np.ndarray):
+        np.copyto(destino, origen)
+    else:
+        destino[:] = origen
+
+
+def vista_indexable(arr):
+    """
+    Retorna una vista del arreglo con indexación tipada rápida
+
+    Indexar un ndarray elemento a elemento crea escalares NumPy (lento);
+    un memoryview sobre su buffer retorna y asigna int de Python
+    directamente sobre la misma memoria. Las listas y array.array se
+    retornan sin cambios.
+
+    Args:
+        arr: Arreglo a ordenar
+
+    Returns:
+        El mismo arreglo o un memoryview sobre su buffer
+    """
+    if isinstance(arr, np.ndarray):
+        return memoryview(arr)
+    return arr
@@ -0,0 +1,158 @@
+"""
+Módulo de generadores por flujo (streaming)
+Genera entradas enormes como una secuencia de bloques NumPy de tamaño
+fijo, sin materializar nunca el arreglo completo
+
+Cada bloque depende solo de (semilla, tipo, índice de bloque), por lo
+que puede regenerarse individualmente y en cualquier orden: el
+ordenamiento externo, la escritura a disco y los procesos paralelos
+pueden consumir exactamente la misma entrada.
+"""
+
+import zlib
+import numpy as np
+from typing import Iterator
+
+# Elementos por bloque por defecto (8 MiB con enteros de 64 bits)
+TAMANO_BLOQUE = 1 << 20
+
+TIPOS_FLUJO = (
+    'Aleatorio',
+    'Ordenado',
+    'Inverso',
+    'Casi Ordenado',
+    'Con Duplicados',
+    'Parcialmente Ordenado'
+)
+
+
+def _generador_bloque(semilla: int, tipo: str, indice_bloque: int) -> np.random.Generator:
+    """Generador aleatorio independiente para un bloque"""
+    return np.random.default_rng([semilla, zlib.crc32(tipo.encode()), indice_bloque])
+
+
+def num_bloques(n: int, tamano_bloque: int = TAMANO_BLOQUE) -> int:
+    """Número de bloques en que se divide una entrada de tamaño n"""
+    return -(-n // tamano_bloque)
+
+
+def generar_bloque(tipo: str, n: int, indice_bloque: int,
+                   tamano_bloque: int = TAMANO_BLOQUE, semilla: int = 0,
+                   min_val: int = 0, max_val: int = 1000) -> np.ndarray:
+    """
+    Genera un bloque de la entrada de forma determinista
+
+    Args:
+        tipo: Tipo de datos (uno de TIPOS_FLUJO)
+        n: Tamaño total de la entrada
+        indice_bloque: Índice del bloque (0 .. num_bloques - 1)
+        tamano_bloque: Elementos por bloque (el último puede ser menor)
+        semilla: Semilla del flujo
+        min_val: Valor mínimo de la entrada
+        max_val: Valor máximo de la entrada
+
+    Returns:
+        ndarray: Bloque de enteros de 64 bits
+    """
+    inicio = indice_bloque * tamano_bloque
+    fin = min(n, inicio + tamano_bloque)
+    if inicio >= fin:
+        raise IndexError(f"El bloque {indice_bloque} está fuera de la entrada (n = {n})")
+
+    largo = fin - inicio
+    rng = _generador_bloque(semilla, tipo, indice_bloque)
+    indices = np.arange(inicio, fin, dtype=np.int64)
+
+    if tipo == 'Aleatorio':
+        return rng.integers(min_val, max_val + 1, size=largo, dtype=np.int64)
+
+    # Valor definido por la posición global: no decreciente en todo el flujo
+    # y dentro de [min_val, max_val]; base de los tipos ordenados
+    valores = min_val + (indices * (max_val - min_val + 1)) // n
+
+    if tipo in ('Ordenado', 'Inverso'):
+        return valores if tipo == 'Ordenado' else (max_val + min_val) - valores
+
+    if tipo == 'Casi Ordenado':
+        # Unos sqrt(n) intercambios en total, repartidos dentro de cada bloque
+        num_swaps = max(1, int(np.sqrt(n) * largo / n))
+        i = rng.integers(0, largo, size=num_swaps)
+        j = rng.integers(0, largo, size=num_swaps)
+        for a, b in zip(i, j):
+            valores[a], valores[b] = valores[b], valores[a]
+        return valores
+
+    if tipo == 'Con Duplicados':
+        # El conjunto de valores únicos es común a todos los bloques
+        num_valores_unicos = max(1, min(n // 10, max_val - min_val + 1))
+        valores = np.random.default_rng([semilla, zlib.crc32(tipo.encode())]).integers(
+            min_val, max_val + 1, size=num_valores_unicos, dtype=np.int64
+        )
+        return valores[rng.integers(0, num_valores_unicos, size=largo)]
+
+    if tipo == 'Parcialmente Ordenado':
+        # Permutar entre sí el 30% de las posiciones del bloque
+        posiciones = rng.choice(largo, size=int(largo * 0.3), replace=False)
+        valores[posiciones] = valores[rng.permutation(posiciones)]
+        return valores
+
+    raise ValueError(f"Tipo de flujo desconocido: {tipo}. Opciones: {', '.join(TIPOS_FLUJO)}")
+
+
+def generar_flujo(tipo: str, n: int, tamano_bloque: int = TAMANO_BLOQUE,
+                  semilla: int = 0, **kwargs) -> Iterator[np.ndarray]:
+    """
+    Recorre la entrada completa bloque a bloque
+
+    Args:
+        tipo: Tipo de datos (uno de TIPOS_FLUJO)
+        n: Tamaño total de la entrada
+        tamano_bloque: Elementos por bloque
+        semilla: Semilla del flujo
+        **kwargs: min_val y max_val (ver generar_bloque)
+
+    Yields:
+        ndarray: Bloques consecutivos
+    """
+    for indice in range(num_bloques(n, tamano_bloque)):
+        yield generar_bloque(tipo, n, indice, tamano_bloque, semilla, **kwargs)
+
+
+def escribir_flujo(ruta: str, flujo: Iterator[np.ndarray]) -> int:
+    """
+    Escribe un flujo de bloques en un archivo binario de enteros de 64 bits
+    (el formato que lee merge_sort_externo)
+
+    Args:
+        ruta: Archivo de salida
+        flujo: Iterador de bloques
+
+    Returns:
+        int: Bytes escritos
+    """
+    escritos = 0
+    with open(ruta, 'wb') as archivo:
+        for bloque in flujo:
+            bloque = np.ascontiguousarray(bloque, dtype=np.int64)
+            bloque.tofile(archivo)
+            escritos += bloque.nbytes
+    return escritos
+
+
+def leer_flujo(ruta: str, tamano_bloque: int = TAMANO_BLOQUE) -> Iterator[np.ndarray]:
+    """
+    Lee un archivo binario de enteros de 64 bits bloque a bloque
+
+    Args:
+        ruta: Archivo de entrada
+        tamano_bloque: Elementos por bloque
+
+    Yields:
+        ndarray: Bloques consecutivos
+    """
+    with open(ruta, 'rb') as archivo:
+        while True:
+            bloque = np.fromfile(archivo, dtype=np.int64, count=tamano_bloque)
+            if bloque.size == 0:
+                return
+            yield bloque
@@ -7,8 +7,34 @@ import random
 import numpy as np
 from typing import List
 
+from .buffers import convertir_formato
 
-def generar_aleatorio(n: int, min_val: int = 0, max_val: int = 1000) -> List[int]:
+
+def _aleatorios(semilla: int = None):
+    """
+    Generadores de números aleatorios a usar
+
+    Con semilla se crean generadores locales (random.Random y
+    np.random.default_rng), que no alteran el estado global del que
+    dependen los pivotes aleatorios de las mediciones posteriores.
+
+    Returns:
+        tuple: (generador de Python, generador de NumPy)
+    """
+    if semilla is None:
+        return random, np.random
+    return random.Random(semilla), np.random.default_rng(semilla)
+
+
+def _enteros(generador_np, minimo: int, maximo: int, n: int) -> np.ndarray:
+    """n enteros int64 uniformes en [minimo, maximo) con el generador dado"""
+    if isinstance(generador_np, np.random.Generator):
+        return generador_np.integers(minimo, maximo, size=n, dtype=np.int64)
+    return generador_np.randint(minimo, maximo, size=n, dtype=np.int64)
+
+
+def generar_aleatorio(n: int, min_val: int = 0, max_val: int = 1000,
+                      formato: str = 'lista', semilla: int = None) -> List[int]:
     """
     Genera un arreglo con valores aleatorios
     
@@ -16,14 +42,23 @@ def generar_aleatorio(n: int, min_val: int = 0, max_val: int = 1000) -> List[int
         n: Tamaño del arreglo
         min_val: Valor mínimo
         max_val: Valor máximo
+        formato: Representación en memoria ('lista', 'array' o 'numpy')
+        semilla: Semilla de generadores locales (None usa el estado global)
         
     Returns:
         list: Arreglo con valores aleatorios
     """
-    return [random.randint(min_val, max_val) for _ in range(n)]
+    aleatorio, aleatorio_np = _aleatorios(semilla)
+    
+    if formato != 'lista':
+        valores = _enteros(aleatorio_np, min_val, max_val + 1, n)
+        return convertir_formato(valores, formato)
+    
+    return [aleatorio.randint(min_val, max_val) for _ in range(n)]
 
 
-def generar_ordenado(n: int, min_val: int = 0, max_val: int = 1000) -> List[int]:
+def generar_ordenado(n: int, min_val: int = 0, max_val: int = 1000,
+                     formato: str = 'lista', semilla: int = None) -> List[int]:
     """
     Genera un arreglo ordenado ascendentemente
     
@@ -31,15 +66,25 @@ def generar_ordenado(n: int, min_val: int = 0, max_val: int = 1000) -> List[int]
         n: Tamaño del arreglo
         min_val: Valor mínimo
         max_val: Valor máximo
+        formato: Representación en memoria ('lista', 'array' o 'numpy')
+        semilla: Semilla de generadores locales (None usa el estado global)
         
     Returns:
         list: Arreglo ordenado
     """
+    aleatorio, aleatorio_np = _aleatorios(semilla)
+    
+    if formato != 'lista':
+        valores = _enteros(aleatorio_np, min_val, max_val + 1, n)
+        valores.sort()
+        return convertir_formato(valores, formato)
+    
     # Generar números espaciados uniformemente
-    return sorted([random.randint(min_val, max_val) for _ in range(n)])
+    return sorted([aleatorio.randint(min_val, max_val) for _ in range(n)])
 
 
-def generar_inverso(n: int, min_val: int = 0, max_val: int = 1000) -> List[int]:
+def generar_inverso(n: int, min_val: int = 0, max_val: int = 1000,
+                    formato: str = 'lista', semilla: int = None) -> List[int]:
     """
     Genera un arreglo ordenado descendentemente (peor caso para algunos algoritmos)
     
@@ -47,45 +92,69 @@ def generar_inverso(n: int, min_val: int = 0, max_val: int = 1000) -> List[int]:
         n: Tamaño del arreglo
         min_val: Valor mínimo
         max_val: Valor máximo
+        formato: Representación en memoria ('lista', 'array' o 'numpy')
+        semilla: Semilla de generadores locales (None usa el estado global)
         
     Returns:
         list: Arreglo ordenado inversamente
     """
+    aleatorio, aleatorio_np = _aleatorios(semilla)
+    
+    if formato != 'lista':
+        valores = _enteros(aleatorio_np, min_val, max_val + 1, n)
+        valores.sort()
+        return convertir_formato(valores[::-1], formato)
+    
     # Generar números espaciados uniformemente en orden inverso
-    return sorted([random.randint(min_val, max_val) for _ in range(n)], reverse=True)
+    return sorted([aleatorio.randint(min_val, max_val) for _ in range(n)], reverse=True)
 
 
-def generar_parcialmente_ordenado(n: int, porcentaje_ordenado: float = 0.7) -> List[int]:
+def generar_parcialmente_ordenado(n: int, porcentaje_ordenado: float = 0.7,
+                                  formato: str = 'lista', semilla: int = None) -> List[int]:
     """
     Genera un arreglo parcialmente ordenado
     
     Args:
         n: Tamaño del arreglo
         porcentaje_ordenado: Porcentaje del arreglo que estará ordenado
+        formato: Representación en memoria ('lista', 'array' o 'numpy')
+        semilla: Semilla de generadores locales (None usa el estado global)
         
     Returns:
         list: Arreglo parcialmente ordenado
     """
-    arr = list(range(n))
-    
     # Calcular cuántos elementos desordenar
     num_desordenar = int(n * (1 - porcentaje_ordenado))
+    aleatorio, aleatorio_np = _aleatorios(semilla)
+    
+    if formato != 'lista':
+        # Versión vectorizada: permutar entre sí las posiciones elegidas
+        # (distintas: con repetidas la asignación perdería elementos)
+        arr = np.arange(n, dtype=np.int64)
+        posiciones = aleatorio_np.choice(n, size=min(num_desordenar, n), replace=False)
+        arr[posiciones] = arr[aleatorio_np.permutation(posiciones)]
+        return convertir_formato(arr, formato)
+    
+    arr = list(range(n))
     
     # Desordenar aleatoriamente algunos elementos
     for _ in range(num_desordenar):
-        i, j = random.randint(0, n-1), random.randint(0, n-1)
+        i, j = aleatorio.randint(0, n-1), aleatorio.randint(0, n-1)
         arr[i], arr[j] = arr[j], arr[i]
     
     return arr
 
 
-def generar_duplicados(n: int, num_valores_unicos: int = None) -> List[int]:
+def generar_duplicados(n: int, num_valores_unicos: int = None,
+                       formato: str = 'lista', semilla: int = None) -> List[int]:
     """
     Genera un arreglo con muchos valores duplicados
     
     Args:
         n: Tamaño del arreglo
         num_valores_unicos: Número de valores únicos (por defecto n/10)
+        formato: Representación en memoria ('lista', 'array' o 'numpy')
+        semilla: Semilla de generadores locales (None usa el estado global)
         
     Returns:
         list: Arreglo con duplicados
@@ -93,17 +162,26 @@ def generar_duplicados(n: int, num_valores_unicos: int = None) -> List[int]:
     if num_valores_unicos is None:
         num_valores_unicos = max(1, n // 10)
     
-    valores = [random.randint(0, 1000) for _ in range(num_valores_unicos)]
-    return [random.choice(valores) for _ in range(n)]
+    aleatorio, aleatorio_np = _aleatorios(semilla)
+    
+    if formato != 'lista':
+        valores = _enteros(aleatorio_np, 0, 1001, num_valores_unicos)
+        return convertir_formato(aleatorio_np.choice(valores, size=n), formato)
+    
+    valores = [aleatorio.randint(0, 1000) for _ in range(num_valores_unicos)]
+    return [aleatorio.choice(valores) for _ in range(n)]
 
 
-def generar_casi_ordenado(n: int, num_swaps: int = None) -> List[int]:
+def generar_casi_ordenado(n: int, num_swaps: int = None,
+                          formato: str = 'lista', semilla: int = None) -> List[int]:
     """
     Genera un arreglo casi ordenado con pocos elementos fuera de lugar
     
     Args:
         n: Tamaño del arreglo
         num_swaps: Número de intercambios aleatorios (por defecto sqrt(n))
+        formato: Representación en memoria ('lista', 'array' o 'numpy')
+        semilla: Semilla de generadores locales (None usa el estado global)
         
     Returns:
         list: Arreglo casi ordenado
@@ -111,27 +189,42 @@ def generar_casi_ordenado(n: int, num_swaps: int = None) -> List[int]:
     if num_swaps is None:
         num_swaps = max(1, int(np.sqrt(n)))
     
-    arr = list(range(n))
+    arr = list(range(n)) if formato == 'lista' else np.arange(n, dtype=np.int64)
+    aleatorio, _ = _aleatorios(semilla)
     
     # Realizar pocos intercambios aleatorios
     for _ in range(num_swaps):
-        i, j = random.randint(0, n-1), random.randint(0, n-1)
+        i, j = aleatorio.randint(0, n-1), aleatorio.randint(0, n-1)
         arr[i], arr[j] = arr[j], arr[i]
     
-    return arr
+    return convertir_formato(arr, formato)
 
 
-def generar_con_patron(n: int, patron: str = 'ascendente-descendente') -> List[int]:
+def generar_con_patron(n: int, patron: str = 'ascendente-descendente',
+                       formato: str = 'lista') -> List[int]:
     """
     Genera arreglos con patrones específicos
     
     Args:
         n: Tamaño del arreglo
         patron: Tipo de patrón ('ascendente-descendente', 'dientes-sierra', 'v-shape')
+        formato: Representación en memoria ('lista', 'array' o 'numpy')
         
     Returns:
         list: Arreglo con el patrón especificado
     """
+    if formato != 'lista':
+        mitad = n // 2
+        if patron == 'ascendente-descendente':
+            arr = np.concatenate([np.arange(mitad), np.arange(mitad, 0, -1)])
+        elif patron == 'dientes-sierra':
+            arr = np.arange(n) % 10
+        elif patron == 'v-shape':
+            arr = np.concatenate([np.arange(mitad, 0, -1), np.arange(mitad)])
+        else:
+            return generar_aleatorio(n, formato=formato)
+        return convertir_formato(arr, formato)
+    
     if patron == 'ascendente-descendente':
         # Primera mitad ascendente, segunda mitad descendente
         mitad = n // 2
@@ -153,21 +246,29 @@ def generar_con_patron(n: int, patron: str = 'ascendente-descendente') -> List[i
         return generar_aleatorio(n)
 
 
-def generar_dataset_completo(tamano: int) -> dict:
+# Registro de generadores por nombre de escenario
+GENERADORES = {
+    'Aleatorio': generar_aleatorio,
+    'Ordenado': generar_ordenado,
+    'Inverso': generar_inverso,
+    'Casi Ordenado': generar_casi_ordenado,
+    'Con Duplicados': generar_duplicados,
+    'Parcialmente Ordenado': generar_parcialmente_ordenado
+}
+
+
+def generar_dataset_completo(tamano: int, formato: str = 'lista') -> dict:
     """
     Genera un conjunto completo de datasets para pruebas exhaustivas
     
     Args:
         tamano: Tamaño de cada arreglo
+        formato: Representación en memoria ('lista', 'array' o 'numpy')
         
     Returns:
         dict: Diccionario con diferentes tipos de arreglos
     """
     return {
-        'Aleatorio': generar_aleatorio(tamano),
-        'Ordenado': generar_ordenado(tamano),
-        'Inverso': generar_inverso(tamano),
-        'Casi Ordenado': generar_casi_ordenado(tamano),
-        'Con Duplicados': generar_duplicados(tamano),
-        'Parcialmente Ordenado': generar_parcialmente_ordenado(tamano)
+        nombre: generador(tamano, formato=formato)
+        for nombre, generador in GENERADORES.items()
     }
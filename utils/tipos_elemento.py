@@ -0,0 +1,144 @@
+"""
+Módulo de tipos de elemento
+Convierte arreglos de enteros en flotantes, cadenas, tuplas o registros
+conservando exactamente su forma: cada valor distinto se reemplaza por
+una clave del nuevo tipo en el mismo orden, de modo que un arreglo
+ordenado, inverso o con duplicados lo sigue siendo (y sus métricas de
+desorden no cambian). Así el tipo de elemento es una dimensión
+independiente del tipo de datos, y solo cambia el costo de comparar.
+"""
+
+import numpy as np
+from typing import List
+
+# Alfabeto de las cadenas generadas
+_ALFABETO = np.frombuffer(b'abcdefghijklmnopqrstuvwxyz', dtype=np.uint8)
+
+
+class Registro(dict):
+    """
+    Registro tipo diccionario que se ordena por sus campos clave
+    ('grupo' y luego 'nombre'), como una fila ordenada por varias columnas
+    """
+
+    __slots__ = ()
+
+    def _clave(self):
+        return self['grupo'], self['nombre']
+
+    def __lt__(self, otro):
+        return self._clave() < otro._clave()
+
+    def __le__(self, otro):
+        return self._clave() <= otro._clave()
+
+    def __gt__(self, otro):
+        return self._clave() > otro._clave()
+
+    def __ge__(self, otro):
+        return self._clave() >= otro._clave()
+
+
+def _claves_flotantes(k: int, rng: np.random.Generator) -> List[float]:
+    """k flotantes estrictamente crecientes con separaciones aleatorias"""
+    return np.cumsum(rng.uniform(0.001, 1.0, size=k)).tolist()
+
+
+def _claves_cadena(k: int, rng: np.random.Generator, longitud: int, prefijo_comun: int) -> List[str]:
+    """
+    k cadenas distintas y crecientes de la longitud pedida; las primeras
+    prefijo_comun letras son iguales en todas (comparaciones más largas)
+    """
+    libres = max(1, longitud - prefijo_comun)
+    prefijo = 'x' * min(prefijo_comun, longitud)
+
+    # Cadenas aleatorias; si hay colisiones (longitudes cortas) se usa el
+    # rango en base 26, que siempre es distinto y creciente
+    letras = _ALFABETO[rng.integers(0, 26, size=(k, libres))]
+    cadenas = np.unique(letras.view(f'S{libres}').ravel())
+    if len(cadenas) < k:
+        digitos = np.zeros((k, libres), dtype=np.uint8)
+        rangos = np.arange(k)
+        for posicion in range(libres - 1, -1, -1):
+            digitos[:, posicion] = rangos % 26
+            rangos //= 26
+        cadenas = _ALFABETO[digitos].view(f'S{libres}').ravel()
+
+    return [prefijo + c.decode() for c in cadenas[:k]]
+
+
+def convertir_elementos(enteros, tipo_elemento: str, longitud_cadena: int = 16,
+                        prefijo_comun: int = 0, semilla: int = 0) -> List:
+    """
+    Convierte un arreglo de enteros a otro tipo de elemento conservando el orden
+
+    Args:
+        enteros (list | array | ndarray): Arreglo de enteros
+        tipo_elemento: Uno de TIPOS_ELEMENTO
+        longitud_cadena: Longitud de las cadenas (tipos 'Cadena' y 'Registro')
+        prefijo_comun: Letras iniciales comunes a todas las cadenas
+        semilla: Semilla de las claves generadas
+
+    Returns:
+        list: Arreglo del nuevo tipo (siempre una lista de Python)
+    """
+    if tipo_elemento not in TIPOS_ELEMENTO:
+        raise ValueError(f"Tipo de elemento desconocido: {tipo_elemento}. "
+                         f"Opciones: {', '.join(TIPOS_ELEMENTO)}")
+
+    if tipo_elemento == 'Entero':
+        return [int(x) for x in enteros]
+
+    # Rango denso de cada valor: iguales -> misma clave, orden preservado
+    unicos, rangos = np.unique(np.asarray(enteros), return_inverse=True)
+    rangos = rangos.ravel()
+    k = len(unicos)
+    rng = np.random.default_rng(semilla)
+
+    if tipo_elemento == 'Flotante':
+        claves = _claves_flotantes(k, rng)
+    elif tipo_elemento == 'Cadena':
+        claves = _claves_cadena(k, rng, longitud_cadena, prefijo_comun)
+    elif tipo_elemento == 'Tupla':
+        # Primer campo con muchos empates: la comparación suele llegar al segundo
+        claves = [(r // 8, r % 8) for r in range(k)]
+    else:
+        nombres = _claves_cadena(k, rng, longitud_cadena, prefijo_comun)
+        valores = rng.uniform(0, 1000, size=k).tolist()
+        claves = [
+            {'grupo': r // 16, 'nombre': nombres[r], 'id': r, 'valor': valores[r]}
+            for r in range(k)
+        ]
+        # Un registro nuevo por elemento (los duplicados son iguales, no el mismo objeto)
+        return [Registro(claves[r]) for r in rangos.tolist()]
+
+    return [claves[r] for r in rangos.tolist()]
+
+
+def tipo_elemento_de(arr) -> str:
+    """
+    Identifica el tipo de elemento de un arreglo por su primer elemento
+
+    Args:
+        arr (list | array | ndarray): Arreglo
+
+    Returns:
+        str: Uno de TIPOS_ELEMENTO ('Entero' si el arreglo está vacío)
+    """
+    if len(arr) == 0:
+        return 'Entero'
+
+    primero = arr[0]
+    if isinstance(primero, Registro):
+        return 'Registro'
+    if isinstance(primero, tuple):
+        return 'Tupla'
+    if isinstance(primero, str):
+        return 'Cadena'
+    if isinstance(primero, (float, np.floating)):
+        return 'Flotante'
+    return 'Entero'
+
+
+# Tipos de elemento disponibles, del más barato al más caro de comparar
+TIPOS_ELEMENTO = ('Entero', 'Flotante', 'Cadena', 'Tupla', 'Registro')